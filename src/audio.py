@@ -1,19 +1,22 @@
 """
-    © Jürgen Schoenemeyer, 25.03.2025 17:09
+    © Jürgen Schoenemeyer, 18.10.2026 21:15
 
     src/audio.py
 
     .venv/Scripts/activate
     python src/audio.py
+
+    all projects -> one AudioConverter (helper/convert.py): parallel ffmpeg (base.yaml -> ffmpeg.workers),
+    unchanged source + same parameters -> skip (04_settings/conversions.json)
+
+    MODE: "wav", "mp3", "flac", "filter" (arnndn -> wav), "split" (copy audio track -> m4a)
+    -> 03_audio/<MODE>, filter: 03_audio/wav_filter
 """
 from __future__ import annotations
 
 import sys
-import time
 
-from pathlib import Path
-
-from utils.audio import convert_to_wav  # , filter_to_wav
+from helper.convert import AudioConverter, get_convert_workers
 from utils.globals import BASE_PATH
 from utils.prefs import Prefs
 from utils.trace import Trace
@@ -21,10 +24,12 @@
 SOURCE_TYPE  = ".mp4"
 SAMPLING     = 16000
 CHANNELS     = 1
+MODE         = "wav"
 
 # SOURCE_TYPE  = ".wav"
 # SAMPLING     = 48000
 # CHANNELS     = 2
+# MODE         = "filter"
 
 PROJECTS: str = "projects.yaml"  # "projects.yaml", "projects_all.yaml"
 
@@ -36,6 +41,9 @@ def main() -> None:
     Prefs.load(PROJECTS)
 
     media_type = Prefs.get("mediaType")
+    ffmpeg     = Prefs.get("ffmpeg")
+
+    converter = AudioConverter(str(BASE_PATH / ffmpeg["path"]), get_convert_workers())
 
     for project in Prefs.get("projects"):
         if SOURCE_TYPE == ".mp4":
@@ -43,16 +51,16 @@ def main() -> None:
         else:
             source = data_path / project / "03_audio" / media_type
 
-        dest = data_path / project / "03_audio"
+        dest = data_path / project / "03_audio" / ("wav_filter" if MODE == "filter" else MODE)
 
-        starttime = time.time()
-        for filepath in source.iterdir():
-            if Path(filepath).suffix == SOURCE_TYPE:
-                if media_type == "wav":
-                    convert_to_wav( source, Path(dest, "wav"), filepath.name, SAMPLING, CHANNELS, Prefs.get("ffmpeg")["path"] )
+        for filepath in sorted(source.iterdir()):
+            if filepath.suffix == SOURCE_TYPE:
+                converter.add(
+                    data_path / project / "04_settings", filepath, dest, MODE, SAMPLING, CHANNELS,
+                    str(BASE_PATH / ffmpeg["filter_path"]), ffmpeg["filter_name"],
+                )
 
-        duration = time.time() - starttime
-        Trace.info(f"{project} converted: {duration:.2f} sec" )
+    converter.run()
 
 if __name__ == "__main__":
     Trace.set( debug_mode=True, timezone=False )
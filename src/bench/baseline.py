@@ -0,0 +1,80 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 17:10
+
+    src/bench/baseline.py
+
+    PUBLIC:
+     - save_results(path: Path, name: str, results: Dict, repeat: int) -> None
+     - load_results(path: Path, name: str) -> None | Dict
+     - compare_results(baseline: Dict, current: Dict, threshold: float) -> List[Dict]
+
+    <path>/baselines/<name>.json
+     - header: created, python, platform, cpu count, repeat
+     - cases: {"<size>/<case>": {"min", "median", "audio", "xRealtime"}}
+
+    compare: min (most stable value), regression if current > baseline * (1 + threshold)
+"""
+from __future__ import annotations
+
+import os
+import platform
+import sys
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import arrow
+
+from utils.file import export_json, import_json
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BASELINE_VERSION: int = 1
+
+def save_results(path: Path, name: str, results: Dict[str, Dict[str, Any]], repeat: int) -> None:
+    data = {
+        "version":  BASELINE_VERSION,
+        "created":  arrow.utcnow().to("Europe/Berlin").format(),
+        "python":   sys.version,
+        "platform": platform.platform(),
+        "cpu":      os.cpu_count(),
+        "repeat":   repeat,
+        "cases":    results,
+    }
+    export_json(path / "baselines", name + ".json", data)
+
+def load_results(path: Path, name: str) -> None | Dict[str, Any]:
+    data = import_json(path / "baselines", name + ".json")
+    if data is None:
+        return None
+
+    if data.get("version") != BASELINE_VERSION:
+        Trace.error(f"baseline '{name}': unknown version {data.get('version')}")
+        return None
+
+    return data
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    if baseline["platform"] != current["platform"] or baseline["cpu"] != current["cpu"]:
+        Trace.warning(f"different machine: '{baseline['platform']}' ({baseline['cpu']} cpu) -> '{current['platform']}' ({current['cpu']} cpu)")
+
+    regressions: List[Dict[str, Any]] = []
+    for key, base in baseline["cases"].items():
+        curr = current["cases"].get(key)
+        if curr is None:
+            Trace.warning(f"{key:<36} missing in the current run")
+            continue
+
+        ratio = curr["min"] / base["min"] if base["min"] > 0 else 1.0
+        text = f"{key:<36} {base['min']:9.3f} -> {curr['min']:9.3f} sec ({ratio - 1:+7.1%})"
+
+        if ratio > 1 + threshold:
+            Trace.error(f"{text} slower")
+            regressions.append({"case": key, "baseline": base["min"], "current": curr["min"], "ratio": round(ratio, 3)})
+        elif ratio < 1 - threshold:
+            Trace.result(f"{text} faster")
+        else:
+            Trace.info(text)
+
+    return regressions
@@ -0,0 +1,183 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 19:30
+
+    src/bench/cases.py
+
+    PUBLIC:
+     - CASES: List[str]
+     - run_cases(path: Path, sizes: List[str], cases: List[str], repeat: int, dictionary: Dict) -> Dict[str, Dict]
+
+    PRIVATE:
+     - _measure(function: Callable, repeat: int) -> Tuple[float, float]
+     - _features_stft(feature_extractor: FeatureExtractor, audio: np.ndarray) -> np.ndarray
+
+    per size (fixtures.py) and case: min + median of 'repeat' runs, xRealtime (audio duration / min)
+
+     - audio:      decode_wav, decode_mp3, vad, features_80, features_128,
+                   features_stft (reference: general stft port, complete file at once -> speed-up of the rfft blocks)
+     - transcript: prepare_words (spaCy without cache), split_to_lines, spellcheck, split_to_sentences,
+                   export_srt, export_vtt, export_txt, export_xlsx
+     - recorded transcripts (transcripts/recorded/*.json): same cases as the synthetic transcripts
+
+    faster_whisper (-> CTranslate2) is imported only for the audio cases
+"""
+from __future__ import annotations
+
+import statistics
+import tempfile
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from helper.captions import export_srt, export_vtt
+from helper.excel_write import export_text_to_speech_excel
+from helper.spelling import spellcheck
+from helper.whisper_util import prepare_words, split_to_lines, split_to_sentences
+from primary.spacy import get_modelname_spacy
+from primary.whisper_faster import get_vad_engine, get_vad_parameter
+from utils.file import export_text, import_json
+from utils.trace import Trace
+from utils.util import CacheJSON
+
+if TYPE_CHECKING:
+    from faster_whisper.feature_extractor import FeatureExtractor
+
+CASES_AUDIO: List[str] = ["decode_wav", "decode_mp3", "vad", "features_80", "features_128", "features_stft"]
+
+CASES_TRANSCRIPT: List[str] = [
+    "prepare_words", "split_to_lines", "spellcheck", "split_to_sentences",
+    "export_srt", "export_vtt", "export_txt", "export_xlsx",
+]
+
+CASES: List[str] = CASES_AUDIO + CASES_TRANSCRIPT
+
+def _measure(function: Callable[[], Any], repeat: int) -> Tuple[float, float]:
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times), statistics.median(times)
+
+def _features_stft(feature_extractor: FeatureExtractor, audio: np.ndarray) -> np.ndarray: # log-mel before the rfft blocks
+    waveform = np.pad(audio, (0, 160))
+    stft = feature_extractor.stft(waveform, feature_extractor.n_fft, feature_extractor.hop_length, window=feature_extractor.window, return_complex=True).astype("complex64")
+    magnitudes = np.abs(stft[..., :-1]) ** 2
+
+    log_spec = np.log10(np.clip(feature_extractor.mel_filters @ magnitudes, a_min=1e-10, a_max=None))
+    log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+    return (log_spec + 4.0) / 4.0
+
+def run_cases(path: Path, sizes: List[str], cases: List[str], repeat: int, dictionary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    language = "de-DE"
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def run(key: str, function: Callable[[], Any], audio: float) -> None:
+        try:
+            time_min, time_median = _measure(function, repeat)
+        except (Exception, SystemExit) as e:  # noqa: BLE001 # e.g. spaCy model missing -> next case
+            Trace.error(f"{key}: {type(e).__name__} {e}")
+            return
+
+        results[key] = {
+            "min":       round(time_min, 4),
+            "median":    round(time_median, 4),
+            "audio":     audio,
+            "xRealtime": round(audio / time_min, 1) if time_min > 0 else 0.0,
+        }
+        Trace.result(f"{key:<36} min {time_min:9.3f} sec, median {time_median:9.3f} sec, {results[key]['xRealtime']:8.1f} x realtime")
+
+    # audio
+
+    if any(case in CASES_AUDIO for case in cases):
+        from faster_whisper.audio import decode_audio  # noqa: PLC0415 # CTranslate2 only if needed
+        from faster_whisper.feature_extractor import FeatureExtractor  # noqa: PLC0415
+        from faster_whisper.vad import VadOptions, get_speech_timestamps  # noqa: PLC0415
+
+        vad_options = VadOptions(**(get_vad_parameter(True) or {}))
+        vad_engine  = get_vad_engine()
+
+        for size in sizes:
+            filepath_wav = path / "audio" / (size + ".wav")
+            filepath_mp3 = path / "audio" / (size + ".mp3")
+            if not filepath_wav.is_file():
+                Trace.error(f"fixture not found: {filepath_wav} (-> benchmark.py fixtures)")
+                continue
+
+            audio = decode_audio(str(filepath_wav))
+            duration = round(len(audio) / 16000, 3)
+
+            if "decode_wav" in cases:
+                run(f"{size}/decode_wav", lambda filepath=filepath_wav: decode_audio(str(filepath)), duration)
+            if "decode_mp3" in cases:
+                run(f"{size}/decode_mp3", lambda filepath=filepath_mp3: decode_audio(str(filepath)), duration)
+            if "vad" in cases:
+                run(f"{size}/vad", lambda audio=audio: get_speech_timestamps(audio, vad_options, **vad_engine), duration)
+            for n_mels in (80, 128):
+                if f"features_{n_mels}" in cases:
+                    feature_extractor = FeatureExtractor(feature_size=n_mels)
+                    run(f"{size}/features_{n_mels}", lambda audio=audio, fe=feature_extractor: fe(audio), duration)
+            if "features_stft" in cases:
+                feature_extractor = FeatureExtractor(feature_size=128)
+                run(f"{size}/features_stft", lambda audio=audio, fe=feature_extractor: _features_stft(fe, audio), duration)
+
+            audio = None
+
+    # transcripts (synthetic + recorded)
+
+    if not any(case in CASES_TRANSCRIPT for case in cases):
+        return results
+
+    transcripts: List[Tuple[str, Path]] = [(size, path / "transcripts" / (size + ".json")) for size in sizes]
+    recorded = path / "transcripts" / "recorded"
+    if recorded.is_dir():
+        transcripts += [("recorded/" + filepath.stem, filepath) for filepath in sorted(recorded.glob("*.json"))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+
+        for name, filepath in transcripts:
+            data = import_json(filepath.parent, filepath.name, show_error=False)
+            if data is None:
+                Trace.error(f"fixture not found: {filepath} (-> benchmark.py fixtures)")
+                continue
+
+            duration = round(data["media"]["duration"], 3)
+
+            def words_fresh(data: Dict[str, Any] = data) -> Any:  # spaCy without cache
+                nlp = CacheJSON(tmp_path, "bench", get_modelname_spacy(language), True, read_only=True)
+                return prepare_words(data, True, False, "large-v2", language, nlp, "bench")
+
+            if "prepare_words" in cases:
+                run(f"{name}/prepare_words", words_fresh, duration)
+
+            try:
+                words = words_fresh()[0]
+            except (Exception, SystemExit) as e:  # noqa: BLE001 # no words -> no further transcript cases
+                Trace.error(f"{name}: prepare_words {type(e).__name__} {e}")
+                continue
+
+            captions, text, text_combined, _corrected, _spelling = split_to_lines(words, dictionary)
+            sentence_data = split_to_sentences(words, dictionary)
+
+            if "split_to_lines" in cases:
+                run(f"{name}/split_to_lines", lambda words=words: split_to_lines(words, dictionary), duration)
+            if "spellcheck" in cases:
+                run(f"{name}/spellcheck", lambda text=text_combined: spellcheck(text.split(" ")), duration)
+            if "split_to_sentences" in cases:
+                run(f"{name}/split_to_sentences", lambda words=words: split_to_sentences(words, dictionary), duration)
+            if "export_srt" in cases:
+                run(f"{name}/export_srt", lambda captions=captions: export_srt(captions), duration)
+            if "export_vtt" in cases:
+                run(f"{name}/export_vtt", lambda captions=captions: export_vtt(captions), duration)
+            if "export_txt" in cases:
+                run(f"{name}/export_txt", lambda text=text: export_text(tmp_path, "bench.txt", text, show_message=False), duration)
+            if "export_xlsx" in cases:
+                run(f"{name}/export_xlsx", lambda data=sentence_data: export_text_to_speech_excel(data, tmp_path, "bench.xlsx"), duration)
+
+    return results
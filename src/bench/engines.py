@@ -0,0 +1,222 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:55
+
+    src/bench/engines.py
+
+    PUBLIC:
+     - compare_engines(path: Path, filepath: Path, model_name: str, batch_sizes: List[int], beam_size: int, language: str) -> None | Dict
+     - compare_encoder(path: Path, filepath: Path, model_name: str, lookahead: int, beam_size: int, language: str, tolerance: float, tolerance_s: float) -> None | Dict
+
+    PRIVATE:
+     - _transcribe(name: str, function: Callable, duration: float) -> Tuple[List[Segment], List[Dict], Dict]
+     - _word_diff(reference: List[Dict], words: List[Dict]) -> Dict
+     - _segment_diff(reference: List[Segment], segments: List[Segment]) -> Dict
+
+    sequential (WhisperModel.transcribe) vs batched (BatchedInferencePipeline) with the same model, the same
+    speech chunks (VAD with max_speech_duration_s = 30) and the same decoding (first temperature, no condition_on_previous_text)
+
+     - throughput: wall time, xRealtime (audio duration / wall)
+     - words: word error rate to sequential (difflib opcodes, lower case without punctuation),
+              mean |start difference| of the same words
+
+    <path>/engines/<media> - <model>.json
+
+    encoder: encoder_lookahead (WhisperModel.encode_windows, one batch) vs single windows (encode_window)
+     - encoder output: max |difference| of the first 'lookahead' windows <= tolerance
+     - segments: transcribe with encoder_lookahead = 1 and = lookahead -> same texts, start/end within tolerance_s
+
+    <path>/engines/<media> - <model> - encoder.json, 'passed' false -> keep encoder_lookahead: 1 (whisper.yaml)
+
+    needs a model (models/faster-whisper) and a real recording, e.g. 03_audio/wav/<media>.wav
+"""
+from __future__ import annotations
+
+import difflib
+import time
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
+
+from primary.whisper_faster import BATCHED_CHUNK_LENGTH, get_vad_engine, get_vad_parameter, model_loaded_faster_whisper
+from utils.file import export_json
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from faster_whisper.transcribe import Segment
+
+PUNCTUATION: str = " .,;:!?\"'„“”‚‘’-–()"
+
+def compare_engines(path: Path, filepath: Path, model_name: str, batch_sizes: List[int], beam_size: int, language: str) -> None | Dict[str, Any]:
+    from faster_whisper import BatchedInferencePipeline  # noqa: PLC0415 # CTranslate2 only if needed
+    from faster_whisper.audio import decode_audio  # noqa: PLC0415
+    from faster_whisper.vad import VadOptions, get_speech_timestamps  # noqa: PLC0415
+
+    if not filepath.is_file():
+        Trace.error(f"media not found '{filepath}'")
+        return None
+
+    model = model_loaded_faster_whisper(model_name)
+    if model is None:
+        Trace.error(f"model '{model_name}' not found")
+        return None
+
+    audio = decode_audio(str(filepath))
+    duration = len(audio) / 16000
+
+    vad_parameter = {**(get_vad_parameter(True) or {}), "max_speech_duration_s": BATCHED_CHUNK_LENGTH}
+    speech_chunks = get_speech_timestamps(audio, VadOptions(**vad_parameter), **get_vad_engine())
+
+    options: Dict[str, Any] = {
+        "language":                   language.split("-", maxsplit=1)[0],
+        "beam_size":                  beam_size,
+        "word_timestamps":            True,
+        "temperature":                [0.0],
+        "condition_on_previous_text": False,
+        "vad_filter":                 True,
+        "vad_parameters":             vad_parameter,
+        "speech_chunks":              speech_chunks,
+    }
+
+    results: Dict[str, Any] = {}
+
+    _segments, reference, results["sequential"] = _transcribe("sequential", lambda: model.transcribe(audio, **options)[0], duration)
+
+    for batch_size in batch_sizes:
+        pipeline = BatchedInferencePipeline(model)
+        _segments, words, entry = _transcribe(
+            f"batched {batch_size}",
+            lambda pipeline=pipeline, batch_size=batch_size: pipeline.transcribe(audio, batch_size=batch_size, **options)[0],
+            duration,
+        )
+        entry.update(_word_diff(reference, words))
+        entry["speedup"] = round(results["sequential"]["wall"] / entry["wall"], 2) if entry["wall"] > 0 else 0.0
+        results[f"batched_{batch_size}"] = entry
+
+        Trace.result(f"batched {batch_size}: {entry['speedup']:.2f} x sequential, WER {entry['wer']:.2%}, start diff {entry['startDiff']:.3f} sec")
+
+    data = {
+        "media":        filepath.name,
+        "duration":     round(duration, 3),
+        "model":        model_name,
+        "beam_size":    beam_size,
+        "speechChunks": len(speech_chunks),
+        "engines":      results,
+    }
+    export_json(path / "engines", f"{filepath.stem} - {model_name}.json", data, show_message=False)
+
+    return data
+
+def compare_encoder(path: Path, filepath: Path, model_name: str, lookahead: int, beam_size: int, language: str, tolerance: float, tolerance_s: float) -> None | Dict[str, Any]:
+    import numpy as np  # noqa: PLC0415
+
+    from faster_whisper.audio import decode_audio  # noqa: PLC0415 # CTranslate2 only if needed
+
+    if not filepath.is_file():
+        Trace.error(f"media not found '{filepath}'")
+        return None
+
+    model = model_loaded_faster_whisper(model_name)
+    if model is None:
+        Trace.error(f"model '{model_name}' not found")
+        return None
+
+    if model.model.device != "cpu":
+        Trace.error(f"encoder_lookahead only on cpu (device '{model.model.device}')")
+        return None
+
+    audio = decode_audio(str(filepath))
+    duration = len(audio) / 16000
+
+    features = model.feature_extractor(audio)
+    window = model.feature_extractor.nb_max_frames
+    windows = [(seek, min(window, features.shape[-1] - seek)) for seek in range(0, min(features.shape[-1], lookahead * window), window)]
+
+    single  = [np.array(model.encode_window(features, seek, segment_size)) for seek, segment_size in windows]
+    batched = [np.array(output) for output in model.encode_windows(features, windows)]
+
+    encoder_diff = max(float(np.abs(a - b).max()) for a, b in zip(single, batched, strict=True))
+
+    options: Dict[str, Any] = {
+        "language":        language.split("-", maxsplit=1)[0],
+        "beam_size":       beam_size,
+        "word_timestamps": True,
+        "temperature":     [0.0],
+    }
+
+    results: Dict[str, Any] = {}
+
+    reference_segments, reference, results["single"] = _transcribe("single", lambda: model.transcribe(audio, encoder_lookahead=1, **options)[0], duration)
+    segments, words, results["lookahead"] = _transcribe(f"lookahead {lookahead}", lambda: model.transcribe(audio, encoder_lookahead=lookahead, **options)[0], duration)
+
+    diff = {**_segment_diff(reference_segments, segments), **_word_diff(reference, words)}
+    passed = encoder_diff <= tolerance and diff["textDiff"] == 0 and diff["timeDiff"] <= tolerance_s
+
+    Trace.result(f"encoder lookahead {lookahead}: max diff {encoder_diff:.2e} (<= {tolerance:.0e}), {diff['textDiff']} different texts, time diff {diff['timeDiff']:.3f} sec -> {'passed' if passed else 'FAILED'}")
+
+    data = {
+        "media":       filepath.name,
+        "duration":    round(duration, 3),
+        "model":       model_name,
+        "beam_size":   beam_size,
+        "windows":     len(windows),
+        "encoderDiff": encoder_diff,
+        "tolerance":   tolerance,
+        "toleranceS":  tolerance_s,
+        "segments":    diff,
+        "engines":     results,
+        "passed":      passed,
+    }
+    export_json(path / "engines", f"{filepath.stem} - {model_name} - encoder.json", data, show_message=False)
+
+    return data
+
+def _transcribe(name: str, function: Callable[[], Iterable[Segment]], duration: float) -> Tuple[List[Segment], List[Dict[str, Any]], Dict[str, Any]]:
+    start = time.perf_counter()
+    segments = list(function()) # lazy generator -> complete transcription
+    wall = time.perf_counter() - start
+
+    words = [{"word": word.word, "start": word.start} for segment in segments for word in segment.words or []]
+
+    entry = {
+        "wall":      round(wall, 3),
+        "xRealtime": round(duration / wall, 1) if wall > 0 else 0.0,
+        "segments":  len(segments),
+        "words":     len(words),
+    }
+    Trace.result(f"{name:<12} {wall:9.1f} sec, {entry['xRealtime']:6.1f} x realtime, {len(segments)} segments, {len(words)} words")
+
+    return segments, words, entry
+
+def _word_diff(reference: List[Dict[str, Any]], words: List[Dict[str, Any]]) -> Dict[str, Any]:
+    text_reference = [word["word"].strip(PUNCTUATION).lower() for word in reference]
+    text_words     = [word["word"].strip(PUNCTUATION).lower() for word in words]
+
+    matcher = difflib.SequenceMatcher(None, text_reference, text_words, autojunk=False)
+
+    errors = 0
+    start_diff: List[float] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            start_diff.extend(abs(reference[i1 + k]["start"] - words[j1 + k]["start"]) for k in range(i2 - i1))
+        else:
+            errors += max(i2 - i1, j2 - j1) # substitutions + deletions + insertions
+
+    return {
+        "wer":       round(errors / len(reference), 4) if reference else 0.0,
+        "startDiff": round(sum(start_diff) / len(start_diff), 3) if start_diff else 0.0,
+    }
+
+def _segment_diff(reference: List[Segment], segments: List[Segment]) -> Dict[str, Any]:
+    text_diff = abs(len(reference) - len(segments))
+    time_diff = 0.0
+    for a, b in zip(reference, segments, strict=False):
+        if a.text != b.text:
+            text_diff += 1
+        time_diff = max(time_diff, abs(a.start - b.start), abs(a.end - b.end))
+
+    return {
+        "count":    [len(reference), len(segments)],
+        "textDiff": text_diff,
+        "timeDiff": round(time_diff, 3),
+    }
@@ -0,0 +1,208 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 17:10
+
+    src/bench/fixtures.py
+
+    PUBLIC:
+     - get_timeline(seconds: float, seed: int) -> List[Tuple[float, float]]
+     - create_audio(path: Path, name: str, seconds: float, sample_rate: int, seed: int = 0) -> List[Path]
+     - create_transcript(path: Path, name: str, seconds: float, seed: int = 0) -> Path
+     - create_fixtures(path: Path, sizes: Dict[str, float], sample_rate: int) -> None
+     - record_transcript(path: Path, filepath: Path) -> None | Path
+
+    PRIVATE:
+     - _speech(duration: float, sample_rate: int, rng: np.random.Generator) -> np.ndarray
+
+    <path>/audio/<size>.wav + <size>.mp3 (mono, int16)
+     - speech-like: harmonic tone (f0 90 ... 220 Hz, 8 harmonics), syllable envelope 3 ... 6 Hz
+     - pauses 0.15 ... 1.5 sec (sometimes 3 ... 6 sec) -> realistic VAD pattern, background noise -50 dB
+
+    <path>/transcripts/<size>.json: same timeline as the audio, format of 05_json (faster-whisper 1.1.x)
+    <path>/transcripts/recorded/*.json: real 05_json transcripts (record_transcript)
+
+    the same seed -> the same fixtures (baselines comparable)
+"""
+from __future__ import annotations
+
+import shutil
+import wave
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import av
+import numpy as np
+
+from utils.file import export_json, import_json
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+VOCABULARY: List[str] = [
+    "die", "der", "das", "und", "ist", "mit", "für", "den", "im", "auf", "Sie", "wir", "nicht", "eine", "auch",
+    "Lohnabrechnung", "Mitarbeiter", "Unternehmen", "Buchung", "Kanzlei", "Mandanten", "Steuerberater",
+    "Programm", "Beispiel", "Auswertung", "Bilanz", "Umsatzsteuer", "Finanzamt", "Rechnung", "Konto",
+    "jetzt", "hier", "dann", "bitte", "zum", "nächsten", "Schritt", "sehen", "klicken", "öffnen", "wählen",
+    "DATEV", "Unternehmen online", "Kostenstelle", "Sachkonto", "Personalstamm", "Abrechnung", "Monat",
+    "wichtig", "einfach", "schnell", "automatisch", "direkt", "zusätzlich", "außerdem", "beispielsweise",
+]
+
+def get_timeline(seconds: float, seed: int) -> List[Tuple[float, float]]: # [(start, end)] of the speech parts
+    rng = np.random.default_rng(seed)
+
+    timeline: List[Tuple[float, float]] = []
+    pos = float(rng.uniform(0.3, 1.5))
+    while pos < seconds - 1:
+        duration = float(rng.uniform(0.4, 4.0))
+        end = min(pos + duration, seconds - 0.2)
+        timeline.append((round(pos, 3), round(end, 3)))
+
+        pause = float(rng.uniform(3.0, 6.0)) if rng.random() < 0.05 else float(rng.uniform(0.15, 1.5))
+        pos = end + pause
+
+    return timeline
+
+def _speech(duration: float, sample_rate: int, rng: np.random.Generator) -> np.ndarray:
+    t = np.arange(int(duration * sample_rate), dtype=np.float32) / sample_rate
+
+    f0 = rng.uniform(90, 220) * (1 + 0.05 * np.sin(2 * np.pi * rng.uniform(2, 5) * t))
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+
+    tone = np.zeros_like(t)
+    for k in range(1, 9):
+        tone += np.sin(k * phase) / k
+
+    envelope = np.abs(np.sin(np.pi * rng.uniform(3, 6) * t)) ** 0.7
+    return (0.25 * tone * envelope).astype(np.float32)
+
+def create_audio(path: Path, name: str, seconds: float, sample_rate: int, seed: int = 0) -> List[Path]:
+    rng = np.random.default_rng(seed + 1)
+
+    path.mkdir(parents=True, exist_ok=True)
+    filepath_wav = path / (name + ".wav")
+    filepath_mp3 = path / (name + ".mp3")
+
+    with wave.open(str(filepath_wav), "wb") as wav, av.open(str(filepath_mp3), "w") as mp3:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+
+        stream = mp3.add_stream("mp3", rate=sample_rate)
+        stream.layout = "mono"
+
+        def write(data: np.ndarray) -> None:
+            noise = rng.normal(0, 0.003, len(data)).astype(np.float32)
+            pcm = (np.clip(data + noise, -1, 1) * 32767).astype(np.int16)
+
+            wav.writeframes(pcm.tobytes())
+
+            frame = av.AudioFrame.from_ndarray(pcm.reshape(1, -1), format="s16", layout="mono")
+            frame.sample_rate = sample_rate
+            for packet in stream.encode(frame):
+                mp3.mux(packet)
+
+        pos = 0.0
+        for start, end in get_timeline(seconds, seed):
+            write(np.zeros(int((start - pos) * sample_rate), dtype=np.float32))
+            write(_speech(end - start, sample_rate, rng))
+            pos = start + int((end - start) * sample_rate) / sample_rate
+
+        write(np.zeros(int((seconds - pos) * sample_rate), dtype=np.float32))
+
+        for packet in stream.encode(None):
+            mp3.mux(packet)
+
+    return [filepath_wav, filepath_mp3]
+
+def create_transcript(path: Path, name: str, seconds: float, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed + 2)
+
+    segments: List[Dict[str, Any]] = []
+    words: List[Dict[str, Any]] = []
+    sentence_length = int(rng.integers(6, 18))
+    text_all = ""
+
+    def add_segment() -> None:
+        nonlocal words, text_all
+
+        text = "".join(word["word"] for word in words)
+        segments.append({
+            "id":                len(segments) + 1,
+            "seek":              int(words[0]["start"] * 100) // 3000 * 3000,
+            "start":             words[0]["start"],
+            "end":               words[-1]["end"],
+            "prompt":            {},
+            "text":              text,
+            "tokens":            [],
+            "avg_logprob":       -0.2,
+            "compression_ratio": 1.5,
+            "no_speech_prob":    0.01,
+            "words":             words,
+            "temperature":       0.0,
+            "result_log":        [],
+        })
+        text_all += text
+        words = []
+
+    for start, end in get_timeline(seconds, seed):
+        pos = start
+        while pos < end - 0.2:
+            duration = float(rng.uniform(0.2, 0.5))
+
+            word = VOCABULARY[int(rng.integers(0, len(VOCABULARY)))]
+            if len(words) == 0 or words[-1]["word"].endswith((".", "?")):
+                word = word[0].upper() + word[1:]
+
+            sentence_length -= 1
+            if sentence_length == 0:
+                word += "?" if rng.random() < 0.1 else "."
+                sentence_length = int(rng.integers(6, 18))
+            elif rng.random() < 0.05:
+                word += ","
+
+            words.append({
+                "start":       round(pos, 2),
+                "end":         round(min(pos + duration, end), 2),
+                "word":        " " + word,
+                "probability": round(float(rng.uniform(0.6, 1.0)), 3),
+            })
+            pos += duration + float(rng.uniform(0.0, 0.1))
+
+        if len(words) > 0 and (words[-1]["end"] - words[0]["start"] > 5 or rng.random() < 0.3):
+            add_segment()
+
+    if len(words) > 0:
+        add_segment()
+
+    transcript = {
+        "media":    {"duration": seconds},
+        "language": "de",
+        "text":     text_all,
+        "segments": segments,
+    }
+
+    export_json(path, name + ".json", transcript, show_message=False)
+    return path / (name + ".json")
+
+def create_fixtures(path: Path, sizes: Dict[str, float], sample_rate: int) -> None:
+    for size, seconds in sizes.items():
+        Trace.info(f"fixture '{size}': {seconds} sec")
+
+        create_audio(path / "audio", size, seconds, sample_rate)
+        create_transcript(path / "transcripts", size, seconds)
+
+def record_transcript(path: Path, filepath: Path) -> None | Path:
+    data = import_json(filepath.parent, filepath.name)
+    if data is None:
+        return None
+
+    if "segments" not in data or "media" not in data:
+        Trace.error(f"no faster-whisper transcript (header v2): {filepath}")
+        return None
+
+    dest = path / "transcripts" / "recorded"
+    dest.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(filepath, dest / filepath.name)
+
+    Trace.info(f"recorded '{filepath.name}' ({data['media']['duration']:.0f} sec)")
+    return dest / filepath.name
@@ -0,0 +1,165 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:55
+
+    src/benchmark.py
+
+    .venv/Scripts/activate
+    python src/benchmark.py fixtures                          # synthetic audio + transcripts (benchmark.yaml -> sizes)
+    python src/benchmark.py record <05_json>/<file>.json      # real transcript as additional fixture
+    python src/benchmark.py run [--sizes small medium] [--cases vad features_80] [--save <name>]
+    python src/benchmark.py compare <baseline> [<current>] [--threshold 0.1]
+    python src/benchmark.py engines <audio> --model large-v3 [--batch-sizes 4 8 16] [--beam 5]
+    python src/benchmark.py encoder <audio> --model large-v3 [--lookahead 4] [--beam 5] [--tolerance 1e-3] [--tolerance-s 0.02]
+
+    compare without <current>: new run, compared with <baseline> -> exit code 1 if a case is slower than the threshold
+
+    offline (no model, no project data): decode, VAD, log-mel, prepare_words (spaCy), split_to_lines,
+    spellcheck (hunspell), split_to_sentences and the exporters (bench/cases.py)
+
+    engines (with model): sequential vs batched decoding -> throughput + word diff (bench/engines.py)
+    encoder (with model): encoder_lookahead vs single windows -> encoder output + segments within the tolerance, else exit code 1
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import platform
+import sys
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from bench.baseline import compare_results, load_results, save_results
+from bench.cases import CASES, run_cases
+from bench.engines import compare_encoder, compare_engines
+from bench.fixtures import create_fixtures, record_transcript
+from helper.excel_read import import_dictionary_excel
+from helper.spelling import hunspell_dictionary_init
+from helper.whisper_util import init_special_text
+from utils.globals import BASE_PATH
+from utils.prefs import Prefs
+from utils.trace import Trace
+
+def main() -> None:
+    Prefs.init("settings")
+    Prefs.load("base.yaml")
+    Prefs.load("whisper.yaml")
+    Prefs.load("hallucination.yaml")
+    Prefs.load("spacy.yaml")
+    Prefs.load("hunspell.yaml")
+    Prefs.load("format_sentence.yaml")
+    Prefs.load("benchmark.yaml")
+
+    sizes: Dict[str, float] = Prefs.get("benchmark.sizes")
+    path = BASE_PATH / Prefs.get("benchmark.path")
+
+    parser = argparse.ArgumentParser(prog="benchmark.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("fixtures")
+
+    record = commands.add_parser("record")
+    record.add_argument("transcript", type=Path)
+
+    run = commands.add_parser("run")
+    run.add_argument("--sizes", nargs="+", choices=list(sizes), default=list(sizes))
+    run.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    run.add_argument("--save", default=None)
+
+    compare = commands.add_parser("compare")
+    compare.add_argument("baseline")
+    compare.add_argument("current", nargs="?", default=None)
+    compare.add_argument("--threshold", type=float, default=Prefs.get("benchmark.threshold"))
+
+    engines = commands.add_parser("engines")
+    engines.add_argument("audio", type=Path)
+    engines.add_argument("--model", required=True)
+    engines.add_argument("--batch-sizes", nargs="+", type=int, default=[4, 8, 16])
+    engines.add_argument("--beam", type=int, default=5)
+
+    encoder = commands.add_parser("encoder")
+    encoder.add_argument("audio", type=Path)
+    encoder.add_argument("--model", required=True)
+    encoder.add_argument("--lookahead", type=int, default=4)
+    encoder.add_argument("--beam", type=int, default=5)
+    encoder.add_argument("--tolerance", type=float, default=1e-3)
+    encoder.add_argument("--tolerance-s", type=float, default=0.02)
+
+    args = parser.parse_args()
+
+    if args.command == "fixtures":
+        create_fixtures(path, sizes, Prefs.get("benchmark.sample_rate"))
+        return
+
+    if args.command == "record":
+        if record_transcript(path, args.transcript) is None:
+            sys.exit(1)
+        return
+
+    if args.command == "engines":
+        if compare_engines(path, args.audio, args.model, args.batch_sizes, args.beam, Prefs.get("language")) is None:
+            sys.exit(1)
+        return
+
+    if args.command == "encoder":
+        result = compare_encoder(path, args.audio, args.model, args.lookahead, args.beam, Prefs.get("language"), args.tolerance, args.tolerance_s)
+        if result is None or not result["passed"]:
+            sys.exit(1)
+        return
+
+    repeat = Prefs.get("benchmark.repeat")
+
+    if args.command == "compare":
+        baseline = load_results(path, args.baseline)
+        if baseline is None:
+            sys.exit(1)
+
+        if args.current:
+            current = load_results(path, args.current)
+            if current is None:
+                sys.exit(1)
+        else:
+            keys = list(baseline["cases"].keys())
+            bench_sizes = [size for size in sizes if any(key.startswith(size + "/") for key in keys)]
+            bench_cases = [case for case in CASES if any(key.endswith("/" + case) for key in keys)]
+
+            current = {
+                "platform": platform.platform(),
+                "cpu":      os.cpu_count(),
+                "cases":    _run(path, bench_sizes, bench_cases, repeat),
+            }
+
+        regressions = compare_results(baseline, current, args.threshold)
+        if len(regressions) > 0:
+            Trace.error(f"{len(regressions)} regression(s) > {args.threshold:.0%}")
+            sys.exit(1)
+
+        Trace.result(f"no regression > {args.threshold:.0%}")
+        return
+
+    results = _run(path, args.sizes, args.cases, repeat)
+    if args.save:
+        save_results(path, args.save, results, repeat)
+
+def _run(path: Path, sizes: List[str], cases: List[str], repeat: int) -> Dict[str, Dict[str, Any]]:
+    language   = Prefs.get("language")
+    dictionary = Prefs.get("dictionary")
+    spelling   = Prefs.get("hunspell")
+
+    init_special_text( language )
+
+    data_dictionary, _names_dictionary_sheet, _dictionary_timestamp = import_dictionary_excel( BASE_PATH / dictionary["path"], dictionary["file"])
+    hunspell_dictionary_init( BASE_PATH / spelling["path"] / language, spelling["file"][language], language)
+
+    return run_cases(path, sizes, cases, repeat, data_dictionary)
+
+
+if __name__ == "__main__":
+    Trace.set( debug_mode=True, timezone=False )
+    Trace.action(f"Python version {sys.version}")
+
+    try:
+        main()
+    except KeyboardInterrupt:
+        Trace.exception("KeyboardInterrupt")
+        sys.exit(0)
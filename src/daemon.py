@@ -0,0 +1,249 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 19:20
+
+    src/daemon.py
+
+    .venv/Scripts/activate
+    python src/daemon.py
+
+    resident service: prefs, hunspell, Excel dictionary, spaCy and the WhisperModel are loaded once and stay warm
+
+    local HTTP endpoint (whisper.yaml -> whisper.daemon.host/port), JSON:
+     - POST   /jobs       {"projects": [...], "models": [["06", "large-v2"]], "beams": [5], "reprocess": false} -> job
+     - GET    /jobs       -> all jobs
+     - GET    /jobs/<id>  -> job ("queued", "running", "done", "failed", "cancelled")
+     - DELETE /jobs/<id>  -> cancel
+     - GET    /status     -> daemon (uptime, pool, queue)
+
+    all keys of a job are optional (default: projects.yaml, models and beams as in main.py)
+    the Excel dictionary is read again if the file was changed
+
+    curl -X POST http://127.0.0.1:8765/jobs -d '{"projects": ["DATEV/Lernvideos/Kapitel-01"]}'
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from helper.excel_read import import_dictionary_excel
+from helper.jobs import JobQueue
+from helper.planner import CachePlanner
+from helper.postprocess import reprocess_transcript
+from helper.runner import load_projects, run_model, trace_file_default
+from helper.scheduler import TranscribePool, get_parallel_settings
+from helper.spelling import hunspell_dictionary_init
+from helper.whisper_util import init_special_text
+from primary.spacy import init_spacy
+from primary.whisper_faster import (
+    pack_media_faster_whisper,
+    precheck_models,
+    preload_faster_whisper,
+    prepare_media_faster_whisper,
+    transcribe_fasterwhisper,
+)
+from utils.file import get_modification_timestamp
+from utils.globals import BASE_PATH
+from utils.prefs import Prefs
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    import threading
+
+PROJECTS: str = "projects.yaml"  # "projects.yaml", "projects_all.yaml"
+
+models = [ ("06", "large-v2") ]  # default, same as main.py
+
+beams = [5]
+
+class Service:
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.whisper_type = "faster-whisper"
+
+        self.language   = Prefs.get("language")
+        self.media_type = Prefs.get("mediaType")
+        self.dictionary = Prefs.get("dictionary")
+        self.spelling   = Prefs.get("hunspell")
+
+        self.no_prompt  = not Prefs.get("whisper.use_initial_prompt")
+
+        self.hunspell_path   = BASE_PATH / self.spelling["path"] / self.language
+        self.path_trace_main = BASE_PATH / Prefs.get("trace_all")["path"]
+
+        self.started = time.time()
+
+        init_special_text( self.language )
+        hunspell_dictionary_init( self.hunspell_path, self.spelling["file"][self.language], self.language)
+        init_spacy( self.language )
+
+        self.pool: TranscribePool | None = None
+        self.dictionary_timestamp = 0.0
+        self.load_dictionary()
+
+        if self.pool is None and Prefs.get("whisper.daemon.preload"):
+            preload_faster_whisper(models[0][1])
+
+    def load_dictionary(self) -> None:
+        filepath = BASE_PATH / self.dictionary["path"] / self.dictionary["file"]
+        if get_modification_timestamp(filepath) == self.dictionary_timestamp:
+            return
+
+        self.data_dictionary, self.names_dictionary_sheet, self.dictionary_timestamp = import_dictionary_excel( BASE_PATH / self.dictionary["path"], self.dictionary["file"])
+
+        # worker processes get the dictionary once (initargs) -> new pool
+
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+
+        workers, worker_threads = get_parallel_settings()
+        if workers > 1:
+            self.pool = TranscribePool(transcribe_fasterwhisper, workers, worker_threads, self.language, self.data_dictionary, self.hunspell_path, self.spelling["file"][self.language], trace_file_default)
+
+    def run(self, spec: Dict[str, Any], cancel: threading.Event) -> None:
+        start = time.perf_counter()
+
+        self.load_dictionary()
+
+        job_models: List[Tuple[str, str]] = [tuple(model) for model in spec.get("models", models)]  # type: ignore[misc]
+        job_beams: List[int] = spec.get("beams", beams)
+
+        if not precheck_models( job_models ):
+            Trace.fatal("missing model(s)")
+
+        projects = load_projects(self.media_type, spec.get("projects"))
+
+        task: Callable[..., Dict[str, Any] | None]
+        if spec.get("reprocess", False):
+            task = reprocess_transcript
+            planner = None
+            pool    = None
+        else:
+            task = transcribe_fasterwhisper
+            planner = CachePlanner()
+            pool    = self.pool
+
+        for model in job_models:
+            if cancel.is_set():
+                break
+
+            run_model(
+                model, job_beams, projects, task, self.whisper_type, self.language, self.media_type, self.no_prompt,
+                self.data_dictionary, self.names_dictionary_sheet, self.dictionary_timestamp, self.path_trace_main, start, False,
+                planner, pool, prepare_media_faster_whisper if planner else None, cancel,
+                pack_task = pack_media_faster_whisper if planner else None,
+            )
+
+    def shutdown(self) -> None:
+        if self.pool:
+            self.pool.shutdown()
+
+class RequestHandler(BaseHTTPRequestHandler):
+    jobs: JobQueue
+    service: Service
+
+    def do_GET(self) -> None:
+        parts = self.path.strip("/").split("/")
+
+        if parts == ["status"]:
+            jobs = self.jobs.list()
+            self._send(200, {
+                "uptime":   round(time.time() - self.service.started, 1),
+                "pool":     self.service.pool is not None,
+                "queued":   sum(1 for job in jobs if job["state"] == "queued"),
+                "running":  [job["id"] for job in jobs if job["state"] == "running"],
+            })
+        elif parts == ["jobs"]:
+            self._send(200, self.jobs.list())
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self.jobs.status(parts[1])
+            self._send(200 if job else 404, job or {"error": f"unknown job '{parts[1]}'"})
+        else:
+            self._send(404, {"error": f"unknown path '{self.path}'"})
+
+    def do_POST(self) -> None:
+        if self.path.strip("/") != "jobs":
+            self._send(404, {"error": f"unknown path '{self.path}'"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            spec = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._send(400, {"error": f"JSONDecodeError: {e}"})
+            return
+
+        if not isinstance(spec, dict):
+            self._send(400, {"error": "job must be a JSON object"})
+            return
+
+        self._send(202, self.jobs.submit(spec))
+
+    def do_DELETE(self) -> None:
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send(404, {"error": f"unknown path '{self.path}'"})
+            return
+
+        job = self.jobs.cancel(parts[1])
+        self._send(200 if job else 404, job or {"error": f"unknown job '{parts[1]}'"})
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 # signature of BaseHTTPRequestHandler
+        pass
+
+    def _send(self, status: int, data: Any) -> None:
+        body = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def main() -> None:
+    Prefs.init("settings")
+    Prefs.load("base.yaml")
+    Prefs.load("whisper.yaml")
+    Prefs.load("hallucination.yaml")
+    Prefs.load("spacy.yaml")
+    Prefs.load("hunspell.yaml")
+    Prefs.load("format_sentence.yaml")
+    Prefs.load(PROJECTS)
+
+    if Prefs.get("whisper.whisper_type") != "faster-whisper":
+        Trace.fatal("daemon: only 'faster-whisper' supported")
+
+    service = Service()
+    jobs    = JobQueue(service.run)
+
+    RequestHandler.jobs    = jobs
+    RequestHandler.service = service
+
+    host = Prefs.get("whisper.daemon.host")
+    port = int(Prefs.get("whisper.daemon.port"))
+
+    server = ThreadingHTTPServer((host, port), RequestHandler)
+    Trace.action(f"daemon ready: http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        jobs.stop()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    Trace.set( debug_mode=True, timezone=False )
+    Trace.action(f"Python version {sys.version}")
+
+    try:
+        main()
+    except KeyboardInterrupt:
+        Trace.exception("KeyboardInterrupt")
+        sys.exit(0)
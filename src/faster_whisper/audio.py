@@ -7,10 +7,9 @@
 """
 
 import gc
-import io
 import itertools
 
-from typing import BinaryIO, Union
+from typing import BinaryIO, Iterator, Union  # JS
 
 import av
 import numpy as np
@@ -20,6 +19,7 @@ def decode_audio(
     input_file: Union[str, BinaryIO],
     sampling_rate: int = 16000,
     split_stereo: bool = False,
+    pcm16: bool = False,                                                            # JS
 ):
     """Decodes the audio.
 
@@ -27,6 +27,7 @@ def decode_audio(
       input_file: Path to the input file or a file-like object.
       sampling_rate: Resample the audio to this sample rate.
       split_stereo: Return separate left and right channels.
+      pcm16: Return the int16 samples without conversion (e.g. for a PCM cache).   # JS
 
     Returns:
       A float32 Numpy array.
@@ -40,19 +41,27 @@ def decode_audio(
         rate=sampling_rate,
     )
 
-    raw_buffer = io.BytesIO()
-    dtype = None
+    # JS: one preallocated array (size from the container duration), converted per frame
+    # JS: -> no BytesIO with the int16 samples + no second float32 copy (peak ~ 1/3)
+    channels = 2 if split_stereo else 1                                             # JS
+    dtype = np.int16 if pcm16 else np.float32                                       # JS
+    position = 0                                                                    # JS
 
     with av.open(input_file, mode="r", metadata_errors="ignore") as container:
+        audio = np.empty(_estimate_samples(container, sampling_rate) * channels, dtype=dtype) # JS
+
         frames = container.decode(audio=0)
         frames = _ignore_invalid_frames(frames)
         frames = _group_frames(frames, 500000)
         frames = _resample_frames(frames, resampler)
 
         for frame in frames:
-            array = frame.to_ndarray()
-            dtype = array.dtype
-            raw_buffer.write(array)
+            array = frame.to_ndarray().reshape(-1)                                  # JS
+            end = position + array.shape[0]                                         # JS
+            if end > audio.shape[0]:                                                # JS duration in the header too short
+                audio = _grow(audio, end)                                           # JS
+            _convert(array, audio[position:end], pcm16)                             # JS
+            position = end                                                          # JS
 
     # It appears that some objects related to the resampler are not freed
     # unless the garbage collector is manually run.
@@ -63,10 +72,7 @@ def decode_audio(
     del resampler
     gc.collect()
 
-    audio = np.frombuffer(raw_buffer.getbuffer(), dtype=dtype)
-
-    # Convert s16 back to f32.
-    audio = audio.astype(np.float32) / 32768.0
+    audio = _trim(audio, position, sampling_rate * channels)                       # JS
 
     if split_stereo:
         left_channel = audio[0::2]
@@ -76,6 +82,93 @@ def decode_audio(
     return audio
 
 
+def decode_audio_chunks(                                                            # JS
+    input_file: Union[str, BinaryIO],
+    sampling_rate: int = 16000,
+    chunk_size: int = 30 * 16000,
+    pcm16: bool = False,
+) -> Iterator[np.ndarray]:
+    """Decodes the audio (mono) and yields it in chunks.
+
+    Args:
+      input_file: Path to the input file or a file-like object.
+      sampling_rate: Resample the audio to this sample rate.
+      chunk_size: Number of samples per chunk (the last chunk may be shorter).
+      pcm16: Yield the int16 samples without conversion.
+
+    Returns:
+      A generator of float32 (or int16) Numpy arrays.
+    """
+    resampler = av.audio.resampler.AudioResampler(
+        format="s16",
+        layout="mono",
+        rate=sampling_rate,
+    )
+
+    dtype = np.int16 if pcm16 else np.float32
+    chunk = np.empty(chunk_size, dtype=dtype)
+    position = 0
+
+    with av.open(input_file, mode="r", metadata_errors="ignore") as container:
+        frames = container.decode(audio=0)
+        frames = _ignore_invalid_frames(frames)
+        frames = _group_frames(frames, 500000)
+        frames = _resample_frames(frames, resampler)
+
+        for frame in frames:
+            array = frame.to_ndarray().reshape(-1)
+            while array.shape[0] > 0:
+                count = min(chunk_size - position, array.shape[0])
+                _convert(array[:count], chunk[position : position + count], pcm16)
+                array = array[count:]
+                position += count
+
+                if position == chunk_size:
+                    yield chunk
+                    chunk = np.empty(chunk_size, dtype=dtype)  # the caller may keep the previous chunk
+                    position = 0
+
+    del resampler
+    gc.collect()
+
+    if position > 0:
+        yield chunk[:position]
+
+
+def _estimate_samples(container, sampling_rate: int) -> int:                        # JS
+    duration = None
+    if container.duration is not None:
+        duration = container.duration / av.time_base
+    else:
+        stream = container.streams.audio[0]
+        if stream.duration is not None and stream.time_base is not None:
+            duration = float(stream.duration * stream.time_base)
+
+    if duration is None:
+        return 60 * 60 * sampling_rate  # unknown -> 1 hour, grows if needed
+
+    return int(duration * sampling_rate) + sampling_rate  # + 1 sec: resampler delay / rounding
+
+
+def _grow(audio: np.ndarray, size: int) -> np.ndarray:                              # JS
+    grown = np.empty(max(size, int(audio.shape[0] * 1.5)), dtype=audio.dtype)
+    grown[: audio.shape[0]] = audio
+    return grown
+
+
+def _trim(audio: np.ndarray, size: int, slack: int) -> np.ndarray:                 # JS
+    if audio.shape[0] - size > slack:  # far too large (no duration in the header) -> release the rest
+        return audio[:size].copy()
+    return audio[:size]
+
+
+def _convert(array: np.ndarray, out: np.ndarray, pcm16: bool) -> None:             # JS
+    if pcm16:
+        out[:] = array
+    else:
+        np.divide(array, 32768.0, out=out, casting="unsafe")  # s16 -> f32 (same values as astype(np.float32) / 32768.0)
+
+
 def _ignore_invalid_frames(frames):
     iterator = iter(frames)
 
@@ -1,8 +1,11 @@
-from typing import Literal
+from collections import OrderedDict
+from typing import Any, List, Literal, Tuple
 
 import numpy as np
 
 class FeatureExtractor:
+    block_frames: int = 3000                                                                # JS frames per rfft block (30 sec) -> flat peak memory
+
     def __init__(
         self,
         feature_size: int = 80,
@@ -21,6 +24,7 @@ def __init__(
         self.mel_filters = self.get_mel_filters(
             sampling_rate, n_fft, n_mels=feature_size
         ).astype("float32")
+        self.window = np.hanning(n_fft + 1)[:-1].astype("float32")                          # JS
 
     @staticmethod
     def get_mel_filters(sr: int, n_fft: int, n_mels: int = 128) -> np.ndarray:
@@ -203,33 +207,177 @@ def stft(
     def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length: int | None = None) -> np.ndarray:
         """
         Compute the log-Mel spectrogram of the provided audio.
+
+        JS: real, centered (reflect), Hann-windowed n_fft/hop_length transform in blocks of block_frames:
+        frames as sliding_window_view (no copy), np.fft.rfft in float32, mel per block into the result;
+        same values as stft(..., return_complex=True) + mel_filters (float32 rounding of the matmul)
         """
 
         if chunk_length is not None:
             self.n_samples = chunk_length * self.sampling_rate
             self.nb_max_frames = self.n_samples // self.hop_length
 
-        if waveform.dtype is not np.float32:
-            waveform = waveform.astype(np.float32)
+        length = len(waveform) + padding                                                    # JS waveform + zero padding (without copy)
+        n_frames = length // self.hop_length                                                # JS last stft frame dropped
+
+        log_spec = np.empty((self.mel_filters.shape[0], n_frames), dtype=np.float32)        # JS
+        if n_frames == 0:                                                                   # JS
+            return log_spec                                                                 # JS
 
-        if padding:
-            waveform = np.pad(waveform, (0, padding))
+        for start in range(0, n_frames, self.block_frames):                                # JS
+            end = min(start + self.block_frames, n_frames)                                  # JS
+            self.log_mel_block(waveform, length, start, end, out=log_spec[:, start:end])    # JS
 
-        window = np.hanning(self.n_fft + 1)[:-1].astype("float32")
+        return self.normalize(log_spec, log_spec.max())                                     # JS
+
+    def log_mel_block(self, waveform: Any, length: int, start: int, end: int, out: np.ndarray | None = None) -> np.ndarray: # JS
+        """
+        JS: log10 mel of the frames [start, end) (before normalize), waveform: np.ndarray or slicable (len + [a:b] -> float32)
+        """
 
-        stft = self.stft(
-            waveform,
-            self.n_fft,
-            self.hop_length,
-            window=window,
-            return_complex=True,
-        ).astype("complex64")
-        magnitudes = np.abs(stft[..., :-1]) ** 2
+        samples = self._get_samples(waveform, length, start * self.hop_length, (end - 1) * self.hop_length + self.n_fft)
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.n_fft)[::self.hop_length]
+        stft = np.fft.rfft(frames * self.window, axis=-1)                                   # complex64 (float32 input)
+        magnitudes = stft.real ** 2 + stft.imag ** 2
 
-        mel_spec = self.mel_filters @ magnitudes
+        if out is None:
+            out = np.empty((self.mel_filters.shape[0], end - start), dtype=np.float32)
+        np.matmul(self.mel_filters, magnitudes.T, out=out)
+        np.clip(out, 1e-10, None, out=out)
+        np.log10(out, out=out)
 
-        log_spec = np.log10(np.clip(mel_spec, a_min=1e-10, a_max=None))
-        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
-        log_spec = (log_spec + 4.0) / 4.0
+        return out
+
+    @staticmethod
+    def normalize(log_spec: np.ndarray, maximum: float) -> np.ndarray:                      # JS whisper: max. 80 dB below the maximum of the file, in place
+        np.maximum(log_spec, maximum - 8.0, out=log_spec)
+        log_spec += 4.0
+        log_spec /= 4.0
 
         return log_spec
+
+    def _get_samples(self, waveform: Any, length: int, start: int, end: int) -> np.ndarray: # JS
+        """
+        JS: samples [start, end) of the centered signal (n_fft // 2 reflected at both ends of waveform + zero padding)
+        -> view of the waveform for all inner blocks, copy only at the edges
+        """
+
+        pad = self.n_fft // 2
+        if start >= pad and end - pad <= len(waveform):
+            samples = waveform[start - pad : end - pad]
+            return samples if samples.dtype == np.float32 else samples.astype(np.float32)
+
+        if length <= pad:                                                                   # shorter than n_fft // 2 -> multiple reflections
+            signal = np.pad(np.asarray(waveform[:], dtype=np.float32), (0, length - len(waveform)))
+            return np.pad(signal, pad, mode="reflect")[start:end]
+
+        index = np.abs(np.arange(start - pad, end - pad))                                  # reflect left
+        index = np.where(index >= length, 2 * (length - 1) - index, index)                  # reflect right
+
+        low, high = int(index.min()), int(index.max()) + 1
+        part = np.zeros(high - low, dtype=np.float32)                                       # zero padding
+        if low < len(waveform):
+            part[: min(high, len(waveform)) - low] = waveform[low : min(high, len(waveform))]
+
+        return part[index - low]
+
+class BlockFeatures:                                                                         # JS
+    """
+    JS: memory optimization - log-mel of a waveform in blocks of block_frames, no (n_mels x frames) matrix
+
+     - shape, features[:, a:b] / features[..., a:b] -> np.ndarray (same values as FeatureExtractor.__call__)
+     - normalization needs the maximum of the complete file -> one full log-mel pass at the first access
+       (the first 'cache_blocks' blocks are kept), every later block is computed again when a window needs it
+       -> up to 2x the log-mel time of FeatureExtractor.__call__, the first window not earlier
+     - LRU of 'cache_blocks' blocks: a 30 sec window overlaps max. 2 blocks, seek moves forward
+
+    waveform: np.ndarray, PcmAudio or ConcatenatedChunks (VAD) -> no float32 copy of the complete audio
+    """
+
+    def __init__(self, feature_extractor: FeatureExtractor, waveform: Any, padding: int = 160, chunk_length: int | None = None, cache_blocks: int = 3) -> None:
+        super().__init__()
+
+        if chunk_length is not None:
+            feature_extractor.n_samples = chunk_length * feature_extractor.sampling_rate
+            feature_extractor.nb_max_frames = feature_extractor.n_samples // feature_extractor.hop_length
+
+        self.feature_extractor = feature_extractor
+        self.waveform          = waveform
+        self.length            = len(waveform) + padding
+        self.block_frames      = feature_extractor.block_frames
+        self.cache_blocks      = max(2, cache_blocks)
+        self.n_frames          = self.length // feature_extractor.hop_length
+
+        self.maximum: float | None = None
+        self.blocks: OrderedDict[int, np.ndarray] = OrderedDict()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.feature_extractor.mel_filters.shape[0], self.n_frames)
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return np.dtype(np.float32)
+
+    def __getitem__(self, key: Tuple[Any, slice]) -> np.ndarray:
+        if not isinstance(key, tuple) or len(key) != 2 or key[0] not in (Ellipsis, slice(None)) or not isinstance(key[1], slice):
+            raise IndexError("BlockFeatures: only [:, start:end] or [..., start:end]")
+
+        start, end, step = key[1].indices(self.n_frames)
+        if step != 1:
+            raise IndexError("BlockFeatures: no step")
+
+        if end <= start:
+            return np.empty((self.shape[0], 0), dtype=np.float32)
+
+        first = start // self.block_frames
+        last  = (end - 1) // self.block_frames
+
+        blocks = [self._get_block(index) for index in range(first, last + 1)]
+        data = blocks[0] if len(blocks) == 1 else np.concatenate(blocks, axis=1)
+
+        offset = first * self.block_frames
+        return data[:, start - offset : end - offset].copy() # cached block not changed by the caller
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:                 # complete matrix (e.g. np.asarray)
+        features = self[:, :]
+        return features if dtype is None else features.astype(dtype)
+
+    def _get_block(self, index: int) -> np.ndarray:
+        if self.maximum is None:
+            self._set_maximum()
+
+        block = self.blocks.get(index)
+        if block is None:
+            block = FeatureExtractor.normalize(self._log_mel(index), self.maximum)
+            self.blocks[index] = block
+            while len(self.blocks) > self.cache_blocks:
+                self.blocks.popitem(last=False)
+        else:
+            self.blocks.move_to_end(index)
+
+        return block
+
+    def _set_maximum(self) -> None:
+        maximum = -np.inf
+        first: List[Tuple[int, np.ndarray]] = []
+
+        for index in range((self.n_frames + self.block_frames - 1) // self.block_frames):
+            block = self._log_mel(index)
+            maximum = max(maximum, float(block.max()))
+            if index < self.cache_blocks:
+                first.append((index, block))
+
+        self.maximum = maximum
+        for index, block in first:
+            self.blocks[index] = FeatureExtractor.normalize(block, maximum)
+
+    def _log_mel(self, index: int) -> np.ndarray:
+        start = index * self.block_frames
+        end   = min(start + self.block_frames, self.n_frames)
+
+        return self.feature_extractor.log_mel_block(self.waveform, self.length, start, end)
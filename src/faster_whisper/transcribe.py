@@ -18,10 +18,11 @@
 from tqdm import tqdm
 
 from faster_whisper.audio import decode_audio, pad_or_trim
-from faster_whisper.feature_extractor import FeatureExtractor
+from faster_whisper.feature_extractor import BlockFeatures, FeatureExtractor                # JS
 from faster_whisper.tokenizer import _LANGUAGE_CODES, Tokenizer
 from faster_whisper.utils import download_model, format_timestamp, get_end, get_logger
 from faster_whisper.vad import (
+    ConcatenatedChunks,                                                                     # JS
     SpeechTimestampsMap,
     VadOptions,
     collect_chunks,
@@ -29,6 +30,8 @@
     merge_segments,
 )
 
+from utils.timing import stage # JS
+
 print("FASTER-WHISPER PATCH (01.01.2025)")
 
 @dataclass
@@ -103,6 +106,7 @@ class TranscriptionOptions:
     clip_timestamps: Union[str, List[float]]
     hallucination_silence_threshold: Optional[float]
     hotwords: Optional[str]
+    adaptive_beam: Optional[dict] = None                                                    # JS {"log_prob", "compression_ratio", "no_speech_prob"}
 
 
 @dataclass
@@ -114,6 +118,7 @@ class TranscriptionInfo:
     all_language_probs: Optional[List[Tuple[str, float]]]
     transcription_options: TranscriptionOptions
     vad_options: Optional[VadOptions]
+    adaptive_beam: Optional[dict] = None                                                    # JS {"windows", "escalated"}, counted while the segments are generated
 
 
 class BatchedInferencePipeline:
@@ -123,10 +128,12 @@ def __init__(
     ):
         self.model: WhisperModel = model
         self.last_speech_timestamp = 0.0
+        self.last_speech_timestamps: dict = {}                                              # JS per file (forward with files)
+        self.prepared: Optional[Tuple[Any, Tokenizer, List[dict], TranscriptionOptions]] = None # JS
 
-    def forward(self, features, tokenizer, chunks_metadata, options):
+    def forward(self, features, tokenizer, chunks_metadata, options, prompts=None, files=None): # JS files: file per row (packed)
         encoder_output, outputs = self.generate_segment_batched(
-            features, tokenizer, options
+            features, tokenizer, options, prompts                                           # JS
         )
 
         segmented_outputs = []
@@ -162,20 +169,24 @@ def forward(self, features, tokenizer, chunks_metadata, options):
                         seek=int(
                             chunk_metadata["start_time"] * self.model.frames_per_second
                         ),
+                        prompt=output["prompt"],                                            # JS
                     )
                     for subsegment in subsegments
                 ]
             )
         if options.word_timestamps:
-            self.last_speech_timestamp = self.model.add_word_timestamps(
-                segmented_outputs,
-                tokenizer,
-                encoder_output,
-                segment_sizes,
-                options.prepend_punctuations,
-                options.append_punctuations,
-                self.last_speech_timestamp,
-            )
+            with stage("alignment"):                                                        # JS
+                self.last_speech_timestamp = self.model.add_word_timestamps(
+                    segmented_outputs,
+                    tokenizer,
+                    encoder_output,
+                    segment_sizes,
+                    options.prepend_punctuations,
+                    options.append_punctuations,
+                    self.last_speech_timestamp,
+                    files=files,                                                            # JS
+                    last_speech_timestamps=self.last_speech_timestamps,                     # JS
+                )
 
         return segmented_outputs
 
@@ -184,19 +195,13 @@ def generate_segment_batched(
         features: np.ndarray,
         tokenizer: Tokenizer,
         options: TranscriptionOptions,
+        prompts: Optional[List[List[int]]] = None,                                          # JS one prompt per row (packed files)
     ):
         batch_size = features.shape[0]
 
-        prompt = self.model.get_prompt(
-            tokenizer,
-            previous_tokens=(
-                tokenizer.encode(options.initial_prompt)
-                if options.initial_prompt is not None
-                else []
-            ),
-            without_timestamps=options.without_timestamps,
-            hotwords=options.hotwords,
-        )
+        if prompts is None:                                                                 # JS
+            prompts = [self.get_prompt(tokenizer, options)] * batch_size                    # JS
+        prompt = max(prompts, key=len)                                                      # JS longest -> max_length
 
         if options.max_new_tokens is not None:
             max_length = len(prompt) + options.max_new_tokens
@@ -214,37 +219,38 @@ def generate_segment_batched(
                 f"so that their combined length is less that {self.model.max_length}."
             )
 
-        encoder_output = self.model.encode(features)
-        prompts = [prompt.copy() for _ in range(batch_size)]
+        with stage("encoder"):                                                              # JS
+            encoder_output = self.model.encode(features)
+        prompts = [row_prompt.copy() for row_prompt in prompts]                             # JS
 
         if options.multilingual:
             language_tokens = [
                 tokenizer.tokenizer.token_to_id(segment_langs[0][0])
                 for segment_langs in self.model.model.detect_language(encoder_output)
             ]
-            language_token_index = prompt.index(tokenizer.language)
 
             for i, language_token in enumerate(language_tokens):
-                prompts[i][language_token_index] = language_token
+                prompts[i][prompts[i].index(tokenizer.language)] = language_token           # JS
 
-        results = self.model.model.generate(
-            encoder_output,
-            prompts,
-            beam_size=options.beam_size,
-            patience=options.patience,
-            length_penalty=options.length_penalty,
-            max_length=max_length,
-            suppress_blank=options.suppress_blank,
-            suppress_tokens=options.suppress_tokens,
-            return_scores=True,
-            return_no_speech_prob=True,
-            sampling_temperature=options.temperatures[0],
-            repetition_penalty=options.repetition_penalty,
-            no_repeat_ngram_size=options.no_repeat_ngram_size,
-        )
+        with stage("decoder"):                                                              # JS
+            results = self.model.model.generate(
+                encoder_output,
+                prompts,
+                beam_size=options.beam_size,
+                patience=options.patience,
+                length_penalty=options.length_penalty,
+                max_length=max_length,
+                suppress_blank=options.suppress_blank,
+                suppress_tokens=options.suppress_tokens,
+                return_scores=True,
+                return_no_speech_prob=True,
+                sampling_temperature=options.temperatures[0],
+                repetition_penalty=options.repetition_penalty,
+                no_repeat_ngram_size=options.no_repeat_ngram_size,
+            )
 
         output = []
-        for result in results:
+        for result, result_prompt in zip(results, prompts):                                # JS
             # return scores
             seq_len = len(result.sequences_ids[0])
             cum_logprob = result.scores[0] * (seq_len**options.length_penalty)
@@ -254,11 +260,24 @@ def generate_segment_batched(
                     avg_logprob=cum_logprob / (seq_len + 1),
                     no_speech_prob=result.no_speech_prob,
                     tokens=result.sequences_ids[0],
+                    prompt=result_prompt,                                                   # JS
                 )
             )
 
         return encoder_output, output
 
+    def get_prompt(self, tokenizer: Tokenizer, options: TranscriptionOptions) -> List[int]: # JS
+        return self.model.get_prompt(
+            tokenizer,
+            previous_tokens=(
+                tokenizer.encode(options.initial_prompt)
+                if options.initial_prompt is not None
+                else []
+            ),
+            without_timestamps=options.without_timestamps,
+            hotwords=options.hotwords,
+        )
+
     def transcribe(
         self,
         audio: Union[str, BinaryIO, np.ndarray],
@@ -304,7 +323,8 @@ def transcribe(
         hotwords: Optional[str] = None,
         language_detection_threshold: float = 0.5,
         language_detection_segments: int = 1,
-    ) -> Tuple[Iterable[Segment], TranscriptionInfo]:
+        speech_chunks: Optional[List[dict]] = None,                                          # JS
+    ) -> Tuple[Iterable[Segment], TranscriptionInfo, int, Optional[List[dict]]]:            # JS
         """transcribe audio in chunks in batched fashion and return with language info.
 
         Arguments:
@@ -355,6 +375,8 @@ def transcribe(
             language_detection_threshold: If the maximum probability of the language tokens is
                 higher than this value, the language is detected.
             language_detection_segments: Number of segments to consider for the language detection.
+            speech_chunks: VAD result of this audio (get_speech_timestamps with max_speech_duration_s # JS
+                <= chunk_length, e.g. prefetched) -> merged to clip_timestamps without VAD model   # JS
 
         Unused Arguments
             compression_ratio_threshold: If the gzip compression ratio is above this value,
@@ -380,6 +402,8 @@ def transcribe(
 
             - a generator over transcribed segments
             - an instance of TranscriptionInfo
+            - sampling rate of the VAD speech chunks                                        # JS
+            - VAD speech chunks (None without VAD)                                          # JS
         """
 
         sampling_rate = self.model.feature_extractor.sampling_rate
@@ -391,7 +415,7 @@ def transcribe(
             )
             multilingual = False
 
-        if not isinstance(audio, np.ndarray):
+        if isinstance(audio, str) or hasattr(audio, "read"):                            # JS np.ndarray or PcmAudio (int16 memmap)
             audio = decode_audio(audio, sampling_rate=sampling_rate)
         duration = audio.shape[0] / sampling_rate
 
@@ -409,6 +433,7 @@ def transcribe(
                         min_silence_duration_ms=160,
                     )
                 elif isinstance(vad_parameters, dict):
+                    vad_parameters = dict(vad_parameters)                                   # JS dict of the caller unchanged
                     if "max_speech_duration_s" in vad_parameters.keys():
                         vad_parameters.pop("max_speech_duration_s")
 
@@ -416,7 +441,9 @@ def transcribe(
                         **vad_parameters, max_speech_duration_s=chunk_length
                     )
 
-                active_segments = get_speech_timestamps(audio, vad_parameters)
+                if speech_chunks is None:                                                   # JS
+                    speech_chunks = get_speech_timestamps(audio, vad_parameters)
+                active_segments = [dict(chunk) for chunk in speech_chunks]                  # JS merge_segments changes start/end
                 clip_timestamps = merge_segments(active_segments, vad_parameters)
             # run the audio if it is less than 30 sec even without clip_timestamps
             elif duration < chunk_length:
@@ -540,6 +567,8 @@ def transcribe(
             all_language_probs=all_language_probs,
         )
 
+        self.prepared = (features, tokenizer, chunks_metadata, options)                     # JS windows of this file (packing across files)
+
         segments = self._batched_segments_generator(
             features,
             tokenizer,
@@ -549,7 +578,7 @@ def transcribe(
             log_progress,
         )
 
-        return segments, info
+        return segments, info, sampling_rate, speech_chunks                                 # JS
 
     def _batched_segments_generator(
         self, features, tokenizer, chunks_metadata, batch_size, options, log_progress
@@ -565,31 +594,58 @@ def _batched_segments_generator(
             )
 
             for result in results:
-                for segment in result:
-                    seg_idx += 1
-                    yield Segment(
-                        seek=segment["seek"],
-                        id=seg_idx,
-                        text=segment["text"],
-                        start=round(segment["start"], 3),
-                        end=round(segment["end"], 3),
-                        words=(
-                            None
-                            if not options.word_timestamps
-                            else [Word(**word) for word in segment["words"]]
-                        ),
-                        tokens=segment["tokens"],
-                        avg_logprob=segment["avg_logprob"],
-                        no_speech_prob=segment["no_speech_prob"],
-                        compression_ratio=segment["compression_ratio"],
-                        temperature=options.temperatures[0],
-                    )
+                for segment in self.get_segments(result, tokenizer, options, seg_idx):     # JS
+                    seg_idx = segment.id                                                    # JS
+                    yield segment                                                           # JS
 
                 pbar.update(1)
 
         pbar.close()
         self.last_speech_timestamp = 0.0
 
+    def get_segments(self, result, tokenizer, options, seg_idx):                            # JS subsegments of one window -> Segment (ids after seg_idx)
+        my_prompt  = None                                                                   # JS
+        result_log = None                                                                   # JS
+        if result:                                                                          # JS
+            prompt = result[0]["prompt"]                                                    # JS
+            my_prompt = {                                                                   # JS
+                "text":   tokenizer.decode(prompt),                                         # JS
+                "length": len(prompt),                                                      # JS
+                "token":  prompt,                                                           # JS
+            }                                                                               # JS
+            result_log = []                                                                 # JS no temperature fallback
+
+        for segment in result:
+            text = segment["text"]                                                          # JS same as WhisperModel.generate_segments
+            if segment["start"] == segment["end"] or not text.strip():                      # JS
+                continue                                                                    # JS
+
+            if text[0] != " ":                                                              # JS
+                text = " " + text                                                           # JS
+
+            seg_idx += 1
+            yield Segment(
+                seek=segment["seek"],
+                id=seg_idx,
+                prompt=my_prompt,                                                           # JS
+                result_log=result_log,                                                      # JS
+                text=text,                                                                  # JS
+                start=round(segment["start"], 3),
+                end=round(segment["end"], 3),
+                words=(
+                    None
+                    if not options.word_timestamps
+                    else [Word(**word) for word in segment["words"]]
+                ),
+                tokens=segment["tokens"],
+                avg_logprob=segment["avg_logprob"],
+                no_speech_prob=segment["no_speech_prob"],
+                compression_ratio=segment["compression_ratio"],
+                temperature=options.temperatures[0],
+            )
+            my_prompt  = None                                                               # JS
+            result_log = None                                                               # JS
+
 
 class WhisperModel:
     def __init__(
@@ -756,6 +812,12 @@ def transcribe(
         hotwords: Optional[str] = None,
         language_detection_threshold: float = 0.5,
         language_detection_segments: int = 1,
+        speech_chunks: Optional[List[dict]] = None,                                          # JS
+        features: Optional[Union[np.ndarray, BlockFeatures]] = None,                         # JS
+        block_features: bool = False,                                                       # JS
+        encoder_cache: Optional[Tuple[Any, str]] = None,                                    # JS
+        encoder_lookahead: int = 1,                                                         # JS
+        adaptive_beam: Optional[dict] = None,                                               # JS
     ) -> Tuple[Iterable[Segment], TranscriptionInfo]:
         """Transcribes an input file.
 
@@ -825,6 +887,15 @@ def transcribe(
           language_detection_threshold: If the maximum probability of the language tokens is higher
            than this value, the language is detected.
           language_detection_segments: Number of segments to consider for the language detection.
+          speech_chunks: VAD result of this audio (get_speech_timestamps, e.g. prefetched) # JS
+          features: log-mel of the (VAD filtered) audio, e.g. cached                       # JS
+          block_features: log-mel in 30 sec blocks (BlockFeatures), no concatenated audio   # JS
+          encoder_cache: (cache, key) -> encoder output per window, cache: get(key) / add(key, np.ndarray), # JS
+            key: model + features (e.g. media md5 + VAD + mel parameters), only on cpu      # JS
+          encoder_lookahead: > 1: this window and the next windows (seek + window size) encoded # JS
+            in one batch, used if seek reaches them exactly (otherwise single encodes), only on cpu # JS
+          adaptive_beam: greedy first, beam_size only if the window crosses a limit:     # JS
+            {"log_prob": avg_logprob below, "compression_ratio": above, "no_speech_prob": above} # JS
         Returns:
           A tuple with:
 
@@ -840,7 +911,7 @@ def transcribe(
             )
             multilingual = False
 
-        if not isinstance(audio, np.ndarray):
+        if isinstance(audio, str) or hasattr(audio, "read"):                            # JS np.ndarray or PcmAudio (int16 memmap)
             audio = decode_audio(audio, sampling_rate=sampling_rate)
 
         duration = audio.shape[0] / sampling_rate
@@ -855,10 +926,19 @@ def transcribe(
                 vad_parameters = VadOptions()
             elif isinstance(vad_parameters, dict):
                 vad_parameters = VadOptions(**vad_parameters)
-            speech_chunks = get_speech_timestamps(audio, vad_parameters)
-            audio_chunks, _chunks_metadata = collect_chunks(audio, speech_chunks)
-            audio = np.concatenate(audio_chunks, axis=0)
-            duration_after_vad = audio.shape[0] / sampling_rate
+            if speech_chunks is None:                                                       # JS
+                speech_chunks = get_speech_timestamps(audio, vad_parameters)
+            if features is None and block_features:                                         # JS
+                audio = ConcatenatedChunks(audio, speech_chunks)                            # JS
+                duration_after_vad = len(audio) / sampling_rate                             # JS
+            elif features is None:                                                          # JS
+                audio_chunks, _chunks_metadata = collect_chunks(audio, speech_chunks)
+                audio = np.concatenate(audio_chunks, axis=0)
+                duration_after_vad = audio.shape[0] / sampling_rate
+            else:                                                                           # JS features given -> no float32 copy of the audio
+                duration_after_vad = sum(                                                   # JS
+                    chunk["end"] - chunk["start"] for chunk in speech_chunks                # JS
+                ) / sampling_rate                                                           # JS
 
             self.logger.info(
                 "[transcribe] VAD filter removed %s of audio",                              # JS
@@ -881,7 +961,10 @@ def transcribe(
         else:
             speech_chunks = None
 
-        features = self.feature_extractor(audio, chunk_length=chunk_length)
+        if features is None and block_features:                                             # JS
+            features = BlockFeatures(self.feature_extractor, audio, chunk_length=chunk_length) # JS
+        elif features is None:                                                              # JS
+            features = self.feature_extractor(audio, chunk_length=chunk_length)
 
         encoder_output = None
         all_language_probs = None
@@ -908,7 +991,7 @@ def transcribe(
                     language_probability,
                     all_language_probs,
                 ) = self.detect_language(
-                    features=features[..., seek:],
+                    features=features[..., seek : seek + language_detection_segments * self.feature_extractor.nb_max_frames], # JS only the used windows (BlockFeatures)
                     language_detection_segments=language_detection_segments,
                     language_detection_threshold=language_detection_threshold,
                 )
@@ -964,10 +1047,14 @@ def transcribe(
             clip_timestamps=clip_timestamps,
             hallucination_silence_threshold=hallucination_silence_threshold,
             hotwords=hotwords,
+            adaptive_beam=adaptive_beam,                                                    # JS
         )
 
+        adaptive_stats = {"windows": 0, "escalated": 0} if adaptive_beam else None          # JS
+
         segments = self.generate_segments(
-            features, tokenizer, options, log_progress, encoder_output
+            features, tokenizer, options, log_progress, encoder_output, encoder_cache,      # JS
+            encoder_lookahead, adaptive_stats,                                              # JS
         )
 
         if speech_chunks:
@@ -981,6 +1068,7 @@ def transcribe(
             transcription_options=options,
             vad_options=vad_parameters,
             all_language_probs=all_language_probs,
+            adaptive_beam=adaptive_stats,                                                   # JS
         )
 
         return segments, info, sampling_rate, speech_chunks                                 # JS
@@ -1066,11 +1154,14 @@ def _split_segments_by_timestamps(
 
     def generate_segments(
         self,
-        features: np.ndarray,
+        features: Union[np.ndarray, BlockFeatures],                                          # JS features[:, seek : seek + n] only
         tokenizer: Tokenizer,
         options: TranscriptionOptions,
         log_progress,
         encoder_output: Optional[ctranslate2.StorageView] = None,
+        encoder_cache: Optional[Tuple[Any, str]] = None,                                    # JS
+        encoder_lookahead: int = 1,                                                         # JS
+        adaptive_stats: Optional[dict] = None,                                              # JS
     ) -> Iterable[Segment]:
         content_frames = features.shape[-1] - 1
         content_duration = float(content_frames * self.feature_extractor.time_per_frame)
@@ -1119,6 +1210,11 @@ def generate_segments(
 
         pbar = tqdm(total=content_duration, unit="seconds", disable=not log_progress)
         last_speech_timestamp = 0.0
+
+        lookahead: dict = {}                                                                # JS seek -> (segment_size, encoder output)
+        window_end = seek                                                                   # JS end of the previous window
+        if self.model.device != "cpu":                                                      # JS batch split via numpy
+            encoder_lookahead = 1                                                           # JS
         # NOTE: This loop is obscurely flattened to make the diff readable.
         # A later commit should turn this into a simpler nested loop.
         # for seek_clip_start, seek_clip_end in seek_clips:
@@ -1150,9 +1246,9 @@ def generate_segments(
                 content_frames - seek,
                 seek_clip_end - seek,
             )
-            segment = features[:, seek : seek + segment_size]
             segment_duration = segment_size * self.feature_extractor.time_per_frame
-            segment = pad_or_trim(segment)
+            predictable = seek == window_end                                                # JS previous window complete -> next windows on the grid
+            window_end = seek + segment_size                                                # JS
 
             if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
@@ -1162,7 +1258,22 @@ def generate_segments(
             previous_tokens = all_tokens[prompt_reset_since:]
 
             if seek > 0 or encoder_output is None:
-                encoder_output = self.encode(segment)
+                with stage("encoder"):                                                      # JS
+                    if seek in lookahead and lookahead[seek][0] == segment_size:            # JS predicted window
+                        encoder_output = lookahead.pop(seek)[1]                             # JS
+                    else:                                                                   # JS
+                        lookahead.clear()                                                   # JS seek off the grid -> single encodes
+                        windows = [(seek, segment_size)]                                    # JS
+                        start = seek + segment_size                                         # JS
+                        while predictable and len(windows) < encoder_lookahead and start < min(content_frames, seek_clip_end): # JS
+                            size = min(self.feature_extractor.nb_max_frames, content_frames - start, seek_clip_end - start) # JS
+                            windows.append((start, size))                                   # JS
+                            start += size                                                   # JS
+
+                        outputs = self.encode_windows(features, windows, encoder_cache)     # JS
+                        encoder_output = outputs[0]                                         # JS
+                        for (start, size), output in zip(windows[1:], outputs[1:]):         # JS
+                            lookahead[start] = (size, output)                               # JS
 
             if options.multilingual:
                 results = self.model.detect_language(encoder_output)
@@ -1190,13 +1301,14 @@ def generate_segments(
             if seek > 0 and segment_size < 3000:                                                        # JS
                 special_lastsegment = True                                                              # JS
 
-            (
-                result,
-                avg_logprob,
-                temperature,
-                compression_ratio,
-                result_log,                                                                                  # JS
-            ) = self.generate_with_fallback(encoder_output, prompt, tokenizer, options, special_lastsegment) # JS
+            with stage("decoder"):                                                                           # JS
+                (
+                    result,
+                    avg_logprob,
+                    temperature,
+                    compression_ratio,
+                    result_log,                                                                              # JS
+                ) = self.generate_with_fallback(encoder_output, prompt, tokenizer, options, special_lastsegment, adaptive_stats) # JS
 
             if options.no_speech_threshold is not None:
                 # no voice activity check
@@ -1273,15 +1385,16 @@ def next_words_segment(segments: List[dict]) -> Optional[dict]:
             )
 
             if options.word_timestamps:
-                self.add_word_timestamps(
-                    [current_segments],
-                    tokenizer,
-                    encoder_output,
-                    segment_size,
-                    options.prepend_punctuations,
-                    options.append_punctuations,
-                    last_speech_timestamp=last_speech_timestamp,
-                )
+                with stage("alignment"):                                                    # JS
+                    self.add_word_timestamps(
+                        [current_segments],
+                        tokenizer,
+                        encoder_output,
+                        segment_size,
+                        options.prepend_punctuations,
+                        options.append_punctuations,
+                        last_speech_timestamp=last_speech_timestamp,
+                    )
                 if not single_timestamp_ending:
                     last_word_end = get_end(current_segments)
                     if last_word_end is not None and last_word_end > time_offset:
@@ -1413,6 +1526,72 @@ def encode(self, features: np.ndarray) -> ctranslate2.StorageView:
 
         return self.model.encode(features, to_cpu=to_cpu)
 
+    def encode_window(                                                                      # JS
+        self,
+        features: Union[np.ndarray, BlockFeatures],
+        seek: int,
+        segment_size: int,
+        encoder_cache: Optional[Tuple[Any, str]] = None,
+    ) -> ctranslate2.StorageView:
+        """JS: encoder output of features[:, seek : seek + segment_size] (padded to the window).
+
+        The encoder input depends only on the audio (prompt, beam size, temperature -> decoder),
+        encoder_cache (cache, key) -> same window of the same model and audio not encoded again.
+        """
+        if encoder_cache is None or self.model.device != "cpu":
+            return self.encode(pad_or_trim(features[:, seek : seek + segment_size]))
+
+        cache, key = encoder_cache
+        key = f"{key}-{seek}-{segment_size}"
+
+        cached = cache.get(key)
+        if cached is not None:
+            return ctranslate2.StorageView.from_array(cached)                               # no copy, the view holds the array
+
+        encoder_output = self.encode(pad_or_trim(features[:, seek : seek + segment_size]))
+        cache.add(key, np.array(encoder_output))                                            # copy of the cpu StorageView
+
+        return encoder_output
+
+    def encode_windows(                                                                     # JS
+        self,
+        features: Union[np.ndarray, BlockFeatures],
+        windows: List[Tuple[int, int]],
+        encoder_cache: Optional[Tuple[Any, str]] = None,
+    ) -> List[ctranslate2.StorageView]:
+        """JS: encoder outputs of the windows (seek, segment_size), all missing windows in one batch (cpu).
+
+        The rows of the batch match single encodes within float tolerance (same padded length of the window),
+        checked per model with benchmark.py encoder.
+        """
+        if len(windows) == 1:
+            return [self.encode_window(features, *windows[0], encoder_cache)]
+
+        outputs: List[Optional[ctranslate2.StorageView]] = [None] * len(windows)
+        if encoder_cache is not None:
+            cache, key = encoder_cache
+            for i, (seek, segment_size) in enumerate(windows):
+                cached = cache.get(f"{key}-{seek}-{segment_size}")
+                if cached is not None:
+                    outputs[i] = ctranslate2.StorageView.from_array(cached)
+
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if missing:
+            batch = np.stack(
+                [
+                    pad_or_trim(features[:, windows[i][0] : windows[i][0] + windows[i][1]])
+                    for i in missing
+                ]
+            )
+            encoded = np.array(self.encode(batch))                                          # cpu StorageView -> rows
+            for row, i in enumerate(missing):
+                output = encoded[row : row + 1]
+                outputs[i] = ctranslate2.StorageView.from_array(output)
+                if encoder_cache is not None:
+                    cache.add(f"{key}-{windows[i][0]}-{windows[i][1]}", output.copy())
+
+        return outputs
+
     def generate_with_fallback(
         self,
         encoder_output: ctranslate2.StorageView,
@@ -1421,6 +1600,7 @@ def generate_with_fallback(
         options: TranscriptionOptions,
 
         special_lastsegment: bool,                                                        # JS
+        adaptive_stats: Optional[dict] = None,                                            # JS
     ) -> Tuple[ctranslate2.models.WhisperGenerationResult, float, float, float, dict]:    # JS add , dict
         decode_result = None
         all_results = []
@@ -1458,6 +1638,7 @@ def generate_with_fallback(
                     f"[generate_with_fallback] current temperature: {temperature}"        # JS
                 )
 
+            adaptive = False                                                               # JS
             if temperature > 0:
                 # kwargs = {
                 #    "beam_size": 1,
@@ -1498,36 +1679,33 @@ def generate_with_fallback(
                     "beam_size": options.beam_size,
                     "patience": options.patience,
                 }
+                adaptive = options.adaptive_beam is not None and options.beam_size > 1     # JS greedy first
 
             if self.logger.isEnabledFor(logging.DEBUG):                                    # JS
                self.logger.debug(                                                          # JS
                    f"[generate_with_fallback] {kwargs}, prompt length: {len(prompt)}" # JS
                )                                                                           # JS
 
-            result = self.model.generate(
-                encoder_output,
-                [prompt],
-                length_penalty=options.length_penalty,
-                repetition_penalty=options.repetition_penalty,
-                no_repeat_ngram_size=options.no_repeat_ngram_size,
-                max_length=max_length,
-                return_scores=True,
-                return_no_speech_prob=True,
-                suppress_blank=options.suppress_blank,
-                suppress_tokens=options.suppress_tokens,
-                max_initial_timestamp_index=max_initial_timestamp_index,
-                **kwargs,
-            )[0]
-
-            tokens = result.sequences_ids[0]
-
-            # Recover the average log prob from the returned score.
-            seq_len = len(tokens)
-            cum_logprob = result.scores[0] * (seq_len**options.length_penalty)
-            avg_logprob = cum_logprob / (seq_len + 1)
-
-            text = tokenizer.decode(tokens).strip()
-            compression_ratio = get_compression_ratio(text)
+            result, avg_logprob, text, compression_ratio = self.decode_window(                 # JS
+                encoder_output, prompt, tokenizer, options, max_length,                     # JS
+                max_initial_timestamp_index, {"beam_size": 1} if adaptive else kwargs,      # JS
+            )                                                                               # JS
+
+            if adaptive:                                                                    # JS
+                escalate = self.needs_beam(options.adaptive_beam, result, avg_logprob, compression_ratio) # JS
+                if adaptive_stats is not None:                                              # JS
+                    adaptive_stats["windows"] += 1                                          # JS
+                    adaptive_stats["escalated"] += int(escalate)                            # JS
+                if escalate:                                                                # JS
+                    if self.logger.isEnabledFor(logging.DEBUG):                             # JS
+                        self.logger.debug(                                                  # JS
+                            f"[generate_with_fallback] greedy: avg_logprob {avg_logprob:.3f}, " # JS
+                            f"compression_ratio {compression_ratio:.2f}, no_speech_prob {result.no_speech_prob:.3f} -> {kwargs}" # JS
+                        )                                                                   # JS
+                    result, avg_logprob, text, compression_ratio = self.decode_window(         # JS
+                        encoder_output, prompt, tokenizer, options, max_length,             # JS
+                        max_initial_timestamp_index, kwargs,                                # JS
+                    )                                                                       # JS
 
             decode_result = (
                 result,
@@ -1633,6 +1811,63 @@ def generate_with_fallback(
 
         return decode_result
 
+    def decode_window(                                                                      # JS
+        self,
+        encoder_output: ctranslate2.StorageView,
+        prompt: List[int],
+        tokenizer: Tokenizer,
+        options: TranscriptionOptions,
+        max_length: int,
+        max_initial_timestamp_index: int,
+        kwargs: dict,
+    ) -> Tuple[ctranslate2.models.WhisperGenerationResult, float, str, float]:
+        """JS: one generate call of generate_with_fallback -> result, avg_logprob, text, compression_ratio."""
+        result = self.model.generate(
+            encoder_output,
+            [prompt],
+            length_penalty=options.length_penalty,
+            repetition_penalty=options.repetition_penalty,
+            no_repeat_ngram_size=options.no_repeat_ngram_size,
+            max_length=max_length,
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=options.suppress_blank,
+            suppress_tokens=options.suppress_tokens,
+            max_initial_timestamp_index=max_initial_timestamp_index,
+            **kwargs,
+        )[0]
+
+        tokens = result.sequences_ids[0]
+
+        # Recover the average log prob from the returned score.
+        seq_len = len(tokens)
+        cum_logprob = result.scores[0] * (seq_len**options.length_penalty)
+        avg_logprob = cum_logprob / (seq_len + 1)
+
+        text = tokenizer.decode(tokens).strip()
+        compression_ratio = get_compression_ratio(text)
+
+        return result, avg_logprob, text, compression_ratio
+
+    @staticmethod
+    def needs_beam(                                                                         # JS
+        limits: dict,
+        result: ctranslate2.models.WhisperGenerationResult,
+        avg_logprob: float,
+        compression_ratio: float,
+    ) -> bool:
+        """JS: greedy result of a window not confident enough -> decoded again with beam_size."""
+        log_prob = limits.get("log_prob")
+        if log_prob is not None and avg_logprob < log_prob:
+            return True
+
+        max_compression_ratio = limits.get("compression_ratio")
+        if max_compression_ratio is not None and compression_ratio > max_compression_ratio:
+            return True
+
+        no_speech_prob = limits.get("no_speech_prob")
+        return no_speech_prob is not None and result.no_speech_prob > no_speech_prob
+
     def get_prompt(
         self,
         tokenizer: Tokenizer,
@@ -1699,6 +1934,8 @@ def add_word_timestamps(
         prepend_punctuations: str,
         append_punctuations: str,
         last_speech_timestamp: Union[float, None],
+        files: Optional[List[int]] = None,                                                  # JS file per segment (packed rows)
+        last_speech_timestamps: Optional[dict] = None,                                      # JS file -> last_speech_timestamp, updated
     ) -> Optional[float]:
         if len(segments) == 0:
             return
@@ -1745,6 +1982,8 @@ def add_word_timestamps(
             median_max_durations.append((median_duration, max_duration))
 
         for segment_idx, segment in enumerate(segments):
+            if files is not None:                                                          # JS
+                last_speech_timestamp = last_speech_timestamps.get(files[segment_idx], 0.0) # JS
             word_index = 0
             time_offset = segment[0]["seek"] / self.frames_per_second
             median_duration, max_duration = median_max_durations[segment_idx]
@@ -1823,6 +2062,8 @@ def add_word_timestamps(
 
                     last_speech_timestamp = subsegment["end"]
                 segments[segment_idx][subsegment_idx]["words"] = words
+            if files is not None:                                                          # JS
+                last_speech_timestamps[files[segment_idx]] = last_speech_timestamp         # JS
         return last_speech_timestamp
 
     def find_alignment(
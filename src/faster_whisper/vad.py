@@ -47,14 +47,20 @@ def get_speech_timestamps(
     audio: np.ndarray,
     vad_options: Optional[Union[dict, VadOptions]] = None,
     sampling_rate: int = 16000,
+    threads: int = 1,                                                               # JS
+    stretch_samples: int = 0,                                                       # JS
+    warmup_samples: int = 0,                                                        # JS
     **kwargs,
 ) -> List[dict]:
     """This method is used for splitting long audios into speech chunks using silero VAD.
 
     Args:
-      audio: One dimensional float array.
+      audio: One dimensional float array (or PcmAudio).                             # JS
       vad_options: Options for VAD processing.
       sampling rate: Sampling rate of the audio.
+      threads: intra op threads of the ONNX sessions.                               # JS
+      stretch_samples: > 0: independent stretches of this length in one batch       # JS
+        (state reset after 'warmup_samples' of the previous stretch).               # JS
       kwargs: VAD options passed as keyword arguments for backward compatibility.
 
     Returns:
@@ -63,6 +69,67 @@ def get_speech_timestamps(
     if vad_options is None:
         vad_options = VadOptions(**kwargs)
 
+    return get_speech_timestamps_batch(                                             # JS
+        [audio], vad_options, sampling_rate, threads, stretch_samples, warmup_samples # JS
+    )[0]                                                                            # JS
+
+
+def get_speech_timestamps_batch(                                                    # JS
+    audios: List[np.ndarray],
+    vad_options: Optional[Union[dict, VadOptions]] = None,
+    sampling_rate: int = 16000,
+    threads: int = 1,
+    stretch_samples: int = 0,
+    warmup_samples: int = 0,
+) -> List[List[dict]]:
+    """Speech timestamps of several audios (files) in one batch.
+
+    Every audio (or every stretch of an audio) is one row of the batch,
+    one decoder call per window for all rows.
+
+    stretch_samples == 0: same probabilities as one audio after the other.
+    """
+    if vad_options is None:
+        vad_options = VadOptions()
+    elif isinstance(vad_options, dict):
+        vad_options = VadOptions(**vad_options)
+
+    window_size_samples = 512
+
+    rows = []
+    for index, audio in enumerate(audios):
+        length = len(audio)
+        if stretch_samples <= 0 or length <= stretch_samples:
+            rows.append((index, audio, 0, length, 0, True))
+            continue
+
+        stretch = max(1, stretch_samples // window_size_samples) * window_size_samples
+        warmup = warmup_samples // window_size_samples * window_size_samples
+        for start in range(0, length, stretch):
+            begin = max(0, start - warmup)
+            last = start + stretch >= length
+            rows.append((index, audio, begin, length if last else start + stretch, start - begin, last))
+
+    model = get_vad_model(threads)
+    probs = model.speech_probs([(audio, begin, end) for _index, audio, begin, end, _skip, _last in rows])
+
+    speech_probs = [[] for _ in audios]
+    for (index, _audio, begin, end, skip, last), row_probs in zip(rows, probs):
+        count = None if last else (end - begin) // window_size_samples  # not last -> without the padding window
+        speech_probs[index].append(row_probs[skip // window_size_samples : count])
+
+    return [
+        _get_timestamps(np.concatenate(probs), len(audio), vad_options, sampling_rate)
+        for probs, audio in zip(speech_probs, audios)
+    ]
+
+
+def _get_timestamps(                                                                # JS
+    speech_probs: np.ndarray,
+    audio_length_samples: int,
+    vad_options: VadOptions,
+    sampling_rate: int,
+) -> List[dict]:
     threshold = vad_options.threshold
     neg_threshold = vad_options.neg_threshold
     min_speech_duration_ms = vad_options.min_speech_duration_ms
@@ -84,15 +151,6 @@ def get_speech_timestamps(
     min_silence_samples = sampling_rate * min_silence_duration_ms / 1000
     min_silence_samples_at_max_speech = sampling_rate * 98 / 1000
 
-    audio_length_samples = len(audio)
-
-    model = get_vad_model()
-
-    padded_audio = np.pad(
-        audio, (0, window_size_samples - audio.shape[0] % window_size_samples)
-    )
-    speech_probs = model(padded_audio.reshape(1, -1)).squeeze(0)
-
     triggered = False
     speeches = []
     current_speech = {}
@@ -211,6 +269,61 @@ def collect_chunks(
     return audio_chunks, chunks_metadata
 
 
+class ConcatenatedChunks:                                                           # JS
+    """JS: speech chunks of the audio as one waveform without the copy (np.concatenate of collect_chunks).
+
+    len(audio), audio[start:end] -> float32 (only the pieces of the slice), audio: np.ndarray or PcmAudio
+    """
+
+    def __init__(self, audio, chunks: List[dict]):
+        self.audio = audio
+        self.chunks = chunks
+        self.offsets = [0]
+        for chunk in chunks:
+            self.offsets.append(self.offsets[-1] + chunk["end"] - chunk["start"])
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return (self.offsets[-1],)
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float32)
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def __getitem__(self, key: slice) -> np.ndarray:
+        start, end, step = key.indices(len(self))
+        if step != 1:
+            raise IndexError("ConcatenatedChunks: no step")
+
+        pieces = []
+        index = max(0, bisect.bisect_right(self.offsets, start) - 1)
+        while index < len(self.chunks) and self.offsets[index] < end:
+            chunk_start = self.chunks[index]["start"] - self.offsets[index]
+            pieces.append(
+                self.audio[
+                    chunk_start + max(start, self.offsets[index]) :
+                    chunk_start + min(end, self.offsets[index + 1])
+                ]
+            )
+            index += 1
+
+        if not pieces:
+            return np.zeros(0, dtype=np.float32)
+        audio = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+        return audio if audio.dtype == np.float32 else audio.astype(np.float32)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        audio = self[:]
+        return audio if dtype is None else audio.astype(dtype)
+
+
 class SpeechTimestampsMap:
     """Helper class to restore original speech timestamps."""
 
@@ -250,15 +363,15 @@ def get_chunk_index(self, time: float) -> int:
 
 
 @functools.lru_cache
-def get_vad_model():
+def get_vad_model(threads: int = 1):                                                # JS
     """Returns the VAD model instance."""
     encoder_path = os.path.join(get_assets_path(), "silero_encoder_v5.onnx")
     decoder_path = os.path.join(get_assets_path(), "silero_decoder_v5.onnx")
-    return SileroVADModel(encoder_path, decoder_path)
+    return SileroVADModel(encoder_path, decoder_path, threads)                      # JS
 
 
 class SileroVADModel:
-    def __init__(self, encoder_path, decoder_path):
+    def __init__(self, encoder_path, decoder_path, threads: int = 1):              # JS
         try:
             import onnxruntime
         except ImportError as e:
@@ -268,7 +381,7 @@ def __init__(self, encoder_path, decoder_path):
 
         opts = onnxruntime.SessionOptions()
         opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
+        opts.intra_op_num_threads = threads                                         # JS
         opts.enable_cpu_mem_arena = False
         opts.log_severity_level = 4
 
@@ -286,6 +399,20 @@ def __init__(self, encoder_path, decoder_path):
     def __call__(
         self, audio: np.ndarray, num_samples: int = 512, context_size_samples: int = 64
     ):
+        out, _state, _context = self.run_block(                                     # JS
+            audio, num_samples, context_size_samples, None, None, True              # JS
+        )                                                                           # JS
+        return out                                                                  # JS
+
+    def run_block(                                                                  # JS
+        self,
+        audio: np.ndarray,
+        num_samples: int,
+        context_size_samples: int,
+        state: Optional[np.ndarray],                                                # JS decoder state of the previous block
+        context: Optional[np.ndarray],                                              # JS last samples of the previous block
+        last: bool,                                                                 # JS
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:                                 # JS
         assert (
             audio.ndim == 2
         ), "Input should be a 2D array with size (batch_size, num_samples)"
@@ -295,17 +422,17 @@ def __call__(
 
         batch_size = audio.shape[0]
 
-        state = np.zeros((2, batch_size, 128), dtype="float32")
-        context = np.zeros(
-            (batch_size, context_size_samples),
-            dtype="float32",
-        )
+        if state is None:                                                           # JS
+            state = np.zeros((2, batch_size, 128), dtype="float32")
 
         batched_audio = audio.reshape(batch_size, -1, num_samples)
-        context = batched_audio[..., -context_size_samples:]
-        context[:, -1] = 0
-        context = np.roll(context, 1, 1)
-        batched_audio = np.concatenate([context, batched_audio], 2)
+        next_context = batched_audio[:, -1, -context_size_samples:].copy()          # JS
+        contexts = batched_audio[..., -context_size_samples:]                       # JS
+        if last:                                                                    # JS
+            contexts[:, -1] = 0
+        contexts = np.roll(contexts, 1, 1)                                          # JS
+        contexts[:, 0] = 0 if context is None else context                          # JS
+        batched_audio = np.concatenate([contexts, batched_audio], 2)                # JS
 
         batched_audio = batched_audio.reshape(-1, num_samples + context_size_samples)
 
@@ -329,7 +456,72 @@ def __call__(
             decoder_outputs.append(out)
 
         out = np.stack(decoder_outputs, axis=1).squeeze(-1)
-        return out
+        return out, state, next_context                                             # JS
+
+    def speech_probs(                                                               # JS
+        self,
+        sources: List[Tuple[np.ndarray, int, int]],
+        num_samples: int = 512,
+        context_size_samples: int = 64,
+        block_samples: int = 512 * 8192,
+    ) -> List[np.ndarray]:
+        """Speech probabilities of several sources (audio, start, end) in one batch.
+
+        Block-wise (all rows in lockstep, state + context carried over), float32 only per block
+        -> audio may be a PcmAudio (int16 memmap). The end of every source is handled like
+        one call of the complete source (padding window, last context samples = 0).
+        """
+        rows = len(sources)
+        block = max(num_samples, block_samples // max(rows, 1) // num_samples * num_samples)
+
+        probs = [[] for _ in sources]
+        states = np.zeros((2, rows, 128), dtype="float32")
+        contexts = np.zeros((rows, context_size_samples), dtype="float32")
+
+        offset = 0
+        while True:
+            active = [row for row, (_audio, start, end) in enumerate(sources) if offset <= end - start]
+            if not active:  # finished sources are not computed any more
+                break
+
+            blocks = []
+            widths = []
+            for row in active:
+                audio, start, end = sources[row]
+                length = end - start
+
+                samples = np.asarray(
+                    audio[start + offset : start + min(offset + block, length)], dtype=np.float32
+                )
+                width = samples.shape[0]
+                if offset + block > length:  # last block of this source: padding window
+                    width += num_samples - width % num_samples
+                blocks.append(samples)
+                widths.append(width)
+
+            batch = np.zeros((len(active), max(widths)), dtype=np.float32)  # only the last blocks are shorter
+            for index, samples in enumerate(blocks):
+                batch[index, : samples.shape[0]] = samples
+                if samples.shape[0] < block:  # last block: last context samples = 0 (as one call)
+                    batch[index, widths[index] - context_size_samples : widths[index]] = 0
+
+            out, state, context = self.run_block(
+                batch,
+                num_samples,
+                context_size_samples,
+                states[:, active],
+                contexts[active] if offset > 0 else None,
+                False,
+            )
+            states[:, active] = state
+            contexts[active] = context
+
+            for index, row in enumerate(active):
+                probs[row].append(out[index, : widths[index] // num_samples])
+
+            offset += block
+
+        return [np.concatenate(row_probs) for row_probs in probs]
 
 
 def merge_segments(segments_list, vad_options: VadOptions, sampling_rate: int = 16000):
@@ -0,0 +1,159 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 21:15
+
+    src/helper/convert.py
+
+    PUBLIC:
+     - get_convert_workers() -> int
+
+     - class AudioConverter:
+        - AudioConverter(ffmpeg: str, workers: int)
+        - add(self, path_settings: Path, source: Path, dest_path: Path, mode: str, sampling: int = 16000, channels: int = 1, filter_path: None | str = None, filter_name: None | str = None) -> None
+        - run(self) -> Dict[str, Any]
+
+    PRIVATE:
+     - AudioConverter._convert(self, key: str, source: Path, dest: Path, params: Dict) -> Tuple[str, None | Dict, float]
+     - _relative(filepath: Path, root: Path) -> str
+
+    base.yaml:
+      ffmpeg:
+        workers: 0   # parallel ffmpeg processes, 0 -> cpu count
+
+    all tasks (e.g. all projects of a delivery) in one pool -> 'workers' ffmpeg processes at the same time
+
+    <project>/04_settings/conversions.json
+     - per destination: md5 of the source (FingerprintIndex -> 04_settings/fingerprints.json) + conversion parameters
+     - same source and same parameters and destination exists -> skip (no ffmpeg)
+     - destination exists without entry (converted before the index) -> adopted
+     - source or parameters changed -> converted again
+
+    throughput: seconds of converted audio (MediaInfo of the source) per wall second
+"""
+from __future__ import annotations
+
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from helper.fingerprint import FingerprintIndex
+from utils.audio import AUDIO_SUFFIX, get_ffmpeg_command, get_part_filepath, run_ffmpeg
+from utils.file import export_json, import_json
+from utils.prefs import Prefs
+from utils.trace import Trace
+
+CONVERSION_VERSION: int = 1
+
+def get_convert_workers() -> int:
+    workers = int(Prefs.get("ffmpeg.workers", 0))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    return workers
+
+class AudioConverter:
+    def __init__(self, ffmpeg: str, workers: int) -> None:
+        super().__init__()
+
+        self.ffmpeg  = ffmpeg
+        self.workers = max(1, workers)
+
+        self.tasks:       List[Tuple[str, Path, Path, Dict[str, Any]]] = []
+        self.indexes:     Dict[str, FingerprintIndex] = {}
+        self.conversions: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, path_settings: Path, source: Path, dest_path: Path, mode: str, sampling: int = 16000, channels: int = 1, filter_path: None | str = None, filter_name: None | str = None) -> None:
+        key = str(path_settings)
+        if key not in self.indexes:
+            self.indexes[key] = FingerprintIndex(path_settings)
+
+            data = import_json(path_settings, "conversions.json", show_error=False)
+            if data is None or data.get("version") != CONVERSION_VERSION:
+                self.conversions[key] = {}
+            else:
+                self.conversions[key] = data["files"]
+
+        params: Dict[str, Any] = {"mode": mode}
+        if mode != "split":
+            params["sampling"] = sampling
+            params["channels"] = channels
+        if mode == "filter":
+            params["filter_path"] = filter_path
+            params["filter_name"] = filter_name
+
+        dest = dest_path / (source.stem + AUDIO_SUFFIX[mode])
+        if dest.resolve() == source.resolve():
+            Trace.error(f"dest == source -> not converted: {source}")
+            return
+
+        self.tasks.append((key, source, dest, params))
+
+    def run(self) -> Dict[str, Any]:
+        count = {"converted": 0, "skipped": 0, "adopted": 0, "failed": 0}
+        audio = 0.0
+
+        start_time = time.perf_counter()
+        changed: Set[str] = set()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor: # ffmpeg -> own process, the thread only waits
+            futures = {executor.submit(self._convert, key, source, dest, params): (key, dest) for key, source, dest, params in self.tasks}
+
+            for future in as_completed(futures):
+                key, dest = futures[future]
+                status, entry, duration = future.result()
+
+                count[status] += 1
+                if entry is not None:
+                    self.conversions[key][_relative(dest, Path(key).parent)] = entry
+                    changed.add(key)
+                if status == "converted":
+                    audio += duration
+
+        wall = time.perf_counter() - start_time
+
+        for key in changed:
+            export_json(Path(key), "conversions.json", {"version": CONVERSION_VERSION, "files": self.conversions[key]}, show_message=False)
+        for index in self.indexes.values():
+            index.flush()
+
+        throughput = audio / wall if wall > 0 else 0.0
+        Trace.result(
+            f"ffmpeg ({self.workers} worker): {count['converted']} converted, {count['skipped']} unchanged, {count['adopted']} adopted, {count['failed']} failed"
+            f" - {audio:.0f} sec audio in {wall:.1f} sec ({throughput:.1f} sec audio/sec)",
+        )
+        self.tasks = []
+
+        return {**count, "audio": round(audio, 3), "wall": round(wall, 3), "throughput": round(throughput, 1)}
+
+    def _convert(self, key: str, source: Path, dest: Path, params: Dict[str, Any]) -> Tuple[str, None | Dict[str, Any], float]:
+        fingerprint = self.indexes[key].get(source)
+        if fingerprint is None:
+            Trace.error(f"source not found: {source}")
+            return "failed", None, 0.0
+
+        entry = {"source": fingerprint["md5"], "params": params}
+        duration = (fingerprint["mediaInfo"] or {}).get("duration", 0.0)
+
+        if dest.is_file():
+            known = self.conversions[key].get(_relative(dest, Path(key).parent))
+            if known is None:
+                return "adopted", entry, 0.0
+            if known == entry:
+                return "skipped", None, 0.0
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part = get_part_filepath(dest)
+
+        if not run_ffmpeg(get_ffmpeg_command(self.ffmpeg, source, part, **params)):
+            part.unlink(missing_ok=True)
+            return "failed", None, 0.0
+
+        part.replace(dest)
+        Trace.info(f"converted: {dest}")
+
+        return "converted", entry, duration
+
+def _relative(filepath: Path, root: Path) -> str:
+    return Path(os.path.relpath(filepath, root)).as_posix()
@@ -0,0 +1,90 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 18:20
+
+    src/helper/fingerprint.py
+
+    PUBLIC:
+     - class FingerprintIndex:
+        - FingerprintIndex(path: Path | str)
+        - get(self, filepath: Path) -> None | Dict
+        - flush(self) -> None
+
+    <project>/04_settings/fingerprints.json
+
+    per media file (key: path relative to the project, e.g. "03_audio/wav/<media>.wav")
+     - size, mtime_ns -> unchanged: md5 + media info from the index (no read of the media file)
+     - md5            -> in chunks (get_stream_md5)
+     - mediaInfo      -> get_media_info (headers only, same file handle)
+
+    get is thread-safe (AudioConverter: fingerprints in the ffmpeg worker threads)
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+from pathlib import Path
+from typing import Any, Dict
+
+from utils.file import export_json, get_stream_md5, import_json
+from utils.metadata import get_media_info
+from utils.trace import Trace
+
+FINGERPRINT_VERSION: int = 1
+
+class FingerprintIndex:
+    def __init__(self, path: Path | str) -> None:
+        super().__init__()
+
+        self.path     = Path(path)
+        self.filename = "fingerprints.json"
+        self.changed  = False
+        self.hashed   = 0
+        self.lock     = threading.Lock()
+
+        data = import_json(self.path, self.filename, show_error=False)
+        if data is None or data.get("version") != FINGERPRINT_VERSION:
+            self.files: Dict[str, Any] = {}
+        else:
+            self.files = data["files"]
+
+    def get(self, filepath: Path) -> None | Dict[str, Any]:
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+
+        key = Path(os.path.relpath(filepath, self.path.parent)).as_posix()
+
+        entry = self.files.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+
+        with filepath.open(mode="rb") as f:
+            md5 = get_stream_md5(f)
+            f.seek(0)
+            media_info = get_media_info(f)
+
+        if media_info is None:
+            Trace.error(f"no media info: {filepath}")
+
+        entry = {
+            "size":      stat.st_size,
+            "mtime_ns":  stat.st_mtime_ns,
+            "md5":       md5,
+            "mediaInfo": media_info,
+        }
+        with self.lock:
+            self.files[key] = entry
+            self.changed = True
+            self.hashed += 1
+
+        return entry
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.changed:
+                return
+
+            export_json(self.path, self.filename, {"version": FINGERPRINT_VERSION, "files": self.files}, show_message=False)
+            self.changed = False
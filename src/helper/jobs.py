@@ -0,0 +1,135 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 15:40
+
+    src/helper/jobs.py
+
+    PUBLIC:
+     - class JobQueue:
+        - JobQueue(run: Callable[[Dict, threading.Event], None])
+        - submit(self, spec: Dict) -> Dict
+        - status(self, job_id: str) -> None | Dict
+        - list(self) -> List[Dict]
+        - cancel(self, job_id: str) -> None | Dict
+        - stop(self) -> None
+
+    one worker thread -> jobs are processed one after the other (the warm models are not shared between jobs)
+
+    job states: "queued" -> "running" -> "done" | "failed" | "cancelled"
+     - cancel "queued":  removed from the queue
+     - cancel "running": cancel event -> run_model stops before the next media file
+"""
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+import time
+
+from typing import Any, Callable, Dict, List
+
+from utils.trace import Trace
+
+class JobQueue:
+    def __init__(self, run: Callable[[Dict[str, Any], threading.Event], None]) -> None:
+        super().__init__()
+
+        self.run     = run
+        self.lock    = threading.Lock()
+        self.queue: queue.Queue[str | None] = queue.Queue()
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.events: Dict[str, threading.Event] = {}
+        self.counter = itertools.count(1)
+
+        self.thread = threading.Thread(target=self._worker, name="jobs", daemon=True)
+        self.thread.start()
+
+    def submit(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            job_id = f"{next(self.counter):04d}"
+
+            self.jobs[job_id] = {
+                "id":       job_id,
+                "state":    "queued",
+                "spec":     spec,
+                "queued":   time.time(),
+                "started":  None,
+                "finished": None,
+                "error":    None,
+            }
+            self.events[job_id] = threading.Event()
+
+        self.queue.put(job_id)
+        Trace.info(f"job {job_id} queued")
+
+        return self.status(job_id) or {}
+
+    def status(self, job_id: str) -> None | Dict[str, Any]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [dict(job) for job in self.jobs.values()]
+
+    def cancel(self, job_id: str) -> None | Dict[str, Any]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+
+            if job["state"] == "queued":
+                job["state"]    = "cancelled"
+                job["finished"] = time.time()
+            elif job["state"] == "running":
+                self.events[job_id].set()
+
+        Trace.info(f"job {job_id} cancel")
+        return self.status(job_id)
+
+    def stop(self) -> None:
+        with self.lock:
+            for job_id, job in self.jobs.items():
+                if job["state"] == "running":
+                    self.events[job_id].set()
+
+        self.queue.put(None)
+        self.thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            job_id = self.queue.get()
+            if job_id is None:
+                break
+
+            with self.lock:
+                job = self.jobs[job_id]
+                if job["state"] != "queued":
+                    continue
+
+                job["state"]   = "running"
+                job["started"] = time.time()
+                spec   = job["spec"]
+                cancel = self.events[job_id]
+
+            Trace.action(f"job {job_id} started")
+
+            state = "done"
+            error = None
+            try:
+                self.run(spec, cancel)
+                if cancel.is_set():
+                    state = "cancelled"
+            except SystemExit as e: # Trace.fatal -> the job fails, not the daemon
+                state = "failed"
+                error = str(e) or "fatal (see trace)"
+            except Exception as e:  # noqa: BLE001 # same as SystemExit
+                state = "failed"
+                error = f"{type(e).__name__}: {e}"
+
+            with self.lock:
+                job["state"]    = state
+                job["error"]    = error
+                job["finished"] = time.time()
+
+            Trace.action(f"job {job_id} {state} ({job['finished'] - job['started']:.2f} sec)")
@@ -0,0 +1,94 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:30
+
+    src/helper/journal.py
+
+    PUBLIC:
+     - class RunJournal:
+        - RunJournal(path: Path | str, name: str, signature: Dict)
+        - get(self, key: str) -> None | Dict
+        - get_replay(self, key: str) -> None | Dict
+        - add(self, key: str, result: Dict, seconds: float, replay: None | Dict = None) -> None
+        - count(self) -> int
+        - close(self, finished: bool) -> None
+
+    append-only JSONL: <trace_all>/journal/<name> - <md5 of the signature>.jsonl
+     - line 1: {"signature": {...}}                                  (model, beams, projects, dictionary timestamp ...)
+     - line n: {"key": "<project>/<settings>/<media>", "result": {...}, "seconds": 12.3, "replay": {...}}
+       replay: side effects of the post processing (trace messages, new nlp cache entries, hunspell counters)
+
+    every line is flushed + fsync -> a crash or KeyboardInterrupt loses max. the current file
+    a truncated last line (crash while writing) is ignored
+    finished run -> journal deleted, interrupted run -> same signature resumes from the journal
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from pathlib import Path
+from typing import Any, Dict
+
+from utils.trace import Trace
+
+class RunJournal:
+    def __init__(self, path: Path | str, name: str, signature: Dict[str, Any]) -> None:
+        super().__init__()
+
+        signature_json = json.dumps(signature, sort_keys=True, ensure_ascii=False, default=str)
+        signature_hash = hashlib.md5(signature_json.encode("utf-8")).hexdigest()[:8]  # noqa: S324
+
+        self.filepath = Path(path, "journal", f"{name} - {signature_hash}.jsonl")
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.replays: Dict[str, Dict[str, Any]] = {}
+
+        if self.filepath.is_file():
+            with self.filepath.open(mode="r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+                    if "key" in data:
+                        self.entries[data["key"]] = data["result"]
+                        if data.get("replay") is not None:
+                            self.replays[data["key"]] = data["replay"]
+
+            if len(self.entries) > 0:
+                Trace.result(f"journal '{self.filepath.name}': {len(self.entries)} files from an interrupted run")
+
+            self.file = self.filepath.open(mode="a", encoding="utf-8")
+            if self.filepath.stat().st_size > 0:
+                with self.filepath.open(mode="rb") as file:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        self._write({})  # truncated last line -> new line
+        else:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            self.file = self.filepath.open(mode="w", encoding="utf-8")
+            self._write({"signature": json.loads(signature_json)})
+
+    def get(self, key: str) -> None | Dict[str, Any]:
+        return self.entries.get(key)
+
+    def get_replay(self, key: str) -> None | Dict[str, Any]:
+        return self.replays.get(key)
+
+    def add(self, key: str, result: Dict[str, Any], seconds: float, replay: None | Dict[str, Any] = None) -> None:
+        self._write({"key": key, "result": result, "seconds": round(seconds, 3), "replay": replay})
+
+    def count(self) -> int:
+        return len(self.entries)
+
+    def close(self, finished: bool) -> None:
+        self.file.close()
+
+        if finished:
+            self.filepath.unlink(missing_ok=True)
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(data, ensure_ascii=False, default=str) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
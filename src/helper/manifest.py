@@ -0,0 +1,142 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 21:25
+
+    src/helper/manifest.py
+
+    PUBLIC:
+     - class BuildManifest:
+        - BuildManifest(path: Path | str)
+        - inputs(self, whisper_params: Dict, media_params: Dict) -> Dict
+        - check(self, whisper_params: Dict, media_params: Dict) -> None | Dict
+        - get_replay(self, whisper_params: Dict, media_params: Dict) -> None | Dict
+        - update(self, whisper_params: Dict, media_params: Dict, result: Dict, replay: None | Dict = None) -> None
+        - flush(self) -> None
+
+    PRIVATE:
+     - _file_stat(filepath: Path) -> None | List[int]
+
+    <project>/04_settings/manifest.json
+
+    per artifact group ("<settings>/<media>": 05_json/.../tmp, 06_text, 08_vtt, 09_srt, 10_excelExport)
+     - inputs: media + transcript (size, mtime_ns), dictionary timestamp, spaCy model, hunspell files, md5 of the relevant prefs
+     - result: return value of the post processing (-> log_add, DictionaryLog without re-rendering)
+     - replay: trace messages, new nlp cache entries and hunspell counters of the file (same as the run journal)
+
+    same inputs and all artifacts exist -> skip (no read of media, transcript or outputs)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from helper.postprocess import get_artifacts
+from helper.whisper_util import get_filename_parameter
+from utils.file import export_json, import_json
+from utils.globals import BASE_PATH
+from utils.prefs import Prefs
+
+MANIFEST_VERSION: int = 2
+
+# prefs used in the post processing (format_sentence.yaml, hallucination.yaml, spacy.yaml, hunspell.yaml)
+
+manifest_prefs: List[str] = [
+    "language",
+    "split_words",
+    "dont_split",
+    "dont_split_two",
+    "silence_hallucination",
+    "spacy",
+    "hunspell",
+    "whisper.faster_whisper.models.no_condition_on_previous_text",
+]
+
+class BuildManifest:
+    def __init__(self, path: Path | str) -> None:
+        super().__init__()
+
+        self.path     = Path(path)
+        self.filename = "manifest.json"
+        self.changed  = False
+
+        data = import_json(self.path, self.filename, show_error=False)
+        if data is None or data.get("version") != MANIFEST_VERSION:
+            self.artifacts: Dict[str, Any] = {}
+        else:
+            self.artifacts = data["artifacts"]
+
+        # hunspell: .dic, .aff, PreCheck_<language>.xlsx
+
+        language = Prefs.get("language")
+        hunspell_path = BASE_PATH / Prefs.get("hunspell.path") / language
+
+        hunspell: Dict[str, Any] = {}
+        if hunspell_path.is_dir():
+            for filepath in sorted(hunspell_path.iterdir()):
+                if filepath.is_file():
+                    hunspell[filepath.name] = _file_stat(filepath)
+
+        prefs = {key: Prefs.get(key) for key in manifest_prefs}
+
+        self.static_inputs = {
+            "hunspell": hunspell,
+            "prefs":    hashlib.md5(json.dumps(prefs, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest(),  # noqa: S324
+        }
+
+    def inputs(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any]) -> Dict[str, Any]:
+        media_name = media_params["mediaFile"]
+        whisper_parameter = get_filename_parameter(whisper_params)
+
+        return {
+            "media":      _file_stat(Path(whisper_params["mediaPath"], media_name + "." + whisper_params["type"])),
+            "transcript": _file_stat(Path(whisper_params["pathJson"], whisper_parameter, f"{media_name} - {whisper_parameter}.json")),
+            "dictionary": whisper_params["dictionary_timestamp"],
+            "nlp":        whisper_params["modelNameNLP"],
+            **self.static_inputs,
+        }
+
+    def check(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any]) -> None | Dict[str, Any]:
+        key = get_filename_parameter(whisper_params) + "/" + media_params["mediaFile"]
+
+        entry = self.artifacts.get(key)
+        if entry is None:
+            return None
+
+        inputs = self.inputs(whisper_params, media_params)
+        if inputs["media"] is None or inputs["transcript"] is None or entry["inputs"] != inputs:
+            return None
+
+        for filepath in get_artifacts(whisper_params, media_params).values():
+            if not filepath.is_file():
+                return None
+
+        return entry["result"]
+
+    def get_replay(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any]) -> None | Dict[str, Any]:
+        entry = self.artifacts.get(get_filename_parameter(whisper_params) + "/" + media_params["mediaFile"])
+        return entry.get("replay") if entry else None
+
+    def update(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any], result: Dict[str, Any], replay: None | Dict[str, Any] = None) -> None:
+        key = get_filename_parameter(whisper_params) + "/" + media_params["mediaFile"]
+
+        self.artifacts[key] = {
+            "inputs": self.inputs(whisper_params, media_params),
+            "result": result,
+            "replay": replay,
+        }
+        self.changed = True
+
+    def flush(self) -> None:
+        if self.changed:
+            export_json(self.path, self.filename, {"version": MANIFEST_VERSION, "artifacts": self.artifacts}, show_message=False)
+            self.changed = False
+
+def _file_stat(filepath: Path) -> None | List[int]:
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+
+    return [stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,94 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 21:10
+
+    src/helper/planner.py
+
+    PUBLIC:
+     - class CachePlanner:
+        - CachePlanner()
+        - check(self, whisper_params: Dict, media_params: Dict) -> str
+        - get_md5(self, whisper_params: Dict, media_params: Dict) -> None | str
+        - get_fingerprint(self, whisper_params: Dict, media_params: Dict) -> None | Dict
+        - count(self) -> Dict[str, int]
+        - clear(self) -> None
+        - flush(self) -> None
+
+    states (per model, beam and media file):
+     - "cached"  -> 05_json/<settings>/<media> - <settings>.json (header v2) with the same md5 as the media file
+     - "legacy"  -> header v1 with the same md5 (migrated in transcribe_fasterwhisper, no transcription)
+     - "changed" -> cache exists, but the media file or the adaptive beam mode was changed (transcribed again, the json is replaced)
+     - "missing" -> no cache (or media not found)
+
+    the md5 of a media file is calculated only once per run (independent of model and beam)
+    and only if size or mtime changed (FingerprintIndex: 04_settings/fingerprints.json)
+    -> media_params["mediaMd5"], media_params["mediaInfo"] (runner.py) -> no read of the media file in transcribe_fasterwhisper
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+
+from helper.fingerprint import FingerprintIndex
+from helper.whisper_util import get_cached_adaptive_beam, get_filename_parameter
+from utils.file import import_json
+from utils.trace import Trace
+
+class CachePlanner:
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.media: Dict[str, Dict[str, Any] | None] = {}
+        self.indexes: Dict[str, FingerprintIndex] = {}
+        self.counter: Dict[str, int] = {}
+        self.clear()
+
+    def check(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any]) -> str:
+        media_name = media_params["mediaFile"]
+        media_md5  = self.get_md5(whisper_params, media_params)
+
+        whisper_parameter = get_filename_parameter(whisper_params)
+        cached = import_json(Path(whisper_params["pathJson"], whisper_parameter), f"{media_name} - {whisper_parameter}.json", show_error=False)
+
+        if media_md5 is None or cached is None:
+            state = "missing"
+        elif get_cached_adaptive_beam(whisper_params, media_name, cached) != whisper_params.get("adaptiveBeam"):
+            state = "changed"
+        elif "media" in cached and cached["media"].get("md5") == media_md5:
+            state = "cached"
+        elif cached.get("md5") == media_md5:
+            state = "legacy"
+        else:
+            state = "changed"
+
+        self.counter[state] += 1
+        return state
+
+    def get_md5(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any]) -> None | str:
+        fingerprint = self.get_fingerprint(whisper_params, media_params)
+        return fingerprint["md5"] if fingerprint else None
+
+    def get_fingerprint(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any]) -> None | Dict[str, Any]:
+        media_pathname = Path(whisper_params["mediaPath"], media_params["mediaFile"] + "." + whisper_params["type"])
+        if str(media_pathname) not in self.media:
+            path_settings = str(whisper_params["pathSettings"])
+            if path_settings not in self.indexes:
+                self.indexes[path_settings] = FingerprintIndex(path_settings)
+
+            self.media[str(media_pathname)] = self.indexes[path_settings].get(media_pathname)
+
+        return self.media[str(media_pathname)]
+
+    def count(self) -> Dict[str, int]:
+        return dict(self.counter)
+
+    def clear(self) -> None:
+        self.counter = { "cached": 0, "legacy": 0, "changed": 0, "missing": 0 }
+
+    def flush(self) -> None:
+        hashed = sum(index.hashed for index in self.indexes.values())
+        if hashed > 0:
+            Trace.info(f"fingerprints: {hashed} media file(s) hashed (new or changed)")
+
+        for index in self.indexes.values():
+            index.hashed = 0
+            index.flush()
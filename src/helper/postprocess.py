@@ -0,0 +1,135 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 16:40
+
+    src/helper/postprocess.py
+
+    PUBLIC:
+     - get_artifacts(project_params: Dict, media_params: Dict) -> Dict[str, Path]
+     - postprocess_transcript(project_params: Dict, media_params: Dict, cache_nlp: CacheJSON, result: Dict, timestamp: float) -> Dict
+     - reprocess_transcript(project_params: Dict, media_params: Dict, cache_nlp: CacheJSON) -> None | Dict
+
+    05_json transcript -> prepare_words -> split_to_lines -> split_to_sentences -> txt, srt, vtt, xlsx
+    (no import of faster_whisper -> reprocess.py)
+
+    stage times (utils/timing.py): words (+ spacy), lines (+ dictionary, spellcheck), sentences, export_*
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict
+
+from helper.captions import export_srt, export_vtt
+from helper.excel_write import export_text_to_speech_excel
+from helper.whisper_util import get_filename_parameter, prepare_words, split_to_lines, split_to_sentences
+from utils.file import export_json, export_text, import_json_timestamp
+from utils.timing import stage
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from utils.util import CacheJSON
+
+def get_artifacts(project_params: Dict[str, Any], media_params: Dict[str, Any]) -> Dict[str, Path]:
+    modelname_nlp   = project_params["modelNameNLP"]
+
+    media_name      = media_params["mediaFile"]
+    subfolder       = media_params["subFolder"]
+
+    whisper_parameter = get_filename_parameter(project_params)
+    filename_two = f"{media_name} - {whisper_parameter}"
+
+    nlp_name = " [" + modelname_nlp + "]"
+
+    return {
+        "words": Path(project_params["pathJson"],  whisper_parameter, "tmp", modelname_nlp, filename_two + ".json"),
+        "txt":   Path(project_params["pathText"],  whisper_parameter + nlp_name, filename_two + ".txt"),
+        "srt":   Path(project_params["pathSrt"],   whisper_parameter + nlp_name, subfolder, media_name + ".srt"),
+        "vtt":   Path(project_params["pathVtt"],   whisper_parameter + nlp_name, subfolder, media_name + ".vtt"),
+        "xlsx":  Path(project_params["pathExcel"], whisper_parameter + nlp_name, subfolder, media_name + ".xlsx"),
+    }
+
+def postprocess_transcript(project_params: Dict[str, Any], media_params: Dict[str, Any], cache_nlp: CacheJSON, result: Dict[str, Any], timestamp: float) -> Dict[str, Any]:
+    model_name      = project_params["modelName"]
+    language        = project_params["language"]
+
+    dictionary_data      = project_params["dictionary"]
+    dictionary_timestamp = project_params["dictionary_timestamp"]
+
+    media_name      = media_params["mediaFile"]
+    is_intro        = media_params["isIntro"]
+
+    artifacts = get_artifacts(project_params, media_params)
+
+    if result["text"] == "":
+        Trace.fatal(f"text empty {result}")
+
+    with stage("words"):
+        (words,
+            sentences,
+            _average_probability,  # not used
+            _standard_deviation,   # not used
+            last_segment_text,
+            repetition_error,
+            pause_error,
+        ) = prepare_words(result, True, is_intro, model_name, language, cache_nlp, media_name)
+
+    with stage("export_json"):
+        export_json(artifacts["words"].parent, artifacts["words"].name, words, timestamp = timestamp)
+
+    with stage("lines"):
+        (
+            cc,
+            text,
+            text_combined,
+            corrected_details,
+            spelling_result,
+        ) = split_to_lines(words, dictionary_data)
+
+    if timestamp:
+        if len(corrected_details)>0:
+            timestamp = max(timestamp, dictionary_timestamp)
+
+    text = str(result["text"]).strip() + "\n" + text_combined + "\n\n" + text
+    with stage("export_txt"):
+        export_text(artifacts["txt"].parent, artifacts["txt"].name, text, timestamp = timestamp)
+
+    with stage("export_srt"):
+        export_text(artifacts["srt"].parent, artifacts["srt"].name, export_srt(cc), newline = "\r\n", timestamp = timestamp)
+    with stage("export_vtt"):
+        export_text(artifacts["vtt"].parent, artifacts["vtt"].name, export_vtt(cc), newline = "\r\n", timestamp = timestamp)
+
+    with stage("sentences"):
+        sentence_data = split_to_sentences(words, dictionary_data)
+    with stage("export_xlsx"):
+        export_text_to_speech_excel(sentence_data, artifacts["xlsx"].parent, artifacts["xlsx"].name) # SubtitleColumnFormat
+
+    return {
+        "text":            text_combined,
+        "chars":           len(text_combined.replace(" ", "")),
+        "words":           len(text_combined.split(" ")),
+        "sentences":       sentences,
+        "duration":        result["media"]["duration"],
+        "spelling":        spelling_result,
+        "corrected":       corrected_details,
+        "lastSegment":     last_segment_text,
+        "repetitionError": repetition_error,
+        "pauseError":      pause_error,
+    }
+
+def reprocess_transcript(project_params: Dict[str, Any], media_params: Dict[str, Any], cache_nlp: CacheJSON) -> None | Dict[str, Any]:
+    media_name = media_params["mediaFile"]
+
+    whisper_parameter = get_filename_parameter(project_params)
+    path_json = Path(project_params["pathJson"], whisper_parameter)
+    filename  = f"{media_name} - {whisper_parameter}.json"
+
+    with stage("load_json"):
+        result, timestamp = import_json_timestamp(path_json, filename, show_error=False)
+    if result is None:
+        Trace.error(f"transcript not found '{Path(path_json, filename)}'")
+        return None
+
+    if "media" not in result:
+        Trace.error(f"transcript header v1 (-> main.py) '{Path(path_json, filename)}'")
+        return None
+
+    return postprocess_transcript(project_params, media_params, cache_nlp, result, timestamp)
@@ -0,0 +1,86 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:20
+
+    src/helper/prefetch.py
+
+    PUBLIC:
+     - class Prefetch:
+        - Prefetch(function: Callable, items: List[Tuple[str, Tuple]], depth: int)
+        - get(self, key: str) -> Any
+        - stop(self) -> None
+
+    producer (background thread): function(*args) for all items (key, args) in the given order
+    consumer (main thread):       get(key) in the same order
+
+    max. depth items prepared in advance (queued or in work) + the item of the consumer -> depth + 1 in memory;
+    Trace messages of the producer are delivered with the item (-> trace of the current project in the main thread)
+"""
+from __future__ import annotations
+
+import queue
+import threading
+
+from typing import Any, Callable, List, Tuple
+
+from utils.trace import Trace
+
+class Prefetch:
+    def __init__(self, function: Callable[..., Any], items: List[Tuple[str, Tuple[Any, ...]]], depth: int) -> None:
+        super().__init__()
+
+        self.function = function
+        self.items    = items
+        self.queue: queue.Queue[Tuple[str, Any, List[Any]]] = queue.Queue()
+        self.slots    = threading.Semaphore(max(1, depth))
+        self.stopped  = threading.Event()
+
+        self.thread = threading.Thread(target=self._producer, name="prefetch", daemon=True)
+        self.thread.start()
+
+    def _producer(self) -> None:
+        Trace.buffer_start()
+
+        for key, args in self.items:
+            while not self.slots.acquire(timeout=0.5): # free slot -> consumer has taken an item
+                if self.stopped.is_set():
+                    return
+
+            if self.stopped.is_set():
+                return
+
+            try:
+                data = self.function(*args)
+            except Exception as e:  # noqa: BLE001 # consumer -> fallback without prefetch
+                Trace.error(f"prefetch '{key}': {e}")
+                data = None
+
+            self.queue.put((key, data, Trace.buffer_get()))
+
+    def get(self, key: str) -> Any:
+        if self.stopped.is_set():
+            return None
+
+        while True:
+            try:
+                curr_key, data, messages = self.queue.get(timeout=0.5)
+                break
+            except queue.Empty:
+                if not self.thread.is_alive() and self.queue.empty():
+                    return None
+
+        self.slots.release()
+        Trace.buffer_replay(messages)
+
+        if curr_key != key:
+            Trace.error(f"prefetch order '{curr_key}' != '{key}'")
+            return None
+
+        return data
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+        self.thread.join()
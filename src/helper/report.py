@@ -0,0 +1,112 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:30
+
+    src/helper/report.py
+
+    PUBLIC:
+     - class StageReport:
+        - StageReport(model_name: str)
+        - add(self, project: str, settings: str, media_params: Dict, result: Dict, stages: Dict[str, float]) -> None
+        - summary(self) -> Dict
+        - save(self, path: Path | str, settings: str) -> None
+
+    per run (model): <trace_all>/timing - <settings>.csv (one row per file) + .json (summary + files)
+     - stages (utils/timing.py): media, decode, vad, features, loadModel, encoder, decoder, alignment, transcribe,
+                                 words, spacy, lines, dictionary, spellcheck, sentences, export_*, other
+     - rtf: seconds / audio duration (rtfTranscribed: only files with a transcription, no cache)
+       seconds without prefetch_* (prefetch thread, overlapped with the previous file; blocked time -> 'wait')
+     - p50/p95 per stage over all files
+"""
+from __future__ import annotations
+
+import csv
+import io
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from utils.file import export_json, export_text
+from utils.timing import percentile
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+class StageReport:
+    def __init__(self, model_name: str) -> None:
+        super().__init__()
+
+        self.model_name = model_name
+        self.rows: List[Dict[str, Any]] = []
+
+    def add(self, project: str, settings: str, media_params: Dict[str, Any], result: Dict[str, Any], stages: Dict[str, float]) -> None:
+        seconds = sum(value for name, value in stages.items() if not name.startswith("prefetch_"))
+        audio   = result["duration"]
+
+        self.rows.append({
+            "project":  project,
+            "settings": settings,
+            "media":    media_params["mediaFile"],
+            "state":    media_params.get("cacheState", "-"),
+            "audio":    round(audio, 3),
+            "seconds":  round(seconds, 3),
+            "rtf":      round(seconds / audio, 4) if audio > 0 else 0.0,
+            "stages":   {name: round(value, 3) for name, value in stages.items()},
+        })
+
+    def summary(self) -> Dict[str, Any]:
+        names: List[str] = []
+        for row in self.rows:
+            for name in row["stages"]:
+                if name not in names:
+                    names.append(name)
+
+        audio   = sum(row["audio"] for row in self.rows)
+        seconds = sum(row["seconds"] for row in self.rows)
+
+        transcribed = [row for row in self.rows if row["state"] in ("missing", "changed")]
+        audio_transcribed   = sum(row["audio"] for row in transcribed)
+        seconds_transcribed = sum(row["seconds"] for row in transcribed)
+
+        stages: Dict[str, Dict[str, float]] = {}
+        for name in names:
+            values = [row["stages"].get(name, 0.0) for row in self.rows]
+            stages[name] = {
+                "total": round(sum(values), 3),
+                "share": round(sum(values) / seconds, 4) if seconds > 0 and not name.startswith("prefetch_") else 0.0,
+                "p50":   round(percentile(values, 50), 3),
+                "p95":   round(percentile(values, 95), 3),
+            }
+
+        return {
+            "model":          self.model_name,
+            "files":          len(self.rows),
+            "audio":          round(audio, 3),
+            "seconds":        round(seconds, 3),
+            "rtf":            round(seconds / audio, 4) if audio > 0 else 0.0,
+            "rtfTranscribed": round(seconds_transcribed / audio_transcribed, 4) if audio_transcribed > 0 else 0.0,
+            "rtfP50":         round(percentile([row["rtf"] for row in self.rows], 50), 4),
+            "rtfP95":         round(percentile([row["rtf"] for row in self.rows], 95), 4),
+            "stages":         dict(sorted(stages.items(), key=lambda item: -item[1]["total"])),
+        }
+
+    def save(self, path: Path | str, settings: str) -> None:
+        if len(self.rows) == 0:
+            return
+
+        summary = self.summary()
+
+        names = list(summary["stages"].keys())
+        columns = ["project", "settings", "media", "state", "audio", "seconds", "rtf"]
+
+        output = io.StringIO()
+        writer = csv.writer(output, delimiter=";", lineterminator="\n")
+        writer.writerow(columns + names)
+        for row in self.rows:
+            writer.writerow([row[column] for column in columns] + [row["stages"].get(name, 0.0) for name in names])
+
+        export_text(path, "timing - " + settings + ".csv", output.getvalue(), show_message=False)
+        export_json(path, "timing - " + settings + ".json", {**summary, "rows": self.rows}, show_message=False)
+
+        Trace.result(f"'{self.model_name}' timing: {summary['files']} files, rtf {summary['rtf']} (p50 {summary['rtfP50']}, p95 {summary['rtfP95']}, transcribed {summary['rtfTranscribed']})")
+        for name, value in list(summary["stages"].items())[:6]:
+            Trace.result(f"  {name:<12} {value['total']:10.2f} sec ({value['share']:.1%}), p50 {value['p50']:.2f}, p95 {value['p95']:.2f}")
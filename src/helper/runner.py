@@ -0,0 +1,585 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 21:25
+
+    src/helper/runner.py
+
+    PUBLIC:
+     - load_projects(media_type: str, project_list: None | List[str] = None) -> Dict
+     - get_media_params(file_info: Dict, prompt_main: str) -> Dict
+     - run_model(model: Tuple[str, str], beams: List[int], projects: Dict, task: Callable, whisper_type: str, language: str, media_type: str, no_prompt: bool,
+                 data_dictionary: Dict, names_dictionary_sheet: List[str], dictionary_timestamp: float, path_trace_main: Path, start: float, reset_cache_spacy: bool,
+                 planner: CachePlanner | None, pool: TranscribePool | None, prefetch_task: Callable | None = None, cancel: threading.Event | None = None,
+                 pack_task: Callable | None = None) -> None
+
+    PRIVATE:
+     - _replay_start(nlp: CacheJSON) -> Tuple[int, int, Dict, Dict]
+     - _replay_get(start: Tuple, nlp: CacheJSON) -> Dict
+     - _replay_apply(replay: None | Dict, nlp: CacheJSON) -> None
+
+    whisper.yaml -> faster_whisper:
+     - prefetch:   serial mode, decode + VAD of the next files in a background thread (helper/prefetch.py)
+     - pack.max_s: serial mode, short files of a run transcribed by pack_task in groups of pack.files
+"""
+from __future__ import annotations
+
+import json
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set, Tuple
+
+from helper.captions import seconds_to_timecode_vtt
+from helper.excel_read import import_project_excel
+from helper.journal import RunJournal
+from helper.log import DictionaryLog, log_add, log_clear, log_get_data
+from helper.manifest import BuildManifest
+from helper.prefetch import Prefetch
+from helper.report import StageReport
+from helper.spelling import add_spell_counter, get_spell_counter, get_spell_statistic
+from helper.whisper_util import are_inner_prompts_possible, get_filename_parameter, prompt_main_normalize, prompt_normalize
+from primary.spacy import get_modelname_spacy
+from primary.whisper_faster import get_adaptive_beam
+from utils.file import check_file_exists, export_text
+from utils.globals import BASE_PATH
+from utils.prefs import Prefs
+from utils.timing import clear_stage_times, get_stage_times, stage
+from utils.trace import Trace
+from utils.util import CacheJSON
+
+if TYPE_CHECKING:
+    import threading
+
+    from concurrent.futures import Future
+
+    from helper.planner import CachePlanner
+    from helper.scheduler import TranscribePool
+
+data_path = BASE_PATH / "../data"
+
+trace_file_default = ["info", "update", "proof", "warning", "error"]
+trace_file_reduced = ["warning"]
+
+def load_projects(media_type: str, project_list: None | List[str] = None) -> Dict[str, Any]:
+    if project_list is None:
+        project_list = Prefs.get("projects")
+
+    projects: Dict[str, Any] = {}
+    for project in project_list:
+        parts = project.split("/")
+        folder = parts[-1]
+        mainfolder = "/".join(parts[0:-1])
+
+        ret = import_project_excel(data_path / mainfolder / folder, folder + ".xlsx")
+        if ret:
+            projects[project] = [project, ret]
+        else:
+            Trace.fatal(f"project destription not found {project}")
+
+    # check all media exist
+
+    error = False
+    for data in projects.values():
+        path_project = data[0]
+        data_project = data[1]
+
+        files = []
+
+        for parts in data_project["parts"]:
+            files.append(parts["files"])
+
+        if media_type in ("mp3", "wav", "m4a", "flac"):
+            path_media = data_path / path_project / "03_audio" /  media_type
+        elif media_type == "mp4":
+            path_media = data_path / path_project / "02_video"
+        else:
+            path_media = ""
+            Trace.fatal( f"unknown type '{media_type}'")
+
+        Trace.info(f"check media file exist '{path_project}'")
+        for parts in files:
+            for media_file in parts:
+                filename = media_file["file"].replace(".mp4", "." + media_type)
+                if not check_file_exists(path_media, filename):
+                    error = True
+        if error:
+            Trace.fatal( "audios incomplete" )
+
+    return projects
+
+def get_media_params(file_info: Dict[str, Any], prompt_main: str) -> Dict[str, Any]:
+    file_prompt = ""
+
+    media_file = file_info["file"]
+    if len(file_info["prompt"]) > 0:
+        prompt = prompt_normalize(file_info["prompt"]).strip()
+
+        file_prompt = prompt + " " + prompt_main
+    else:
+        file_prompt = prompt_main
+
+    if file_prompt != "":
+        if file_prompt[-1] not in ".,;:?!":
+            file_prompt += "."
+
+    tmp = media_file.split(".")
+    tmp.pop()
+    media_file = ".".join(tmp)
+
+    return {
+        "mediaFile": media_file,
+        "subFolder": file_info["folder"],
+        "prompt":    file_prompt,
+        "isIntro":   file_info["isIntro"],
+    }
+
+def run_model(
+    model:                  Tuple[str, str],
+    beams:                  List[int],
+    projects:               Dict[str, Any],
+    task:                   Callable[..., Dict[str, Any] | None],
+    whisper_type:           str,
+    language:               str,
+    media_type:             str,
+    no_prompt:              bool,
+    data_dictionary:        Dict[str, Any],
+    names_dictionary_sheet: List[str],
+    dictionary_timestamp:   float,
+    path_trace_main:        Path,
+    start:                  float,
+    reset_cache_spacy:      bool,
+    planner:                CachePlanner | None,
+    pool:                   TranscribePool | None,
+    prefetch_task:          Callable[..., Dict[str, Any] | None] | None = None,
+    cancel:                 threading.Event | None = None,
+    pack_task:              Callable[..., Dict[str, Dict[str, Any]]] | None = None,
+) -> None:
+
+    log_dictionary = DictionaryLog( names_dictionary_sheet )
+    report         = StageReport( model[1] )
+
+    settings       = ""
+    project_all    = 0
+    file_count_all = 0
+    duration_all   = 0
+    chars_all      = 0
+    words_all      = 0
+    sentences_all  = 0
+    up_to_date     = 0
+    resumed        = 0
+
+    journal = RunJournal(path_trace_main, model[1], {
+        "model":        model,
+        "beams":        beams,
+        "projects":     list(projects.keys()),
+        "task":         task.__name__,
+        "whisperType":  whisper_type,
+        "language":     language,
+        "mediaType":    media_type,
+        "noPrompt":     no_prompt,
+        "dictionary":   dictionary_timestamp,
+        "resetSpacy":   reset_cache_spacy,
+    })
+
+    # step 1: plan all runs (project x beam) -> cache check, in parallel mode all files are submitted at once
+
+    plans: List[Dict[str, Any]] = []
+    for project, data in projects.items():
+        path_project = data[0]
+        data_project = data[1]
+
+        files = []
+
+        prompt_main = prompt_main_normalize(data_project["prompt"]).strip()
+
+        for parts in data_project["parts"]:
+            files.append(parts["files"])
+
+        if media_type in ("mp3", "wav", "m4a", "flac"):
+            path_media = data_path / path_project / "03_audio" / media_type
+        elif media_type == "mp4":
+            path_media = data_path / path_project / "02_video"
+        else:
+            path_media = ""
+            Trace.fatal( f"unknown type '{media_type}'")
+
+        path_settings  = data_path / path_project / "04_settings"
+        path_pcm       = data_path / path_project / "03_audio" / "pcm"
+        path_json      = data_path / path_project / "05_json"
+        path_text      = data_path / path_project / "06_text"
+
+        path_vtt       = data_path / path_project / "08_vtt"
+        path_srt       = data_path / path_project / "09_srt"
+        path_excel     = data_path / path_project / "10_excelExport"
+
+        path_trace     = data_path / path_project / "99_trace"
+
+        # faster-whisper: skip post processing if all inputs unchanged (04_settings/manifest.json)
+
+        manifest: BuildManifest | None = None
+        if whisper_type == "faster-whisper" and not reset_cache_spacy:
+            manifest = BuildManifest(path_settings)
+
+        runs: List[Dict[str, Any]] = []
+        for beam in beams:
+            whisper_params = {
+                "whisper":       whisper_type,
+                "modelNumber":   model[0],
+                "modelName":     model[1],
+                "language":      language,
+                "noPrompt":      no_prompt,
+                "innerPrompt":   are_inner_prompts_possible(model[1]),
+
+                "beam":          beam,
+                "VAD":           Prefs.get("whisper.faster_whisper.use_vad"),
+                "adaptiveBeam":  get_adaptive_beam() if whisper_type == "faster-whisper" else None, # part of the settings key
+
+                "dictionary":           data_dictionary,
+                "dictionary_timestamp": dictionary_timestamp,
+
+                "type":          media_type,
+                "mediaPath":     path_media,
+
+                "pathJson":      path_json,
+                "pathText":      path_text,
+                "pathVtt":       path_vtt,
+                "pathSrt":       path_srt,
+                "pathSettings":  path_settings,
+                "pathPcm":       path_pcm,
+                "pathExcel":     path_excel,
+
+                "modelNameNLP":  get_modelname_spacy(language),
+            }
+
+            settings = get_filename_parameter(whisper_params)  # e.g: "(5) large-v2-fast#True#beam-5#VAD-True"
+            project_name = project.split("/")[-1] + " - " + settings
+
+            nlp_params = (Path(path_json, settings, "nlp"), project_name, get_modelname_spacy(language), reset_cache_spacy)
+
+            jobs: List[Tuple[Dict[str, Any], Future[Any] | None, Dict[str, Any] | None, bool]] = []
+            for parts in files:
+                for file_info in parts:
+                    media_params = get_media_params(file_info, prompt_main)
+
+                    built = journal.get(project + "/" + settings + "/" + media_params["mediaFile"])
+                    journaled = built is not None
+
+                    if built is None and manifest:
+                        built = manifest.check(whisper_params, media_params)
+
+                    future = None
+                    if journaled:
+                        resumed += 1
+                    elif built is not None:
+                        up_to_date += 1
+                    else:
+                        if planner:
+                            media_params["cacheState"] = planner.check(whisper_params, media_params)
+                            fingerprint = planner.get_fingerprint(whisper_params, media_params)
+                            if fingerprint:
+                                media_params["mediaMd5"]  = fingerprint["md5"]
+                                media_params["mediaInfo"] = fingerprint["mediaInfo"]
+
+                        if pool:
+                            future = pool.submit(whisper_params, media_params, nlp_params)
+
+                    jobs.append((media_params, future, built, journaled))
+
+            runs.append({
+                "whisperParams": whisper_params,
+                "settings":      settings,
+                "projectName":   project_name,
+                "nlpParams":     nlp_params,
+                "jobs":          jobs,
+            })
+
+        plans.append({
+            "project":   project,
+            "pathText":  path_text,
+            "pathTrace": path_trace,
+            "manifest":  manifest,
+            "runs":      runs,
+        })
+
+    if resumed > 0:
+        Trace.result(f"'{model[1]}' resumed (journal): {resumed} files")
+
+    if up_to_date > 0:
+        Trace.result(f"'{model[1]}' up to date (manifest): {up_to_date} files")
+
+    if planner:
+        planner.flush()
+
+        count = planner.count()
+        planner.clear()
+
+        todo = count["changed"] + count["missing"]
+        Trace.result(f"'{model[1]}' transcription needed: {todo} of {sum(count.values())} files (cached: {count['cached']}, legacy: {count['legacy']}, changed: {count['changed']}, missing: {count['missing']})")
+        if todo == 0:
+            Trace.result(f"'{model[1]}' all transcripts cached -> no model load")
+
+    # serial mode (faster-whisper): short files of a run packed into shared encoder/decoder batches
+
+    if planner and pool is None and pack_task:
+        pack_max_s  = float(Prefs.get("whisper.faster_whisper.pack.max_s", 0))
+        pack_files  = max(1, int(Prefs.get("whisper.faster_whisper.pack.files", 16)))
+        pack_count  = 0
+
+        for plan in plans:
+            for run in plan["runs"]:
+                run["packs"]  = []
+                run["packed"] = {}
+                if pack_max_s <= 0 or not run["whisperParams"]["VAD"] or run["whisperParams"]["adaptiveBeam"]: # pack: no adaptive beam
+                    continue
+
+                short = [
+                    media_params for media_params, _future, _built, _journaled in run["jobs"]
+                    if media_params.get("cacheState") == "missing" and 0 < (media_params.get("mediaInfo") or {}).get("duration", 0) <= pack_max_s
+                ]
+                if len(short) < 2:
+                    continue
+
+                for i in range(0, len(short), pack_files):
+                    for media_params in short[i : i + pack_files]:
+                        run["packed"][media_params["mediaFile"]] = len(run["packs"])
+                    run["packs"].append(short[i : i + pack_files])
+                pack_count += len(short)
+
+        if pack_count > 0:
+            Trace.result(f"'{model[1]}' packed transcription: {pack_count} short files (<= {pack_max_s:.0f} sec)")
+
+    # serial mode (faster-whisper): decode + VAD of the next files in a background thread
+
+    prefetch: Prefetch | None = None
+    if planner and pool is None and prefetch_task:
+        depth = int(Prefs.get("whisper.faster_whisper.prefetch", 0))
+        if depth > 0:
+            items: List[Tuple[str, Tuple[Dict[str, Any], Dict[str, Any]]]] = []
+            for plan in plans:
+                for run in plan["runs"]:
+                    for media_params, _future, _built, _journaled in run["jobs"]:
+                        if media_params.get("cacheState") == "missing" and media_params["mediaFile"] not in run.get("packed", {}):
+                            items.append((run["settings"] + "/" + media_params["mediaFile"], (run["whisperParams"], media_params)))
+
+            if len(items) > 0:
+                prefetch = Prefetch(prefetch_task, items, depth)
+
+    # step 2: transcribe (serial) or collect the results (parallel) - always in the same order
+
+    for plan in plans:
+        project    = plan["project"]
+        path_text  = plan["pathText"]
+        path_trace = plan["pathTrace"]
+        manifest   = plan["manifest"]
+
+        project_all += 1
+
+        for run in plan["runs"]:
+            log_clear()
+
+            Trace.set(show_timestamp=True, show_caller=True)
+            Trace.file_init(trace_file_default)
+            Trace.info(project)
+            Trace.info()
+
+            whisper_params = run["whisperParams"]
+            settings       = run["settings"]
+            project_name   = run["projectName"]
+
+            nlp = CacheJSON(*run["nlpParams"])
+
+            packed:     Dict[str, Dict[str, Any]] = {}
+            done_packs: Set[int] = set()
+
+            file_count = 0
+            duration   = 0
+            chars      = 0
+            words      = 0
+            sentences  = 0
+            cancelled  = False
+            for media_params, future, built, journaled in run["jobs"]:
+                if cancel and cancel.is_set():
+                    cancelled = True
+                    break
+
+                file_count += 1
+
+                media_file = media_params["mediaFile"]
+                file_start = time.perf_counter()
+
+                clear_stage_times()
+                replay_start = _replay_start(nlp)
+
+                replay: None | Dict[str, Any] = None
+                if built is not None:
+                    result = built
+                    if journaled:
+                        replay = journal.get_replay(project + "/" + settings + "/" + media_file)
+                    elif manifest:
+                        replay = manifest.get_replay(whisper_params, media_params)
+                    _replay_apply(replay, nlp)
+
+                elif future is not None and pool is not None:
+                    result = pool.result(future, nlp)
+
+                elif pack_task and media_file in run.get("packed", {}):
+                    pack = run["packed"][media_file]
+                    if pack not in done_packs: # first file of the group -> all files of the group
+                        done_packs.add(pack)
+                        packed = pack_task(whisper_params, run["packs"][pack])
+                        clear_stage_times()    # stage times per file in packed[...]["stages"]
+
+                    with stage("other"):       # no packed result (e.g. media not found) -> task without prefetched
+                        result = task(whisper_params, media_params, nlp, packed.pop(media_file, None))
+
+                elif prefetch:
+                    prefetched = None
+                    if media_params.get("cacheState") == "missing":
+                        with stage("wait"): # main thread blocked by the prefetch thread
+                            prefetched = prefetch.get(settings + "/" + media_file)
+                        if prefetched:
+                            prefetched["background"] = True
+
+                    with stage("other"):
+                        result = task(whisper_params, media_params, nlp, prefetched)
+                    prefetched = None
+
+                else:
+                    with stage("other"):
+                        result = task(whisper_params, media_params, nlp)
+
+                if result and built is None:
+                    replay = _replay_get(replay_start, nlp)
+                    journal.add(project + "/" + settings + "/" + media_file, result, time.perf_counter() - file_start, replay)
+                    report.add(project, settings, media_params, result, get_stage_times())
+
+                if result and manifest and (built is None or journaled):
+                    manifest.update(whisper_params, media_params, result, replay)
+
+                if result:
+                    duration  += result["duration"]
+                    chars     += result["chars"]
+                    words     += result["words"]
+                    sentences += result["sentences"]
+
+                    log_add(
+                        media_file,
+                        result["text"],
+                        result["corrected"],
+                        result["lastSegment"],
+                        result["repetitionError"],
+                        result["pauseError"],
+                        result["spelling"],
+                    )
+                    log_dictionary.add(
+                        result["corrected"],
+                        result["spelling"],
+                    )
+                    time.sleep(0)
+                    # Trace.info()
+                print()
+                print()
+
+            nlp.flush()
+            if manifest:
+                manifest.flush()
+
+            if cancelled: # daemon job cancelled -> no exports with partial data (complete.txt/.log, correctedAll, spellingAll, dictionary_used_sorted)
+                for other_plan in plans:
+                    for other_run in other_plan["runs"]:
+                        for _media_params, future, _built, _journaled in other_run["jobs"]:
+                            if future is not None:
+                                future.cancel()
+                if prefetch:
+                    prefetch.stop()
+                journal.close(finished = False)
+
+                Trace.set(show_timestamp=True, show_caller=True)
+                Trace.warning(f"cancelled: '{project}' after {file_count} file(s) -> exports skipped, the journal resumes the run")
+                return
+
+            text_complete, text_corr_complete = log_get_data()
+
+            export_text(path_text, project_name + "-complete.txt", text_complete)
+            export_text(path_text, project_name + "-complete.log", text_corr_complete)
+
+            file_count_all += file_count
+            duration_all   += duration
+            chars_all      += chars
+            words_all      += words
+            sentences_all  += sentences
+
+            Trace.info()
+            Trace.info(f"'{project}' files: {file_count}, duration: {seconds_to_timecode_vtt(duration)}, chars: {chars}, words: {words}, sentences: {sentences}")
+
+            Trace.file_save(path_trace, project_name)
+            Trace.set(show_timestamp=True, show_caller=True)
+
+    if prefetch:
+        prefetch.stop()
+
+    # _dictionary/Dictionary-DATEV.xlsx -> "correctedAll - .txt"
+
+    (result_excel, result_words, spelling) = log_dictionary.get()
+
+    Trace.set(show_timestamp=False, show_caller=False)
+    Trace.file_init(trace_file_reduced)
+
+    for key, value in sorted(result_words.items()):
+        Trace.warning(f"'{key}': {value}")
+
+    Trace.file_save(path_trace_main, "correctedAll - " + settings)
+    Trace.set(show_timestamp=True, show_caller=True)
+
+    dictionary_used_sorted = {}
+    for worksheet, ws_data in result_excel.items():
+        dictionary_used_sorted[worksheet] = dict(sorted(ws_data.items()))  # {"normalize": {62: 67, 80: 23, 182: 70 ...
+
+    json_dump = json.dumps(dictionary_used_sorted, ensure_ascii=False, indent=2)
+    export_text(path_trace_main, "dictionary_used_sorted - " + settings + ".json", json_dump)
+
+    # Hunspell => "spellingAll - .txt"
+
+    Trace.set(show_timestamp=False, show_caller=False)
+    Trace.file_init(trace_file_reduced)
+
+    for key, value in sorted(spelling.items()):
+        Trace.warning(f"'{key}': {value}")
+
+    Trace.file_save(path_trace_main, "spellingAll - " + settings)
+    Trace.set(show_timestamp=True, show_caller=True)
+
+    report.save(path_trace_main, settings)
+    journal.close(finished = True)
+
+    d = time.perf_counter() - start
+
+    get_spell_statistic()
+
+    Trace.result(f"projects: {project_all}, filesAll: {file_count_all}, durationAll: {seconds_to_timecode_vtt(duration_all)}, charsAll: {chars_all}, wordsAll: {words_all}, sentencesAll: {sentences_all} ({d:,.2f} sec)")
+
+def _replay_start(nlp: CacheJSON) -> Tuple[int, int, Dict[str, int], Dict[str, int]]:
+    spell_success, spell_failure = get_spell_counter()
+    return len(Trace.file_get()), len(nlp.added()), spell_success, spell_failure
+
+def _replay_get(start: Tuple[int, int, Dict[str, int], Dict[str, int]], nlp: CacheJSON) -> Dict[str, Any]:
+    messages, nlp_added, success_before, failure_before = start
+    spell_success, spell_failure = get_spell_counter()
+
+    return {
+        "messages":     Trace.file_get()[messages:],
+        "nlp":          dict(list(nlp.added().items())[nlp_added:]),
+        "spellSuccess": {word: count - success_before.get(word, 0) for word, count in spell_success.items() if count != success_before.get(word, 0)},
+        "spellFailure": {word: count - failure_before.get(word, 0) for word, count in spell_failure.items() if count != failure_before.get(word, 0)},
+    }
+
+def _replay_apply(replay: None | Dict[str, Any], nlp: CacheJSON) -> None:
+    if replay is None: # journal of an older version
+        return
+
+    Trace.file_append(replay["messages"])
+
+    for value_hash, value in replay["nlp"].items():
+        if nlp.get(value_hash) is None:
+            nlp.add(value_hash, value)
+
+    add_spell_counter(replay["spellSuccess"], replay["spellFailure"])
@@ -0,0 +1,144 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 16:40
+
+    src/helper/scheduler.py
+
+    PUBLIC:
+     - get_parallel_settings() -> Tuple[int, int]
+
+     - class TranscribePool:
+        - TranscribePool(task: Callable, workers: int, cpu_threads: int, language: str, dictionary: Dict, hunspell_path: Path, hunspell_file: str, trace_pattern: List[str])
+        - submit(self, whisper_params: Dict, media_params: Dict, nlp_params: Tuple[Path, str, str, bool]) -> Future
+        - result(self, future: Future, nlp: CacheJSON) -> None | Dict
+        - shutdown(self) -> None
+
+    PRIVATE:
+     - _worker_init(prefs_data: Dict, trace_settings: Dict, trace_pattern: List[str], cpu_threads: int, language: str, dictionary: Dict, hunspell_path: Path, hunspell_file: str) -> None
+     - _worker_transcribe(task: Callable, whisper_params: Dict, media_params: Dict, nlp_params: Tuple[Path, str, str, bool]) -> Tuple[None | Dict, List[str], Dict, Dict, Dict, Dict]
+
+    whisper.yaml:
+      faster_whisper:
+        parallel:
+          workers: 4       # 1 -> serial (no worker process)
+          cpu_threads: 4   # per worker process
+
+    task (module level function -> pickled by reference):
+     - transcribe_fasterwhisper (main.py):  every worker process holds its own WhisperModel (loaded once via model_loaded_faster_whisper)
+     - reprocess_transcript (reprocess.py): post-processing of the cached transcripts only (no faster_whisper import)
+
+    spaCy and hunspell are loaded once per worker process,
+    the results are returned in the order of submission -> log_add/DictionaryLog.add in the main process
+    stage times (utils/timing.py) of the worker -> added to the stage times of the main process
+"""
+from __future__ import annotations
+
+import multiprocessing
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from helper.spelling import add_spell_counter, clear_spell_counter, get_spell_counter, hunspell_dictionary_init
+from helper.whisper_util import init_special_text
+from utils.prefs import Prefs
+from utils.timing import add_stage_times, clear_stage_times, get_stage_times, stage
+from utils.trace import Trace
+from utils.util import CacheJSON
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WorkerResult = Tuple[Dict[str, Any] | None, List[str], Dict[str, Any], Dict[str, int], Dict[str, int], Dict[str, float]]
+
+# worker process
+
+worker_dictionary: Dict[str, Any] = {}
+worker_trace_pattern: List[str] = []
+
+def get_parallel_settings() -> Tuple[int, int]:
+    workers     = int(Prefs.get("whisper.faster_whisper.parallel.workers", 1))
+    cpu_threads = int(Prefs.get("whisper.faster_whisper.parallel.cpu_threads", Prefs.get("whisper.faster_whisper.cpu_threads")))
+
+    return max(1, workers), max(1, cpu_threads)
+
+class TranscribePool:
+    def __init__(self, task: Callable[..., Dict[str, Any] | None], workers: int, cpu_threads: int, language: str, dictionary: Dict[str, Any], hunspell_path: Path, hunspell_file: str, trace_pattern: List[str]) -> None:
+        super().__init__()
+
+        self.task = task
+
+        # spawn (also on linux) -> no fork of the CTranslate2/OpenMP state of the main process
+
+        self.executor = ProcessPoolExecutor(
+            max_workers = workers,
+            mp_context  = multiprocessing.get_context("spawn"),
+            initializer = _worker_init,
+            initargs    = (Prefs.get_all(), dict(Trace.settings), trace_pattern, cpu_threads, language, dictionary, hunspell_path, hunspell_file),
+        )
+        Trace.info(f"transcribe pool: {workers} worker(s) with {cpu_threads} cpu thread(s)")
+
+    def submit(self, whisper_params: Dict[str, Any], media_params: Dict[str, Any], nlp_params: Tuple[Path, str, str, bool]) -> Future[WorkerResult]:
+        params = {key: value for key, value in whisper_params.items() if key != "dictionary"} # dictionary -> once per worker (initargs)
+
+        return self.executor.submit(_worker_transcribe, self.task, params, media_params, nlp_params)
+
+    def result(self, future: Future[WorkerResult], nlp: CacheJSON) -> Dict[str, Any] | None:
+        result, messages, nlp_added, spell_success, spell_failure, stages = future.result()
+
+        Trace.file_append(messages)
+
+        for value_hash, value in nlp_added.items():
+            if nlp.get(value_hash) is None:
+                nlp.add(value_hash, value)
+
+        add_spell_counter(spell_success, spell_failure)
+        add_stage_times(stages)
+
+        return result
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+def _worker_init(
+    prefs_data:    Dict[str, Any],
+    trace_settings: Dict[str, Any],
+    trace_pattern: List[str],
+    cpu_threads:   int,
+    language:      str,
+    dictionary:    Dict[str, Any],
+    hunspell_path: Path,
+    hunspell_file: str,
+) -> None:
+
+    global worker_dictionary, worker_trace_pattern
+
+    Prefs.set_all(prefs_data)
+    Prefs.set("whisper.faster_whisper.cpu_threads", cpu_threads)
+
+    Trace.set(**trace_settings)
+
+    worker_dictionary    = dictionary
+    worker_trace_pattern = trace_pattern
+
+    init_special_text(language)
+    hunspell_dictionary_init(hunspell_path, hunspell_file, language)
+
+def _worker_transcribe(task: Callable[..., Dict[str, Any] | None], whisper_params: Dict[str, Any], media_params: Dict[str, Any], nlp_params: Tuple[Path, str, str, bool]) -> WorkerResult:
+    nlp_path, nlp_name, nlp_model, nlp_reset = nlp_params
+
+    nlp = CacheJSON(nlp_path, nlp_name, nlp_model, nlp_reset, read_only=True)
+
+    whisper_params["dictionary"] = worker_dictionary
+
+    clear_spell_counter()
+    clear_stage_times()
+    Trace.file_init(worker_trace_pattern)
+
+    with stage("other"):
+        result = task(whisper_params, media_params, nlp)
+
+    messages = Trace.file_get()
+    Trace.file_init([])
+
+    spell_success, spell_failure = get_spell_counter()
+
+    return result, messages, nlp.added(), spell_success, spell_failure, get_stage_times()
@@ -1,18 +1,23 @@
 """
-    © Jürgen Schoenemeyer, 01.03.2025 18:03
+    © Jürgen Schoenemeyer, 18.10.2026 10:12
 
     src/helper/spelling.py
 
     PUBLIC:
      - hunspell_dictionary_init(path: str, filename: str, language: str = "de-DE") -> None:
      - spellcheck(words: List, debug: bool = False) -> Dict:
+     - get_spell_statistic() -> None
+
+     - get_spell_counter() -> Tuple[Dict, Dict]
+     - clear_spell_counter() -> None
+     - add_spell_counter(success: Dict, failure: Dict) -> None
 """
 from __future__ import annotations
 
 import re
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from spylls.hunspell import Dictionary  # type: ignore[import-untyped]
 
@@ -158,6 +163,22 @@ def check_multiple_words(word: str, index: int) -> int:
 
     return result
 
+# spell counter of a worker process -> main process (get_spell_statistic)
+
+def get_spell_counter() -> Tuple[Dict[str, int], Dict[str, int]]:
+    return dict(global_success), dict(global_failure)
+
+def clear_spell_counter() -> None:
+    global_success.clear()
+    global_failure.clear()
+
+def add_spell_counter(success: Dict[str, int], failure: Dict[str, int]) -> None:
+    for word, count in success.items():
+        global_success[word] = global_success.get(word, 0) + count
+
+    for word, count in failure.items():
+        global_failure[word] = global_failure.get(word, 0) + count
+
 @duration("Hunspell Dictionary result")
 def get_spell_statistic() -> None:
     path = Prefs.get("trace_all.path")
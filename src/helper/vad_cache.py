@@ -0,0 +1,48 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 18:50
+
+    src/helper/vad_cache.py
+
+    PUBLIC:
+     - load_speech_chunks(path: Path, media_md5: str, vad_key: str) -> None | List[Dict]
+     - save_speech_chunks(path: Path, media_md5: str, vad_key: str, options: Dict, speech_chunks: List[Dict]) -> None
+
+    <project>/04_settings/vad/<md5> - <vad key>.json
+     - options: all fields of VadOptions (+ stretches of the VAD engine), key: md5 of the options
+     - chunks:  [[start, end], ...] in samples (16 kHz) -> same values as get_speech_timestamps
+
+    one file per media file and options -> no conflict between worker processes (tmp + replace)
+    same VAD for all models x beams and all runs -> the ONNX model runs once per media file
+"""
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from utils.file import export_json, import_json
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+VAD_CACHE_VERSION: int = 1
+
+def load_speech_chunks(path: Path, media_md5: str, vad_key: str) -> None | List[Dict[str, int]]:
+    data = import_json(path, f"{media_md5} - {vad_key}.json", show_error=False)
+    if data is None or data.get("version") != VAD_CACHE_VERSION:
+        return None
+
+    return [{"start": int(start), "end": int(end)} for start, end in data["chunks"]]
+
+def save_speech_chunks(path: Path, media_md5: str, vad_key: str, options: Dict[str, Any], speech_chunks: List[Dict[str, int]]) -> None:
+    data = {
+        "version": VAD_CACHE_VERSION,
+        "md5":     media_md5,
+        "options": options,
+        "chunks":  [[chunk["start"], chunk["end"]] for chunk in speech_chunks],
+    }
+
+    filename = f"{media_md5} - {vad_key}.json"
+    filename_tmp = f"{media_md5} - {vad_key}.{os.getpid()}.tmp"
+    if export_json(path, filename_tmp, data, show_message=False) is not None:  # False: same tmp file from an aborted run
+        (path / filename_tmp).replace(path / filename)
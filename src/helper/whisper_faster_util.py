@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 01.03.2025 18:04
+    © Jürgen Schoenemeyer, 18.10.2026 20:10
 
     src/helper/whisper_faster_util.py
 
@@ -83,6 +83,10 @@ def get_settings_transcribe_faster(info: Dict[str, Any], media_type: str, media_
         settings["transcription_options"] = None
         Trace.error(f"{err}")
 
+    # adaptive_beam: Optional[Dict] -> windows decoded greedy + escalated to beam_size (complete after the segments)
+
+    settings["adaptive_beam"] = getattr(info, "adaptive_beam", None)
+
     # vad_options: Optional[VadOptions]
 
     try:
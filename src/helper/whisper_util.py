@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 01.03.2025 17:52
+    © Jürgen Schoenemeyer, 18.10.2026 21:10
 
     src/helper/whisper_util.py
 
@@ -9,6 +9,7 @@
      - split_to_sentences(words: Dict, Dictionary: Dict) -> List:
 
      - get_filename_parameter(params: Dict) -> str:
+     - get_cached_adaptive_beam(params: Dict, media_name: str, cached: Dict) -> None | Dict:
      - are_prompts_allowed(model_name) -> bool:
      - are_inner_prompts_possible(model_name) -> bool:
      - prompt_main_normalize(text: str) -> str:
@@ -21,13 +22,16 @@
 import hashlib
 import re
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
 import numpy as np
 
 from helper.spelling import spellcheck
 from primary.spacy import analyse_sentences_spacy
+from utils.file import import_json
 from utils.prefs import Prefs
+from utils.timing import stage
 from utils.trace import Trace
 from utils.util import CacheJSON, format_timestamp
 
@@ -334,8 +338,26 @@ def get_filename_parameter(params: Dict[str, Any]) -> str:
 
     params_text += f"beam-{beam_size}"
 
+    # adaptive beam (faster-whisper, sequential): greedy first, beam only above the limits
+
+    adaptive_beam = params.get("adaptiveBeam")
+    if adaptive_beam:
+        params_text += f", adaptive lp={adaptive_beam['log_prob']} cr={adaptive_beam['compression_ratio']} ns={adaptive_beam['no_speech_prob']}"
+
     return f"[{engine}] [{model}] ({params_text})"
 
+def get_cached_adaptive_beam(params: Dict[str, Any], media_name: str, cached: Dict[str, Any]) -> None | Dict[str, Any]:
+    settings = cached.get("settings") or {}
+    if "adaptive_beam" in settings:
+        return settings["adaptive_beam"]
+
+    # json before the adaptive marker -> transcription options in 04_settings
+
+    whisper_parameter = get_filename_parameter(params)
+    transcribe_settings = import_json(Path(params["pathSettings"], whisper_parameter), f"{media_name} - {whisper_parameter}.json", show_error=False) or {}
+
+    return (transcribe_settings.get("transcription_options") or {}).get("adaptive_beam")
+
 ######################
 #   Pass 1
 ######################
@@ -778,21 +800,22 @@ def predict(words: List[Dict[str, Any]], index: int, limit: int) -> bool:
 
             line = format_euro(line)
 
-            for w in dictionary:
-                if w in line:
-                    count = line.count(w)
+            with stage("dictionary"):
+                for w in dictionary:
+                    if w in line:
+                        count = line.count(w)
 
-                    line = line.replace(w, dictionary[w][0])
-                    corr_text = f"[{w}] => [{dictionary[w][0]}]"
+                        line = line.replace(w, dictionary[w][0])
+                        corr_text = f"[{w}] => [{dictionary[w][0]}]"
 
-                    if corr_text in corrected_details:
-                        corrected_details[corr_text]["count"] += count
-                    else:
-                        corrected_details[corr_text] = {
-                            "count":     count,
-                            "worksheet": dictionary[w][1],
-                            "row":       dictionary[w][2],
-                        }
+                        if corr_text in corrected_details:
+                            corrected_details[corr_text]["count"] += count
+                        else:
+                            corrected_details[corr_text] = {
+                                "count":     count,
+                                "worksheet": dictionary[w][1],
+                                "row":       dictionary[w][2],
+                            }
 
             line = line.replace(" …", "").replace("  ", " ").replace("...", "…")  # .replace("..", ".") # usw..
             lines += line
@@ -830,7 +853,8 @@ def predict(words: List[Dict[str, Any]], index: int, limit: int) -> bool:
     if len(corrected_details) > 0:
         Trace.warning(f"corrected count: {corrected_details}")
 
-    spelling_result = spellcheck(lines.strip().split(" "))
+    with stage("spellcheck"):
+        spelling_result = spellcheck(lines.strip().split(" "))
 
     return captions, text, lines.strip(), corrected_details, spelling_result
 
@@ -857,9 +881,10 @@ def split_to_sentences(words: List[Dict[str, Any]], dictionary: Dict[str, Any])
             end  = word_info["end"]
             text = format_euro(text)
 
-            for w in dictionary:
-                if w in text:
-                    text = text.replace(w, dictionary[w][0])
+            with stage("dictionary"):
+                for w in dictionary:
+                    if w in text:
+                        text = text.replace(w, dictionary[w][0])
 
             # text = text.replace(" …", "").replace("  ", " ").replace("...", "…")
 
@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 01.03.2025 17:52
+    © Jürgen Schoenemeyer, 18.10.2026 16:40
 
     src/primary/spacy.py
 
@@ -22,6 +22,7 @@
 from utils.decorator import duration
 from utils.globals import BASE_PATH
 from utils.prefs import Prefs
+from utils.timing import stage
 from utils.trace import Trace
 
 # https://spacy.io/models/de
@@ -112,7 +113,8 @@ def analyse_sentences_spacy(text: str, language: str = "de-DE") -> Tuple[List[in
     sentence_start = []
     sentence_end   = []
 
-    tokens = nlp(re.sub('[″‟“”„»«"]', "'", text)) # normalize QUOTES
+    with stage("spacy"):
+        tokens = nlp(re.sub('[″‟“”„»«"]', "'", text)) # normalize QUOTES
 
     # inconsistent behavior at the beginning of a text
     #
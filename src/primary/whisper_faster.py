@@ -1,47 +1,100 @@
 """
-    © Jürgen Schoenemeyer, 14.03.2025 00:13
+    © Jürgen Schoenemeyer, 18.10.2026 21:35
 
     src/primary/whisper_faster.py
 
     PUBLIC:
      - precheck_models(models: List) -> bool
      - search_model_path(model_name: str) -> str
+     - get_version_faster_whisper() -> str
      - model_loaded_faster_whisper(model_name: str) -> None | WhisperModel
-     - transcribe_fasterwhisper(project_params: Dict, media_params: Dict, cache_nlp: CacheJSON) -> str | Dict
+     - preload_faster_whisper(model_name: str) -> bool
+     - get_vad_parameter(vad_enabled: bool) -> None | Dict
+     - get_vad_engine() -> Dict
+     - get_split_settings() -> Dict
+     - get_batch_size() -> int
+     - get_pack_settings() -> Dict
+     - get_block_features() -> bool
+     - get_encoder_lookahead() -> int
+     - get_adaptive_beam() -> None | Dict
+     - split_speech_chunks(speech_chunks: List[Dict], max_samples: int) -> List[List[Dict]]
+     - get_frontend_cache() -> CacheArray
+     - get_encoder_cache() -> None | CacheArray
+     - ingest_media(media_pathname: Path, media_md5: None | str = None, media_info: None | Dict = None, keep_open: bool = False) -> None | Dict
+     - get_audio_vad(media_md5: str, source: Path | BinaryIO, vad_parameter: None | Dict, path_pcm: None | Path = None, path_vad: None | Path = None) -> Tuple[np.ndarray | PcmAudio, None | List[Dict]]
+     - get_features(media_md5: str, vad_parameter: None | Dict, audio: np.ndarray | PcmAudio, speech_chunks: None | List[Dict], feature_extractor: FeatureExtractor) -> np.ndarray | BlockFeatures
+     - prepare_media_faster_whisper(project_params: Dict, media_params: Dict, vad_parameter: None | Dict = None) -> None | Dict
+     - pack_media_faster_whisper(project_params: Dict, media_list: List[Dict]) -> Dict[str, Dict]
+     - transcribe_fasterwhisper(project_params: Dict, media_params: Dict, cache_nlp: CacheJSON, prefetched: None | Dict = None) -> str | Dict
+
+    PRIVATE:
+     - _transcribe_media(project_params: Dict, media_params: Dict, prefetched: None | Dict) -> None | Tuple[Dict, float]
+     - _get_transcribe_options(language: str, prompt: None | str, condition_on_previous_text: bool, beam_size: int, vad_enabled: bool, vad_parameter: None | Dict) -> Dict
+     - _get_features_key(media_md5: str, vad_parameter: None | Dict, feature_extractor: FeatureExtractor) -> str
+     - _get_vad_key(vad_parameter: None | Dict) -> str
+     - _get_vad_options(vad_parameter: Dict) -> Dict
+     - _get_path_vad(project_params: Dict) -> None | Path
+     - _close_source(source: Path | BinaryIO) -> None
+     - _transcribe_split(model: WhisperModel, audio: np.ndarray | PcmAudio, speech_chunks: List[Dict], options: Dict, split: Dict) -> Tuple[List[Segment], TranscriptionInfo, int, List[Dict]]
+     - _transcribe_batched(model: WhisperModel, audio: np.ndarray | PcmAudio, speech_chunks: List[Dict], options: Dict, batch_size: int) -> Tuple[Iterable[Segment], TranscriptionInfo, int, List[Dict]]
+
+    whisper.yaml -> faster_whisper:
+     - cache:             front-end LRU of audio, VAD speech chunks and log-mel per media md5 (all models x beams)
+     - cache.pcm:         16 kHz int16 per md5 in <project>/03_audio/pcm, memory mapped
+     - vad:               ONNX threads, optional independent stretches in one batch
+     - split:             long files cut at VAD silences, the parts transcribed at the same time
+     - batched:           BatchedInferencePipeline, 'batch_size' windows per encode + generate (only with VAD)
+     - pack:              short files of a run in shared batches (primary/whisper_faster_pack.py)
+     - block_features:    log-mel in 30 sec blocks (BlockFeatures), not cached
+     - encoder_cache:     encoder output per 30 sec window, reused by the beams, prompts and temperatures of a sweep
+     - encoder_lookahead: > 1: the next windows encoded in one batch (check: benchmark.py encoder)
+     - adaptive_beam:     greedy first, beam_size only for windows that cross the limits
 """
 from __future__ import annotations
 
+import dataclasses
 import hashlib
-import io
+import json
 import logging
 import platform
 import sys
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Tuple
 
 import arrow
+import numpy as np
 
-import faster_whisper
-
-from faster_whisper import WhisperModel
-from helper.captions import export_srt, export_vtt
-from helper.excel_write import export_text_to_speech_excel
+from helper.postprocess import postprocess_transcript
+from helper.vad_cache import load_speech_chunks, save_speech_chunks
 from helper.whisper_faster_util import get_settings_transcribe_faster
-from helper.whisper_util import are_prompts_allowed, get_filename_parameter, prepare_words, split_to_lines, split_to_sentences
-from utils.file import export_json, export_text, get_file_infos, get_modification_timestamp, import_json_timestamp, set_modification_timestamp
+from helper.whisper_util import are_prompts_allowed, get_cached_adaptive_beam, get_filename_parameter
+from utils.file import export_json, get_file_infos, get_modification_timestamp, get_stream_md5, import_json_timestamp, set_modification_timestamp
 from utils.globals import BASE_PATH
 from utils.metadata import get_media_info
+from utils.pcm import PcmAudio, load_pcm, save_pcm
 from utils.prefs import Prefs
+from utils.timing import add_stage_times, clear_stage_times, get_stage_times, stage
 from utils.trace import Trace
-from utils.util import CacheJSON, format_subtitle
+from utils.util import CacheArray, CacheJSON, format_subtitle
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from faster_whisper.feature_extractor import BlockFeatures, FeatureExtractor
+    from faster_whisper.transcribe import Segment, TranscriptionInfo
 
 # https://github.com/SYSTRAN/faster-whisper
 
+BATCHED_CHUNK_LENGTH: int = 30 # sec, window of the feature extractor
+
 current_model_name: str = "none"
 current_model: Any = None
 
+frontend_cache: CacheArray | None = None
+encoder_cache:  CacheArray | None = None
+
 logging.basicConfig()
 logging.getLogger("faster_whisper").setLevel(logging.DEBUG)
 
@@ -85,9 +138,16 @@ def search_model_path(model_name: str) -> None | str:
     else:
         return None
 
+def get_version_faster_whisper() -> str:
+    import faster_whisper  # noqa: PLC0415 # CTranslate2 only if needed
+
+    return faster_whisper.__version__
+
 def model_loaded_faster_whisper(model_name: str) -> None | WhisperModel:
     global current_model_name
 
+    from faster_whisper import WhisperModel  # noqa: PLC0415 # CTranslate2 only if needed
+
     """
         model_size_or_path: str,
         device: str = "auto",
@@ -110,9 +170,12 @@ def model_loaded_faster_whisper(model_name: str) -> None | WhisperModel:
         Trace.info(f"load '{model_path}'")
         cpu_threads = Prefs.get("whisper.faster_whisper.cpu_threads")
 
+        split = get_split_settings()
+        num_workers = split["workers"] if split["chunk_s"] > 0 else 1  # split: parts in parallel threads
+
         start_time = time.time()
         try:
-            model = WhisperModel(model_size_or_path=model_path, device="cpu", compute_type="int8", cpu_threads=cpu_threads)           # int auf CPU, kein float möglich # cpu 7
+            model = WhisperModel(model_size_or_path=model_path, device="cpu", compute_type="int8", cpu_threads=cpu_threads, num_workers=num_workers) # int auf CPU, kein float möglich # cpu 7
             # model = WhisperModel(model_name, device="cuda", compute_type="int8_float16") # int auf GPU
             # model = WhisperModel(model_name, device="cuda", compute_type="float16")      # float auf GPU
             current_model_name = model_name
@@ -128,7 +191,359 @@ def model_loaded_faster_whisper(model_name: str) -> None | WhisperModel:
     else:
         return None
 
-def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[str, Any], cache_nlp: CacheJSON) -> None | Dict[str, Any]:
+def preload_faster_whisper(model_name: str) -> bool: # daemon.py -> model warm before the first job
+    global current_model
+
+    if model_name == current_model_name:
+        return True
+
+    model = model_loaded_faster_whisper(model_name)
+    if model is None:
+        return False
+
+    current_model = model
+    return True
+
+def get_vad_parameter(vad_enabled: bool) -> None | Dict[str, Any]:
+    if not vad_enabled:
+        return None
+
+    # Attributes:
+    #   threshold: Speech threshold. Silero VAD outputs speech probabilities for each audio chunk,
+    #     probabilities ABOVE this value are considered as SPEECH. It is better to tune this
+    #     parameter for each dataset separately, but "lazy" 0.5 is pretty good for most datasets.
+    #   neg_threshold: Silence threshold for determining the end of speech. If a probability is lower
+    #     than neg_threshold, it is always considered silence. Values higher than neg_threshold
+    #     are only considered speech if the previous sample was classified as speech; otherwise,
+    #     they are treated as silence. This parameter helps refine the detection of speech
+    #      transitions, ensuring smoother segment boundaries.
+    #   min_speech_duration_ms: Final speech chunks shorter min_speech_duration_ms are thrown out.
+    #   max_speech_duration_s: Maximum duration of speech chunks in seconds. Chunks longer
+    #     than max_speech_duration_s will be split at the timestamp of the last silence that
+    #     lasts more than 100ms (if any), to prevent aggressive cutting. Otherwise, they will be
+    #     split aggressively just before max_speech_duration_s.
+    #   min_silence_duration_ms: In the end of each speech chunk wait for min_silence_duration_ms
+    #     before separating it
+    #   speech_pad_ms: Final speech chunks are padded by speech_pad_ms each side
+    #
+    # default:
+    #  - threshold               = 0.5
+    #  - neg_threshold           = threshold - 0.15
+    #  - min_speech_duration_ms  = 0
+    #  - max_speech_duration_s   = float("inf")
+    #  - min_silence_duration_ms = 2000
+    #  - speech_pad_ms           = 400
+
+    vad_parameter: Dict[str, Any] = {
+        "min_speech_duration_ms": 250,
+        "speech_pad_ms":          (600, 100),
+    }
+
+    if get_batch_size() > 0: # batched: every speech chunk within one window of 30 sec (merge_segments)
+        vad_parameter["max_speech_duration_s"] = BATCHED_CHUNK_LENGTH
+
+    return vad_parameter
+
+def get_vad_engine() -> Dict[str, int]:
+    sampling_rate = 16000
+
+    return {
+        "threads":         max(1, int(Prefs.get("whisper.faster_whisper.vad.threads", 1))),
+        "stretch_samples": int(Prefs.get("whisper.faster_whisper.vad.stretch_s", 0) * sampling_rate),
+        "warmup_samples":  int(Prefs.get("whisper.faster_whisper.vad.warmup_s", 0) * sampling_rate),
+    }
+
+def get_split_settings() -> Dict[str, Any]:
+    return {
+        "chunk_s": float(Prefs.get("whisper.faster_whisper.split.chunk_s", 0)),
+        "min_s":   float(Prefs.get("whisper.faster_whisper.split.min_s", 0)),
+        "workers": max(1, int(Prefs.get("whisper.faster_whisper.split.workers", 1))),
+    }
+
+def get_batch_size() -> int:
+    return max(0, int(Prefs.get("whisper.faster_whisper.batched.batch_size", 0)))
+
+def get_pack_settings() -> Dict[str, Any]:
+    return {
+        "max_s":      float(Prefs.get("whisper.faster_whisper.pack.max_s", 0)),
+        "files":      max(1, int(Prefs.get("whisper.faster_whisper.pack.files", 16))),
+        "batch_size": max(1, int(Prefs.get("whisper.faster_whisper.pack.batch_size", 8))),
+    }
+
+def get_block_features() -> bool:
+    return bool(Prefs.get("whisper.faster_whisper.block_features", False))
+
+def get_encoder_lookahead() -> int:
+    return max(1, int(Prefs.get("whisper.faster_whisper.encoder_lookahead", 1)))
+
+def get_adaptive_beam() -> None | Dict[str, Any]: # sequential WhisperModel.transcribe only (not batched)
+    if not Prefs.get("whisper.faster_whisper.adaptive_beam.enabled", False) or get_batch_size() > 0:
+        return None
+
+    return {
+        "log_prob":          Prefs.get("whisper.faster_whisper.adaptive_beam.log_prob", -0.5),
+        "compression_ratio": Prefs.get("whisper.faster_whisper.adaptive_beam.compression_ratio", 2.0),
+        "no_speech_prob":    Prefs.get("whisper.faster_whisper.adaptive_beam.no_speech_prob", 0.4),
+    }
+
+def split_speech_chunks(speech_chunks: List[Dict[str, int]], max_samples: int) -> List[List[Dict[str, int]]]: # cut only between speech chunks (VAD silence)
+    parts: List[List[Dict[str, int]]] = []
+    current: List[Dict[str, int]] = []
+
+    for chunk in speech_chunks:
+        if current and chunk["end"] - current[0]["start"] > max_samples:
+            parts.append(current)
+            current = []
+        current.append(chunk)
+
+    if current:
+        parts.append(current)
+
+    return parts
+
+def get_frontend_cache() -> CacheArray:
+    global frontend_cache
+
+    if frontend_cache is None:
+        memory_mb = int(Prefs.get("whisper.faster_whisper.cache.memory_mb", 1024))
+
+        path = None
+        if Prefs.get("whisper.faster_whisper.cache.disk", False):
+            path = BASE_PATH / Prefs.get("whisper.faster_whisper.cache.path", "../cache/faster-whisper")
+
+        frontend_cache = CacheArray(memory_mb * 1024 * 1024, path)
+
+    return frontend_cache
+
+def get_encoder_cache() -> None | CacheArray:
+    global encoder_cache
+
+    memory_mb = int(Prefs.get("whisper.faster_whisper.encoder_cache.memory_mb", 0))
+    if memory_mb <= 0:
+        return None
+
+    if encoder_cache is None:
+        path = None
+        if Prefs.get("whisper.faster_whisper.encoder_cache.disk", False):
+            path = BASE_PATH / Prefs.get("whisper.faster_whisper.encoder_cache.path", "../cache/faster-whisper-encoder")
+
+        encoder_cache = CacheArray(memory_mb * 1024 * 1024, path)
+
+    return encoder_cache
+
+def ingest_media(media_pathname: Path, media_md5: None | str = None, media_info: None | Dict[str, Any] = None, keep_open: bool = False) -> None | Dict[str, Any]:
+    source: Path | BinaryIO = media_pathname # keep_open: the handle of md5 + MediaInfo for decode_audio (caller closes it)
+
+    if media_md5 is None or media_info is None:
+        f = media_pathname.open(mode="rb")  # noqa: SIM115
+        with stage("media"):
+            if media_md5 is None:
+                media_md5 = get_stream_md5(f)
+                f.seek(0)
+
+            media_info = get_media_info(f)
+            f.seek(0)
+
+        if media_info is None or not keep_open:
+            f.close()
+        else:
+            source = f
+
+        if media_info is None:
+            return None
+
+    file_info = get_file_infos( media_pathname.parent, media_pathname.name, media_pathname.suffix[1:], md5 = media_md5 )
+    if file_info is None:
+        _close_source(source)
+        return None
+
+    return {
+        "fileInfo":  file_info,
+        "md5":       media_md5,
+        "mediaInfo": media_info,
+        "source":    source,
+    }
+
+def get_audio_vad(media_md5: str, source: Path | BinaryIO, vad_parameter: None | Dict[str, Any], path_pcm: None | Path = None, path_vad: None | Path = None) -> Tuple[np.ndarray | PcmAudio, None | List[Dict[str, int]]]:
+    from faster_whisper.audio import decode_audio  # noqa: PLC0415 # CTranslate2 only if needed
+    from faster_whisper.vad import VadOptions, get_speech_timestamps  # noqa: PLC0415
+
+    cache = get_frontend_cache()
+
+    audio: np.ndarray | PcmAudio | None
+    if path_pcm is not None and Prefs.get("whisper.faster_whisper.cache.pcm", False):
+        audio = load_pcm(path_pcm, media_md5)
+        if audio is None:
+            with stage("decode"):
+                pcm = decode_audio(str(source) if isinstance(source, Path) else source, pcm16=True)
+                audio = save_pcm(path_pcm, media_md5, pcm)
+    else:
+        audio = cache.get(f"{media_md5}-audio")
+        if audio is None:
+            with stage("decode"):
+                audio = decode_audio(str(source) if isinstance(source, Path) else source)
+            cache.add(f"{media_md5}-audio", audio)
+
+    if vad_parameter is None:
+        return audio, None
+
+    vad_key = _get_vad_key(vad_parameter)
+    key = f"{media_md5}-vad-{vad_key}"
+
+    chunks = cache.get(key)
+    if chunks is not None:
+        return audio, [{"start": int(start), "end": int(end)} for start, end in chunks]
+
+    speech_chunks = None
+    if path_vad is not None:
+        speech_chunks = load_speech_chunks(path_vad, media_md5, vad_key)
+
+    if speech_chunks is None:
+        with stage("vad"):
+            speech_chunks = get_speech_timestamps(audio, VadOptions(**vad_parameter), **get_vad_engine())
+
+        if path_vad is not None:
+            save_speech_chunks(path_vad, media_md5, vad_key, _get_vad_options(vad_parameter), speech_chunks)
+
+    cache.add(key, np.array([[chunk["start"], chunk["end"]] for chunk in speech_chunks], dtype=np.int64).reshape(-1, 2))
+
+    return audio, speech_chunks
+
+def get_features(media_md5: str, vad_parameter: None | Dict[str, Any], audio: np.ndarray | PcmAudio, speech_chunks: None | List[Dict[str, int]], feature_extractor: FeatureExtractor) -> np.ndarray | BlockFeatures:
+    from faster_whisper.feature_extractor import BlockFeatures  # noqa: PLC0415
+    from faster_whisper.vad import ConcatenatedChunks  # noqa: PLC0415
+
+    samples = ConcatenatedChunks(audio, speech_chunks) if speech_chunks is not None else audio # same as WhisperModel.transcribe (vad_filter), without the copy
+
+    if get_block_features(): # less memory: full pass for the maximum at the first window, then per window (stage transcribe)
+        return BlockFeatures(feature_extractor, samples)
+
+    cache = get_frontend_cache()
+    key = _get_features_key(media_md5, vad_parameter, feature_extractor)
+
+    features = cache.get(key)
+    if features is None:
+        with stage("features"):
+            features = feature_extractor(samples) # float32 only per block of the log-mel
+        cache.add(key, features)
+
+    return features
+
+def prepare_media_faster_whisper(project_params: Dict[str, Any], media_params: Dict[str, Any], vad_parameter: None | Dict[str, Any] = None) -> None | Dict[str, Any]:
+    media_type = project_params["type"]
+    path_media = project_params["mediaPath"]
+    media_name = media_params["mediaFile"]
+
+    media_pathname = Path(path_media, media_name + "." + media_type)
+    if not media_pathname.is_file():
+        return None
+
+    clear_stage_times() # prefetch thread -> stage times of this file only
+
+    start_time = time.time()
+
+    media = ingest_media(media_pathname, media_params.get("mediaMd5"), media_params.get("mediaInfo"), keep_open=True)
+    if media is None:
+        return None
+
+    time_media = time.time() - start_time
+
+    if vad_parameter is None:
+        vad_parameter = get_vad_parameter(project_params["VAD"])
+
+    source = media.pop("source")
+    try:
+        audio, speech_chunks = get_audio_vad(media["md5"], source, vad_parameter, project_params.get("pathPcm"), _get_path_vad(project_params))
+    finally:
+        _close_source(source)
+
+    return {
+        **media,
+        "timeMedia":    time_media,
+        "audio":        audio,
+        "speechChunks": speech_chunks,
+        "stages":       get_stage_times(),
+    }
+
+def pack_media_faster_whisper(project_params: Dict[str, Any], media_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    global current_model
+
+    from primary.whisper_faster_pack import transcribe_packed  # noqa: PLC0415 # CTranslate2 only if needed
+
+    model_name = project_params["modelName"]
+    pack       = get_pack_settings()
+
+    if model_name != current_model_name:
+        with stage("loadModel"):
+            ret = model_loaded_faster_whisper(model_name)
+        if ret is None:
+            Trace.fatal(f"model '{model_name}' not found")
+        current_model = ret
+
+    prompts_allowed = are_prompts_allowed(model_name)
+
+    # windows of max. 30 sec -> VAD with max_speech_duration_s (other VAD key than the sequential transcription)
+
+    vad_parameter: Dict[str, Any] = {**(get_vad_parameter(True) or {}), "max_speech_duration_s": BATCHED_CHUNK_LENGTH}
+
+    prepared: Dict[str, Dict[str, Any]] = {}
+    files: List[Dict[str, Any]] = []
+    for media_params in media_list:
+        data = prepare_media_faster_whisper(project_params, media_params, vad_parameter)
+        if data is None:
+            continue
+
+        prompt = None if project_params["noPrompt"] or not prompts_allowed else media_params["prompt"]
+        options = _get_transcribe_options(project_params["language"], prompt, project_params["innerPrompt"] and prompts_allowed, project_params["beam"], True, vad_parameter)
+
+        prepared[media_params["mediaFile"]] = data
+        files.append({"audio": data["audio"], "speechChunks": data["speechChunks"], "options": options})
+
+    if len(files) == 0:
+        return {}
+
+    start_time = time.time()
+    results = transcribe_packed(current_model, files, pack["batch_size"])
+    duration = time.time() - start_time
+
+    audio = sum(result[1].duration for result in results)
+    Trace.result(f"packed: {len(files)} files, {audio:.0f} sec audio in {duration:.1f} sec ({audio / duration if duration > 0 else 0:.1f} sec audio/sec)")
+
+    for data, (segments, info, sampling_rate, speech_chunks, stages) in zip(prepared.values(), results, strict=True):
+        data["audio"]       = None # log-mel already used -> memory
+        data["transcribed"] = (segments, info, sampling_rate, speech_chunks)
+        for name, seconds in stages.items():
+            data["stages"][name] = data["stages"].get(name, 0.0) + seconds
+
+    return prepared
+
+def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[str, Any], cache_nlp: CacheJSON, prefetched: None | Dict[str, Any] = None) -> None | Dict[str, Any]:
+    path_json_base  = project_params["pathJson"]
+    media_name      = media_params["mediaFile"]
+
+    whisper_parameter = get_filename_parameter(project_params)
+    filename_two = f"{media_name} - {whisper_parameter}"
+
+    path_json = Path(path_json_base, whisper_parameter)
+
+    # md5 already checked by CachePlanner (main.py) -> no second read of the media file
+
+    result: Dict[str, Any] | None = None
+    timestamp: float = 0.0
+    if media_params.get("cacheState") == "cached":
+        with stage("load_json"):
+            result, timestamp = import_json_timestamp(path_json, filename_two + ".json", show_error=False)
+
+    if result is None:
+        ret = _transcribe_media(project_params, media_params, prefetched)
+        if ret is None:
+            return None
+
+        result, timestamp = ret
+
+    return postprocess_transcript(project_params, media_params, cache_nlp, result, timestamp)
+
+def _transcribe_media(project_params: Dict[str, Any], media_params: Dict[str, Any], prefetched: None | Dict[str, Any]) -> None | Tuple[Dict[str, Any], float]:
     global current_model
 
     # inModelID     = project_params["modelNumber"]
@@ -138,24 +553,14 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
     beam_size       = project_params["beam"]
     vad_enabled     = project_params["VAD"]
 
-    dictionary_data      = project_params["dictionary"]
-    dictionary_timestamp = project_params["dictionary_timestamp"]
-
     media_type      = project_params["type"]
 
     path_media      = project_params["mediaPath"]
     path_json_base  = project_params["pathJson"]
-    path_text       = project_params["pathText"]
-    path_vtt        = project_params["pathVtt"]
-    path_srt        = project_params["pathSrt"]
-    path_excel      = project_params["pathExcel"]
     path_settings   = project_params["pathSettings"]
-    modelname_nlp   = project_params["modelNameNLP"]
 
     media_name      = media_params["mediaFile"]
-    subfolder       = media_params["subFolder"]
     prompt          = media_params["prompt"]
-    is_intro        = media_params["isIntro"]
 
     verbose = True
 
@@ -171,28 +576,39 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
     whisper_parameter = get_filename_parameter(project_params)
     filename_two = f"{media_name} - {whisper_parameter}"
 
+    source: Path | BinaryIO = media_pathname
+
     start_time = time.time()
     if not media_pathname.is_file():
         Trace.error(f"media not found '{media_pathname}'")
         return None
+    elif prefetched:
+        file_info  = prefetched["fileInfo"]
+        media_md5  = prefetched["md5"]
+        media_info = prefetched["mediaInfo"]
+        if prefetched.get("background"): # prefetch thread, overlapped with the previous file -> not in rtf (helper/report.py)
+            add_stage_times({"prefetch_" + name: seconds for name, seconds in prefetched["stages"].items()})
+        else:
+            add_stage_times(prefetched["stages"])
     else:
-        file_info = get_file_infos( path_media, media_name + "." + media_type,  media_type )
-        if file_info is None:
+        media = ingest_media(media_pathname, media_params.get("mediaMd5"), media_params.get("mediaInfo"), keep_open=True)
+        if media is None:
             return None
 
-        with Path.open(media_pathname, "rb") as f:
-            file = f.read()
-            media_md5 = hashlib.md5(file).hexdigest()
-            media_info = get_media_info(io.BytesIO(file))
-            if media_info is None:
-                return None
+        file_info  = media["fileInfo"]
+        media_md5  = media["md5"]
+        media_info = media["mediaInfo"]
+        source     = media["source"]
 
-    duration = time.time() - start_time
+    if prefetched:
+        duration = prefetched["timeMedia"]
+    else:
+        duration = time.time() - start_time
 
     result: Dict[str, Any] = {
         "version": {
             "python": sys.version,
-            "faster-whisper": faster_whisper.__version__,
+            "faster-whisper": "",
         },
         "settings": {
             "model": model_name,
@@ -200,6 +616,7 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
             "vad": vad_enabled,
             "beam_size": beam_size,
             "condition_on_previous_text": condition_on_previous_text,
+            "adaptive_beam": project_params.get("adaptiveBeam"),
             "no_speech_threshold": None,
             "max_initial_timestamp": 0,
         },
@@ -227,41 +644,8 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
     }
 
     path_json     = Path(path_json_base, whisper_parameter)
-    path_json_tmp = Path(path_json, "tmp")
-
-    vad_parameter: None | Dict[str, Any] = None
-    if vad_enabled:
-
-        # Attributes:
-        #   threshold: Speech threshold. Silero VAD outputs speech probabilities for each audio chunk,
-        #     probabilities ABOVE this value are considered as SPEECH. It is better to tune this
-        #     parameter for each dataset separately, but "lazy" 0.5 is pretty good for most datasets.
-        #   neg_threshold: Silence threshold for determining the end of speech. If a probability is lower
-        #     than neg_threshold, it is always considered silence. Values higher than neg_threshold
-        #     are only considered speech if the previous sample was classified as speech; otherwise,
-        #     they are treated as silence. This parameter helps refine the detection of speech
-        #      transitions, ensuring smoother segment boundaries.
-        #   min_speech_duration_ms: Final speech chunks shorter min_speech_duration_ms are thrown out.
-        #   max_speech_duration_s: Maximum duration of speech chunks in seconds. Chunks longer
-        #     than max_speech_duration_s will be split at the timestamp of the last silence that
-        #     lasts more than 100ms (if any), to prevent aggressive cutting. Otherwise, they will be
-        #     split aggressively just before max_speech_duration_s.
-        #   min_silence_duration_ms: In the end of each speech chunk wait for min_silence_duration_ms
-        #     before separating it
-        #   speech_pad_ms: Final speech chunks are padded by speech_pad_ms each side
-        #
-        # default:
-        #  - threshold               = 0.5
-        #  - neg_threshold           = threshold - 0.15
-        #  - min_speech_duration_ms  = 0
-        #  - max_speech_duration_s   = float("inf")
-        #  - min_silence_duration_ms = 2000
-        #  - speech_pad_ms           = 400
-
-        vad_parameter = {
-            "min_speech_duration_ms": 250,
-            "speech_pad_ms":          (600, 100),
-        }
+
+    vad_parameter = get_vad_parameter(vad_enabled)
 
     cached, timestamp = import_json_timestamp(path_json, filename_two + ".json", show_error=False)
 
@@ -281,6 +665,8 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
 
                 timestamp = get_modification_timestamp(file_path)
 
+                result["version"]["faster-whisper"] = get_version_faster_whisper()
+
                 result["created"]  = file_info["date"]
                 result["language"] = str(cached["language"]).split("-")[0]
                 result["text"]     = cached["text"]
@@ -295,13 +681,27 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
         if md5 == "":
             Trace.fatal(f"unknown cache format {Path(path_json, filename_two + '.json')}")
 
-        if md5 == media_md5:
+        if md5 != media_md5:
+            Trace.warning(f"media changed -> transcribed again: {media_pathname}")
+            cached = None
+            timestamp = 0.0
+        elif get_cached_adaptive_beam(project_params, media_name, cached) != project_params.get("adaptiveBeam"):
+            Trace.warning(f"adaptive beam changed -> transcribed again: {media_pathname}")
+            cached = None
+            timestamp = 0.0
+        else:
             result = cached
 
-    else:
+    if cached:
+        _close_source(source) # json from cache -> no decode
+
+    if not cached:
+        result["version"]["faster-whisper"] = get_version_faster_whisper()
+
         if model_name != current_model_name:
             start_time = time.time()
-            ret = model_loaded_faster_whisper(model_name)
+            with stage("loadModel"):
+                ret = model_loaded_faster_whisper(model_name)
             if ret is not None:
                 current_model = ret
             else:
@@ -319,62 +719,76 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
             curr_prompt = prompt
 
         start_time = time.time()
-        segments, info, vad_sampling_rate, vad_speech_chunks = current_model.transcribe(
-            str(media_pathname),
-            language = language.split("-")[0],
-            initial_prompt = curr_prompt,
-            condition_on_previous_text = condition_on_previous_text, # für large-v3 unbedingt nötig default True
-
-            beam_size = beam_size,  # default 5 (1 schneller, minimal ungenauer)
-                                    # v3: ab beam 3 + condition_on_previous_text TRUE => Wiederholungen)
-            # patience  = 1,        # https://www.arxiv-vanity.com/papers/2204.05424/
-
-            word_timestamps = True,
-
-            temperature = [0.0, 0.1, 0.2, 0.4, 0.6, 0.8, 1],  # new 0.1 => delete prompt
-            # temperature = [0.0, 0.2, 0.4, 0.6, 0.8, 1],
-
-            prompt_reset_on_temperature = 0.3,
-
-            # best_of = 5
-            # patience: 1 [0.5 .. 2]
-            # length_penalty = 1 [???] -> to select which to return among the beams or best-of-N samples
-
-            # https://github.com/SYSTRAN/faster-whisper/issues/478
-            # repetition_penalty   = default: 1.0 -> 1.1 / 1.2 / ...   (not in OpenAi impl.)
-            # no_repeat_ngram_size = default: 0 -> 1 / 2 / 3 (not in OpenAi impl.)
-
-            # compression_ratio_threshold = 2.4
-
-            no_speech_threshold = None,  # default 0.6 verursacht, dass 30 sec Abschnitte komplett leer sind
-            max_initial_timestamp = 0,   # default 1.0
+        if prefetched:
+            audio         = prefetched["audio"]         # decoded (np.ndarray or PcmAudio) in the background
+            speech_chunks = prefetched["speechChunks"]
+        else:
+            try:
+                audio, speech_chunks = get_audio_vad(media_md5, source, vad_parameter, project_params.get("pathPcm"), _get_path_vad(project_params))
+            finally:
+                _close_source(source)
+
+        transcribe_options = _get_transcribe_options(language, curr_prompt, condition_on_previous_text, beam_size, vad_enabled, vad_parameter)
+
+        batch_size = get_batch_size()
+        split      = get_split_settings()
+        if prefetched and "transcribed" in prefetched: # packed with other short files (pack_media_faster_whisper)
+            segments, info, vad_sampling_rate, vad_speech_chunks = prefetched["transcribed"]
+            result["settings"]["batch_size"] = get_pack_settings()["batch_size"]
+            result["settings"]["packed"]     = True
+        elif batch_size > 0 and speech_chunks is not None:
+            segments, info, vad_sampling_rate, vad_speech_chunks = _transcribe_batched(current_model, audio, speech_chunks, transcribe_options, batch_size)
+            result["settings"]["batch_size"] = batch_size
+        elif split["chunk_s"] > 0 and speech_chunks and len(audio) / 16000 > split["min_s"]:
+            with stage("transcribe"): # all parts (encoder, decoder, alignment in the threads)
+                segments, info, vad_sampling_rate, vad_speech_chunks = _transcribe_split(current_model, audio, speech_chunks, {**transcribe_options, "adaptive_beam": project_params.get("adaptiveBeam")}, split)
+            result["settings"]["split"] = split["chunk_s"]
+        else:
+            features = get_features(media_md5, vad_parameter, audio, speech_chunks, current_model.feature_extractor)
 
-            vad_filter = vad_enabled,
-            vad_parameters = vad_parameter,
-        )
+            cache = get_encoder_cache()
+            if cache is not None:
+                encoder_cache = (cache, f"{model_name}-{_get_features_key(media_md5, vad_parameter, current_model.feature_extractor)}")
+            else:
+                encoder_cache = None
+
+            segments, info, vad_sampling_rate, vad_speech_chunks = current_model.transcribe(
+                audio,
+                speech_chunks = speech_chunks,
+                features = features,
+                encoder_cache = encoder_cache,
+                encoder_lookahead = get_encoder_lookahead(),
+                adaptive_beam = project_params.get("adaptiveBeam"),
+                **transcribe_options,
+            )
         duration = time.time() - start_time
         result["cpu"]["timeInitTranscribe"] = round(duration, 2)
 
         result["language"] = info.language
 
-        settings, result["media"]["details"] = get_settings_transcribe_faster(info, media_type, media_info, vad_sampling_rate, vad_speech_chunks)
-        export_json(Path(path_settings, whisper_parameter), filename_two + ".json", settings, timestamp = timestamp)
-
         text = ""
         start_time = time.time()
-        for segment in segments:
-            segment_info = segment._asdict()
-            text += segment_info["text"]
-            result["segments"].append(segment_info)
+        with stage("transcribe"): # segments -> lazy: encoder, decoder, alignment
+            for segment in segments:
+                segment_info = segment._asdict()
+                text += segment_info["text"]
+                result["segments"].append(segment_info)
+
+                result_log_list = segment_info["result_log"]
+                if result_log_list:
+                    Trace.warning(f"result_log_list: {result_log_list}")
+
+                if verbose:
+                    print( format_subtitle( segment_info["start"], segment_info["end"], segment_info["text"] ) )
 
-            result_log_list = segment_info["result_log"]
-            if result_log_list:
-                Trace.warning(f"result_log_list: {result_log_list}")
+                time.sleep(0)
 
-            if verbose:
-                print( format_subtitle( segment_info["start"], segment_info["end"], segment_info["text"] ) )
+        settings, result["media"]["details"] = get_settings_transcribe_faster(info, media_type, media_info, vad_sampling_rate, vad_speech_chunks) # after the segments: adaptive_beam counts
+        export_json(Path(path_settings, whisper_parameter), filename_two + ".json", settings, timestamp = timestamp)
 
-            time.sleep(0)
+        adaptive_beam = settings.get("adaptive_beam")
+        if adaptive_beam:
+            Trace.info(f"adaptive beam: {adaptive_beam['escalated']} of {adaptive_beam['windows']} windows with beam {beam_size}")
 
         result["text"] = text
         result["created"] = arrow.utcnow().to("Europe/Berlin").format()
@@ -385,56 +799,122 @@ def transcribe_fasterwhisper(project_params: Dict[str, Any], media_params: Dict[
 
         export_json(path_json, filename_two + ".json", result, timestamp = timestamp)
 
-    if result["text"] == "":
-        Trace.fatal(f"text empty {result}")
+    return result, timestamp
 
-    (words,
-        sentences,
-        _average_probability,  # not used
-        _standard_deviation,   # not used
-        last_segment_text,
-        repetition_error,
-        pause_error,
-    ) = prepare_words(result, True, is_intro, model_name, language, cache_nlp, media_name)
+def _get_transcribe_options(language: str, prompt: None | str, condition_on_previous_text: bool, beam_size: int, vad_enabled: bool, vad_parameter: None | Dict[str, Any]) -> Dict[str, Any]:
+    return dict(  # noqa: C408 # keyword style as in the faster-whisper docs
+        language = language.split("-", maxsplit=1)[0],
+        initial_prompt = prompt,
+        condition_on_previous_text = condition_on_previous_text, # für large-v3 unbedingt nötig default True
 
-    export_json(Path(path_json_tmp, modelname_nlp), filename_two + ".json", words, timestamp = timestamp)
+        beam_size = beam_size,  # default 5 (1 schneller, minimal ungenauer)
+                                # v3: ab beam 3 + condition_on_previous_text TRUE => Wiederholungen)
+        # patience  = 1,        # https://www.arxiv-vanity.com/papers/2204.05424/
 
-    (
-        cc,
-        text,
-        text_combined,
-        corrected_details,
-        spelling_result,
-    ) = split_to_lines(words, dictionary_data)
+        word_timestamps = True,
 
-    if timestamp:
-        if len(corrected_details)>0:
-            timestamp = max(timestamp, dictionary_timestamp)
+        temperature = [0.0, 0.1, 0.2, 0.4, 0.6, 0.8, 1],  # new 0.1 => delete prompt
+        # temperature = [0.0, 0.2, 0.4, 0.6, 0.8, 1],
 
-    nlp_name = " [" + modelname_nlp + "]"
+        prompt_reset_on_temperature = 0.3,
 
-    text = str(result["text"]).strip() + "\n" + text_combined + "\n\n" + text
-    export_text(Path(path_text, whisper_parameter + nlp_name), filename_two + ".txt", text, timestamp = timestamp)
+        # best_of = 5
+        # patience: 1 [0.5 .. 2]
+        # length_penalty = 1 [???] -> to select which to return among the beams or best-of-N samples
 
-    curr_subfolder = ""
-    if len(subfolder) > 0:
-        curr_subfolder = subfolder + "/"
+        # https://github.com/SYSTRAN/faster-whisper/issues/478
+        # repetition_penalty   = default: 1.0 -> 1.1 / 1.2 / ...   (not in OpenAi impl.)
+        # no_repeat_ngram_size = default: 0 -> 1 / 2 / 3 (not in OpenAi impl.)
 
-    export_text(Path(path_srt, whisper_parameter + nlp_name, curr_subfolder), media_name + ".srt", export_srt(cc), newline = "\r\n", timestamp = timestamp)
-    export_text(Path(path_vtt, whisper_parameter + nlp_name, curr_subfolder), media_name + ".vtt", export_vtt(cc), newline = "\r\n", timestamp = timestamp)
+        # compression_ratio_threshold = 2.4
 
-    sentence_data = split_to_sentences(words, dictionary_data)
-    export_text_to_speech_excel(sentence_data, Path(path_excel, whisper_parameter + nlp_name, curr_subfolder), media_name + ".xlsx") # SubtitleColumnFormat
+        no_speech_threshold = None,  # default 0.6 verursacht, dass 30 sec Abschnitte komplett leer sind
+        max_initial_timestamp = 0,   # default 1.0
 
-    return {
-        "text":            text_combined,
-        "chars":           len(text_combined.replace(" ", "")),
-        "words":           len(text_combined.split(" ")),
-        "sentences":       sentences,
-        "duration":        media_info["duration"],
-        "spelling":        spelling_result,
-        "corrected":       corrected_details,
-        "lastSegment":     last_segment_text,
-        "repetitionError": repetition_error,
-        "pauseError":      pause_error,
-    }
+        vad_filter = vad_enabled,
+        vad_parameters = vad_parameter,
+    )
+
+def _get_features_key(media_md5: str, vad_parameter: None | Dict[str, Any], feature_extractor: FeatureExtractor) -> str:
+    n_mels = feature_extractor.mel_filters.shape[0]
+    return f"{media_md5}-mel{n_mels}-{feature_extractor.n_fft}-{feature_extractor.hop_length}-{_get_vad_key(vad_parameter)}"
+
+def _get_vad_key(vad_parameter: None | Dict[str, Any]) -> str:
+    if vad_parameter is None:
+        return "novad"
+
+    return hashlib.md5(json.dumps(_get_vad_options(vad_parameter), sort_keys=True).encode("utf-8")).hexdigest()[:8]  # noqa: S324
+
+def _get_vad_options(vad_parameter: Dict[str, Any]) -> Dict[str, Any]: # all fields -> changed defaults of VadOptions = new key
+    from faster_whisper.vad import VadOptions  # noqa: PLC0415
+
+    options = dataclasses.asdict(VadOptions(**vad_parameter))
+
+    engine = get_vad_engine()
+    if engine["stretch_samples"] > 0: # stretches -> other speech chunks
+        options["stretch"] = engine["stretch_samples"]
+        options["warmup"]  = engine["warmup_samples"]
+
+    return options
+
+def _transcribe_split(model: WhisperModel, audio: np.ndarray | PcmAudio, speech_chunks: List[Dict[str, int]], options: Dict[str, Any], split: Dict[str, Any]) -> Tuple[List[Segment], TranscriptionInfo, int, List[Dict[str, int]]]:
+    sampling_rate = model.feature_extractor.sampling_rate
+    hop_length    = model.feature_extractor.hop_length
+
+    parts = split_speech_chunks(speech_chunks, int(split["chunk_s"] * sampling_rate))
+
+    # seek: frames of the VAD filtered audio before the part (same as one transcription of the complete file)
+
+    offsets: List[int] = []
+    samples = 0
+    for part in parts:
+        offsets.append(samples // hop_length)
+        samples += sum(chunk["end"] - chunk["start"] for chunk in part)
+
+    def transcribe_part(part: List[Dict[str, int]]) -> Tuple[List[Segment], TranscriptionInfo, Dict[str, float]]:
+        clear_stage_times() # thread local -> stage times of this part
+        segments, info, _sampling_rate, _speech_chunks = model.transcribe(
+            audio,
+            speech_chunks     = part,
+            block_features    = get_block_features(),
+            encoder_lookahead = get_encoder_lookahead(),
+            **options, # adaptive_beam of the settings (_transcribe_media)
+        )
+        return list(segments), info, get_stage_times()
+
+    Trace.info(f"split: {len(parts)} parts (max. {split['chunk_s']:.0f} sec) with {split['workers']} worker(s)")
+
+    with ThreadPoolExecutor(max_workers=split["workers"]) as executor:
+        results = list(executor.map(transcribe_part, parts))
+
+    segments: List[Segment] = []
+    for (part_segments, _info, stages), offset in zip(results, offsets, strict=True):
+        add_stage_times(stages)
+        for segment in part_segments:
+            segments.append(dataclasses.replace(segment, id=len(segments) + 1, seek=segment.seek + offset))
+
+    adaptive_beam = None
+    if results[0][1].adaptive_beam is not None: # segments of all parts generated -> final counts
+        adaptive_beam = {key: sum(part_info.adaptive_beam[key] for _segments, part_info, _stages in results) for key in results[0][1].adaptive_beam}
+
+    info = dataclasses.replace(results[0][1], duration_after_vad=samples / sampling_rate, adaptive_beam=adaptive_beam)
+
+    return segments, info, sampling_rate, speech_chunks
+
+def _transcribe_batched(model: WhisperModel, audio: np.ndarray | PcmAudio, speech_chunks: List[Dict[str, int]], options: Dict[str, Any], batch_size: int) -> Tuple[Iterable[Segment], TranscriptionInfo, int, List[Dict[str, int]]]:
+    from faster_whisper import BatchedInferencePipeline  # noqa: PLC0415 # CTranslate2 only if needed
+
+    Trace.info(f"batched: {len(speech_chunks)} speech chunks, batch size {batch_size}")
+
+    pipeline = BatchedInferencePipeline(model)
+    return pipeline.transcribe(audio, speech_chunks=speech_chunks, batch_size=batch_size, **options)
+
+def _get_path_vad(project_params: Dict[str, Any]) -> None | Path:
+    if "pathSettings" not in project_params:
+        return None
+
+    return Path(project_params["pathSettings"], "vad")
+
+def _close_source(source: Path | BinaryIO) -> None:
+    if not isinstance(source, Path):
+        source.close()
@@ -0,0 +1,104 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 20:45
+
+    src/primary/whisper_faster_pack.py
+
+    PUBLIC:
+     - transcribe_packed(model: WhisperModel, files: List[Dict], batch_size: int) -> List[Tuple[List[Segment], TranscriptionInfo, int, None | List[Dict], Dict[str, float]]]
+
+    short files (e.g. intros < 30 sec): one transcribe call per file -> one under-filled window per encoder/decoder call;
+    packed: the windows of all files in one list -> 'batch_size' windows per encode + generate (BatchedInferencePipeline)
+
+     - files: [{"audio": np.ndarray | PcmAudio, "speechChunks": [...], "options": <kwargs of transcribe>}]
+       speech chunks with max_speech_duration_s <= 30 (VAD) -> merge_segments -> windows of max. 30 sec
+     - per window the prompt of its file (initial_prompt, e.g. from the project Excel); CTranslate2: the prompts of one
+       batch may differ in length before <|startoftranscript|>
+     - only files with the same tokenizer (language, task) and options (apart from the prompt) share a batch
+     - results in the order of the files: same tuple as WhisperModel.transcribe (segments as list) + stage times,
+       timestamps of every window relative to its own file (chunks_metadata), ids per file from 1
+     - word timestamps: last_speech_timestamp per file (forward with the file of every row)
+     - stage times of a batch (encoder, decoder, alignment) shared by the files in proportion to their windows
+
+    faster_whisper (-> CTranslate2) is imported only if a model is loaded
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import numpy as np
+
+from utils.timing import clear_stage_times, get_stage_times, stage
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from faster_whisper.transcribe import Segment, TranscriptionInfo
+
+def transcribe_packed(model: WhisperModel, files: List[Dict[str, Any]], batch_size: int) -> List[Tuple[List[Segment], TranscriptionInfo, int, None | List[Dict[str, int]], Dict[str, float]]]:
+    from faster_whisper import BatchedInferencePipeline  # noqa: PLC0415 # CTranslate2 only if needed
+
+    pipeline = BatchedInferencePipeline(model)
+
+    prepared: List[Dict[str, Any]] = []
+    groups:   List[Tuple[Tuple[Any, ...], List[Tuple[int, int]]]] = [] # (key, [(file, window)])
+
+    for index, file in enumerate(files):
+        clear_stage_times()
+        with stage("features"): # VAD merge + log-mel of all windows, segments generator not started
+            _segments, info, sampling_rate, speech_chunks = pipeline.transcribe(file["audio"], speech_chunks=file["speechChunks"], batch_size=batch_size, **file["options"])
+
+        features, tokenizer, chunks_metadata, options = pipeline.prepared
+        prepared.append({
+            "features":      features,
+            "metadata":      chunks_metadata,
+            "tokenizer":     tokenizer,
+            "options":       options,
+            "prompt":        pipeline.get_prompt(tokenizer, options),
+            "info":          info,
+            "samplingRate":  sampling_rate,
+            "speechChunks":  speech_chunks,
+            "outputs":       [],
+            "stages":        get_stage_times(),
+        })
+
+        key = (tokenizer.language_code, tokenizer.task, replace(options, initial_prompt=None, hotwords=None)) # prompt per row
+        windows = next((group for group_key, group in groups if group_key == key), None)
+        if windows is None:
+            windows = []
+            groups.append((key, windows))
+        windows.extend((index, window) for window in range(len(features)))
+
+    pipeline.last_speech_timestamps = {}
+
+    for _key, windows in groups:
+        for start in range(0, len(windows), batch_size):
+            batch = windows[start : start + batch_size]
+            first = prepared[batch[0][0]]
+
+            clear_stage_times()
+            outputs = pipeline.forward(
+                np.stack([prepared[index]["features"][window] for index, window in batch]),
+                first["tokenizer"], # same language, task and options for all files of the group
+                [prepared[index]["metadata"][window] for index, window in batch],
+                first["options"],
+                [prepared[index]["prompt"] for index, _window in batch],
+                [index for index, _window in batch],
+            )
+
+            stages = get_stage_times()
+            for (index, _window), output in zip(batch, outputs, strict=True):
+                prepared[index]["outputs"].append(output)
+                for name, seconds in stages.items():
+                    prepared[index]["stages"][name] = prepared[index]["stages"].get(name, 0.0) + seconds / len(batch)
+
+    clear_stage_times()
+
+    results: List[Tuple[List[Segment], TranscriptionInfo, int, None | List[Dict[str, int]], Dict[str, float]]] = []
+    for data in prepared:
+        segments: List[Segment] = []
+        for output in data["outputs"]:
+            segments.extend(pipeline.get_segments(output, data["tokenizer"], data["options"], len(segments)))
+
+        results.append((segments, data["info"], data["samplingRate"], data["speechChunks"], data["stages"]))
+
+    return results
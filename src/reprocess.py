@@ -0,0 +1,104 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 13:40
+
+    src/reprocess.py
+
+    .venv/Scripts/activate
+    python src/reprocess.py
+
+    post-processing only (e.g. after changes in Dictionary-DATEV.xlsx, format_sentence.yaml or hunspell):
+     - 05_json transcripts (faster-whisper) -> prepare_words -> split_to_lines -> split_to_sentences -> txt, srt, vtt, xlsx
+     - no import of faster_whisper / CTranslate2, no model
+     - N worker processes (whisper.yaml -> faster_whisper.parallel.reprocess), spaCy and hunspell once per worker
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from helper.excel_read import import_dictionary_excel
+from helper.postprocess import reprocess_transcript
+from helper.runner import load_projects, run_model, trace_file_default
+from helper.scheduler import TranscribePool
+from helper.spelling import hunspell_dictionary_init
+from helper.whisper_util import init_special_text
+from utils.globals import BASE_PATH
+from utils.prefs import Prefs
+from utils.trace import Trace
+
+PROJECTS: str = "projects.yaml"  # "projects.yaml", "projects_all.yaml"
+
+models = [ ("06", "large-v2") ]  # same as main.py
+
+beams = [5]
+
+reset_cache_spacy: bool = False
+
+def main() -> None:
+    Prefs.init("settings")
+    Prefs.load("base.yaml")
+    Prefs.load("whisper.yaml")
+    Prefs.load("hallucination.yaml")
+    Prefs.load("spacy.yaml")
+    Prefs.load("hunspell.yaml")
+    Prefs.load("format_sentence.yaml")
+    Prefs.load(PROJECTS)
+
+    whisper_type = "faster-whisper"
+
+    language   = Prefs.get("language")
+    media_type = Prefs.get("mediaType")
+    dictionary = Prefs.get("dictionary")
+    spelling   = Prefs.get("hunspell")
+
+    Trace.action(f"reprocess '{whisper_type}' ==> '{PROJECTS}' ({language})")
+
+    init_special_text( language )
+
+    no_prompt  = not Prefs.get("whisper.use_initial_prompt")
+
+    if Prefs.get("projects") is None:
+        Trace.fatal("no project defined")
+
+    start = time.perf_counter()
+
+    projects = load_projects(media_type)
+
+    data_dictionary, names_dictionary_sheet, dictionary_timestamp = import_dictionary_excel( BASE_PATH / dictionary["path"], dictionary["file"])
+
+    hunspell_path = BASE_PATH / spelling["path"] / language
+    hunspell_dictionary_init( hunspell_path, spelling["file"][language], language)
+
+    path_trace_main = BASE_PATH / Prefs.get("trace_all")["path"]
+    Trace.info()
+
+    workers = int(Prefs.get("whisper.faster_whisper.parallel.reprocess", 0))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    pool: TranscribePool | None = None
+    if workers > 1:
+        pool = TranscribePool(reprocess_transcript, workers, 1, language, data_dictionary, hunspell_path, spelling["file"][language], trace_file_default)
+
+    try:
+        for model in models:
+            run_model(
+                model, beams, projects, reprocess_transcript, whisper_type, language, media_type, no_prompt,
+                data_dictionary, names_dictionary_sheet, dictionary_timestamp, path_trace_main, start, reset_cache_spacy,
+                None, pool,
+            )
+    finally:
+        if pool:
+            pool.shutdown()
+
+
+if __name__ == "__main__":
+    Trace.set( debug_mode=True, timezone=False )
+    Trace.action(f"Python version {sys.version}")
+
+    try:
+        main()
+    except KeyboardInterrupt:
+        Trace.exception("KeyboardInterrupt")
+        sys.exit(0)
@@ -1,9 +1,14 @@
 """
-    © Jürgen Schoenemeyer, 01.03.2025 15:26
+    © Jürgen Schoenemeyer, 18.10.2026 18:20
 
     src/utils/audio.py
 
     PUBLIC:
+     - AUDIO_SUFFIX: Dict[str, str]
+     - get_ffmpeg_command(ffmpeg: str, source: Path, dest: Path, mode: str, sampling: int = 16000, channels: int = 1, filter_path: None | str = None, filter_name: None | str = None) -> List[str]
+     - get_part_filepath(dest: Path) -> Path
+     - run_ffmpeg(command: List[str]) -> bool
+
      - split_audio(source_path: Path | str, dest_path: Path | str, filename: str, ffmpeg: str) -> None
 
      - convert_to_mp3(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None
@@ -11,12 +16,21 @@
      - convert_to_flac(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None
 
      - filter_to_wav(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str, filter_path: str, filter_name: str) -> None
+
+    PRIVATE:
+     - _convert(source_path: Path | str, dest_path: Path | str, filename: str, ffmpeg: str, mode: str, **kwargs: Any) -> None
+
+    mode: "split" (copy -> .m4a), "mp3", "wav", "flac", "filter" (arnndn -> .wav)
+
+    ffmpeg as argv list (no shell -> no quoting problems with blanks/quotes in filenames)
+    ffmpeg writes to '<stem>.part<suffix>' -> rename (no half-converted destination after an abort)
 """
 from __future__ import annotations
 
 import subprocess
 
 from pathlib import Path
+from typing import Any, Dict, List
 
 from utils.trace import Trace
 
@@ -44,47 +58,48 @@
         result e.g.: 0 -> 115 MB, 5 -> 104 MB, 8 -> 103 MB, 12 ->  103 MB
 """
 
-def split_audio(source_path: Path | str, dest_path: Path | str, filename: str, ffmpeg: str) -> None:
-    source_path = Path(source_path)
-    dest_path = Path(dest_path)
+AUDIO_SUFFIX: Dict[str, str] = {
+    "split":  ".m4a",
+    "mp3":    ".mp3",
+    "wav":    ".wav",
+    "flac":   ".flac",
+    "filter": ".wav",
+}
 
-    if not dest_path.is_dir():
-        dest_path.mkdir(parents=True)
-
-    source = source_path / filename
-    dest   = dest_path / (Path(filename).stem + ".m4a")
+def get_ffmpeg_command(ffmpeg: str, source: Path, dest: Path, mode: str, sampling: int = 16000, channels: int = 1, filter_path: None | str = None, filter_name: None | str = None) -> List[str]:
+    command = [ffmpeg, "-y", "-loglevel", "error", "-i", str(source)]
 
-    if dest.is_file():
-        Trace.info(f"{dest} always exists")
+    if mode == "split":
+        command += ["-c", "copy"]
     else:
-        commands = f'"{ffmpeg}" -y -loglevel error -i "{source}" -c copy "{dest}"'
+        command += ["-vn", "-ar", str(sampling), "-ac", str(channels)]
 
-        if subprocess.run(commands, check=False).returncode == 0:
-            Trace.info(f"FFmpeg Script Ran Successfully {dest}")
-        else:
-            Trace.error(f"There was an error running your FFmpeg script - {commands}")
+    if mode == "mp3":
+        command += ["-b:a", "96k"]
+    elif mode == "flac":
+        command += ["-sample_fmt", "s16", "-c:a", "flac", "-compression_level", "5"]
+    elif mode == "filter":
+        command += ["-af", f"arnndn=m={filter_path}/{filter_name}.rnnn"]
 
-def convert_to_mp3(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None:
-    source_path = Path(source_path)
-    dest_path   = Path(dest_path)
+    return [*command, str(dest)]
 
-    if not dest_path.is_dir():
-        dest_path.mkdir(parents=True)
+def get_part_filepath(dest: Path) -> Path:
+    return dest.with_name(dest.stem + ".part" + dest.suffix)
 
-    source = source_path / filename
-    dest   = dest_path / (Path(filename).stem + ".wav")
+def run_ffmpeg(command: List[str]) -> bool:
+    try:
+        result = subprocess.run(command, check=False, capture_output=True, text=True)  # noqa: S603 # argv list, no shell
+    except OSError as e:
+        Trace.error(f"FFmpeg not startable '{command[0]}': {e}")
+        return False
 
-    if dest.is_file():
-        Trace.info(f"{dest} always exists")
-    else:
-        commands = f'"{ffmpeg}" -y -loglevel error -i "{source}" -vn -ar {sampling} -ac {channels} -b:a 96k "{dest}"'
+    if result.returncode != 0:
+        Trace.error(f"There was an error running your FFmpeg script - {' '.join(command)}: {result.stderr.strip()}")
+        return False
 
-        if subprocess.run(commands, check=False).returncode == 0:
-            Trace.info(f"FFmpeg Script Ran Successfully {dest}")
-        else:
-            Trace.error(f"There was an error running your FFmpeg script - {commands}")
+    return True
 
-def convert_to_wav(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None:
+def _convert(source_path: Path | str, dest_path: Path | str, filename: str, ffmpeg: str, mode: str, **kwargs: Any) -> None:
     source_path = Path(source_path)
     dest_path   = Path(dest_path)
 
@@ -92,55 +107,30 @@ def convert_to_wav(source_path: Path | str, dest_path: Path | str, filename: str
         dest_path.mkdir(parents=True)
 
     source = source_path / filename
-    dest   = dest_path / (Path(filename).stem + ".wav")
+    dest   = dest_path / (Path(filename).stem + AUDIO_SUFFIX[mode])
 
     if dest.is_file():
         Trace.info(f"{dest} always exists")
-    else:
-        commands = f'"{ffmpeg}" -y -loglevel error -i "{source}" -vn -ar {sampling} -ac {channels} "{dest}"'
-
-        if subprocess.run(commands, check=False).returncode == 0:
-            Trace.info(f"FFmpeg Script Ran Successfully {dest}")
-        else:
-            Trace.error(f"There was an error running your FFmpeg script - {commands}")
-
-def convert_to_flac(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None:
-    source_path = Path(source_path)
-    dest_path   = Path(dest_path)
+        return
 
-    if not dest_path.is_dir():
-        dest_path.mkdir(parents=True)
-
-    source = source_path / filename
-    dest   = dest_path / (Path(filename).stem + ".flac")
-
-    if dest.is_file():
-        Trace.info(f"{dest} always exists")
+    part = get_part_filepath(dest)
+    if run_ffmpeg(get_ffmpeg_command(ffmpeg, source, part, mode, **kwargs)):
+        part.replace(dest)
+        Trace.info(f"FFmpeg Script Ran Successfully {dest}")
     else:
-        commands = f'"{ffmpeg}" -y -loglevel error -i "{source}" -vn -ar {sampling} -ac {channels} -sample_fmt s16 -c:a flac -compression_level 5 "{dest}"'
+        part.unlink(missing_ok=True)
 
-        if subprocess.run(commands, check=False).returncode == 0:
-            Trace.info(f"FFmpeg Script Ran Successfully {dest}")
-        else:
-            Trace.error(f"There was an error running your FFmpeg script - {commands}")
-
-def filter_to_wav(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str, filter_path: str, filter_name: str) -> None:
-    source_path = Path(source_path)
-    dest_path   = Path(dest_path)
+def split_audio(source_path: Path | str, dest_path: Path | str, filename: str, ffmpeg: str) -> None:
+    _convert(source_path, dest_path, filename, ffmpeg, "split")
 
-    if not dest_path.is_dir():
-        dest_path.mkdir(parents=True)
+def convert_to_mp3(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None:
+    _convert(source_path, dest_path, filename, ffmpeg, "mp3", sampling=sampling, channels=channels)
 
-    source = source_path / filename
-    dest   = dest_path / (Path(filename).stem + ".wav")
+def convert_to_wav(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None:
+    _convert(source_path, dest_path, filename, ffmpeg, "wav", sampling=sampling, channels=channels)
 
-    if dest.is_file():
-        Trace.info(f"{dest} always exists")
-    else:
-        filter_cmd = f"arnndn=m={filter_path}/{filter_name}.rnnn"
-        commands = f'"{ffmpeg}" -y -loglevel error -i "{source}" -vn -ar {sampling} -ac {channels} -af "{filter_cmd}" "{dest}"'
+def convert_to_flac(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str) -> None:
+    _convert(source_path, dest_path, filename, ffmpeg, "flac", sampling=sampling, channels=channels)
 
-        if subprocess.run(commands, check=False).returncode == 0:
-            Trace.info(f"FFmpeg Script Ran Successfully {dest}")
-        else:
-            Trace.error(f"There was an error running your FFmpeg script - {commands}")
+def filter_to_wav(source_path: Path | str, dest_path: Path | str, filename: str, sampling: int, channels: int, ffmpeg: str, filter_path: str, filter_name: str) -> None:
+    _convert(source_path, dest_path, filename, ffmpeg, "filter", sampling=sampling, channels=channels, filter_path=filter_path, filter_name=filter_name)
@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 03.04.2025 20:50
+    © Jürgen Schoenemeyer, 18.10.2026 17:40
 
     src/utils/file.py
 
@@ -44,7 +44,9 @@
      - find_matching_file(filepath: Path | str) -> bool | str
      - find_matching_file_path(folderpath: Path | str, filename: Path | str) -> Path | bool
      - get_valid_filename(name: str) -> str
-     - get_file_infos(path: Path | str, filename: str, _in_type: str) -> None | Dict
+     - get_file_infos(path: Path | str, filename: str, _in_type: str, md5: None | str = None) -> None | Dict
+     - get_file_md5(filepath: Path | str, chunk_size: int = 1 << 20) -> None | str
+     - get_stream_md5(stream: BinaryIO, chunk_size: int = 1 << 20) -> str
     #
      - copy_my_file(source: str, dest: str, _show_updated: bool) -> bool
 
@@ -63,7 +65,7 @@
 
 from pathlib import Path
 from re import Match
-from typing import Any, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, List, Tuple
 
 from utils.trace import Trace
 
@@ -213,6 +215,9 @@ def create_folder(folderpath: Path | str) -> bool:
             folderpath.mkdir(parents=True)
             Trace.update(f"makedir: {folderpath}")
 
+        except FileExistsError:
+            return False # created in the meantime by another process
+
         except OSError as e:
             msg = str(e).split(":")[0]
             Trace.error(f"{msg}: {folderpath}")
@@ -536,14 +541,15 @@ def get_valid_filename(name: str) -> str:
     #    raise SuspiciousFileOperation("Could not derive file name from '%s'" % name)
     return s
 
-def get_file_infos(folderpath: Path | str, filename: Path | str, _in_type: str) -> None | Dict[str, Any]:
+def get_file_infos(folderpath: Path | str, filename: Path | str, _in_type: str, md5: None | str = None) -> None | Dict[str, Any]:
     filepath   = Path(folderpath) / filename
     # folderpath = filepath.parent
     # filename   = filepath.name
 
     if filepath.is_file():
-        with filepath.open(mode="rb") as f:
-            md5 = hashlib.md5(f.read()).hexdigest()  # noqa: S324
+        if md5 is None: # md5 already known (e.g. ingest_media) -> no second read
+            with filepath.open(mode="rb") as f:
+                md5 = get_stream_md5(f)
 
         size           = filepath.stat().st_size
         timestamp      = get_modification_timestamp(filepath)
@@ -565,6 +571,23 @@ def get_file_infos(folderpath: Path | str, filename: Path | str, _in_type: str)
         Trace.error(f"not found: {filepath}")
         return None
 
+def get_file_md5(filepath: Path | str, chunk_size: int = 1 << 20) -> None | str:
+    filepath = Path(filepath)
+
+    if not filepath.is_file():
+        Trace.error(f"not found: {filepath}")
+        return None
+
+    with filepath.open(mode="rb") as f:
+        return get_stream_md5(f, chunk_size)
+
+def get_stream_md5(stream: BinaryIO, chunk_size: int = 1 << 20) -> str: # in chunks -> no copy of the file in memory
+    md5 = hashlib.md5()  # noqa: S324
+    while chunk := stream.read(chunk_size):
+        md5.update(chunk)
+
+    return md5.hexdigest()
+
 def copy_my_file(source: Path | str, dest: Path | str, _show_updated: bool) -> bool:
 
     source = Path(source)
@@ -1,12 +1,12 @@
 """
-    © Jürgen Schoenemeyer, 29.03.2025 18:57
+    © Jürgen Schoenemeyer, 18.10.2026 17:40
 
     src/utils/metadata.py
 
     PUBLIC:
-     - get_media_info(filepath: str | BytesIO) -> None | Dict[str, int | float]
+     - get_media_info(filepath: str | BinaryIO) -> None | Dict[str, int | float]
      - get_audio_duration(filepath: str | BytesIO) -> float
-     - get_media_trackinfo(filepath: str | BytesIO) -> None | Dict[str, Any]
+     - get_media_trackinfo(filepath: str | BinaryIO) -> None | Dict[str, Any]
      - get_video_metadata(filepath: str | BytesIO) -> None | Dict[str, Any]
      - get_audio_metadata(filepath: str | BytesIO) -> None | Dict[str, Any]
 """
@@ -20,6 +20,7 @@
 
 if TYPE_CHECKING:
     from io import BytesIO
+    from typing import BinaryIO
 
 
 class AudioTrack(Protocol):
@@ -97,7 +98,7 @@ class VideoTrack(Protocol):
     unique_id: str                         # "8640863827297483320"
     width: int                             # 1920
 
-def get_media_info(filepath: str | BytesIO) -> Dict[str, int | float] | None:
+def get_media_info(filepath: str | BinaryIO) -> Dict[str, int | float] | None: # file handle -> MediaInfo reads only the headers (seek)
 
     try:
         track = get_media_trackinfo(filepath)
@@ -121,7 +122,7 @@ def get_media_info(filepath: str | BytesIO) -> Dict[str, int | float] | None:
     }
 
 
-def get_media_trackinfo(filepath: str | BytesIO) -> Track | None:
+def get_media_trackinfo(filepath: str | BinaryIO) -> Track | None:
     ret = None
 
     try:
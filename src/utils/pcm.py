@@ -0,0 +1,86 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 18:30
+
+    src/utils/pcm.py
+
+    PUBLIC:
+     - class PcmAudio:
+        - PcmAudio(data: np.ndarray)
+        - shape, ndim, dtype, len(audio), audio[start:end] -> float32
+     - load_pcm(path: Path, key: str) -> None | PcmAudio
+     - save_pcm(path: Path, key: str, data: np.ndarray) -> PcmAudio
+
+    <path>/<key>.npy: 16 kHz mono int16 (e.g. key: md5 of the media file)
+
+    np.load(mmap_mode="r") -> only the pages of the used windows are read (page cache, shared between processes),
+    float32 only per slice: int16 / 32768.0 (same values as faster_whisper.decode_audio)
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+from typing import TYPE_CHECKING, Any, Tuple
+
+import numpy as np
+
+from utils.file import create_folder
+from utils.trace import Trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+class PcmAudio:
+    def __init__(self, data: np.ndarray) -> None:
+        super().__init__()
+
+        self.data = data # int16, e.g. np.memmap
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.data.shape
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        return np.dtype(np.float32)
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, key: slice) -> np.ndarray:
+        return self.data[key].astype(np.float32) / 32768.0
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray: # complete audio as float32 (e.g. np.pad)
+        audio = self[:]
+        return audio if dtype is None else audio.astype(dtype)
+
+def load_pcm(path: Path, key: str) -> None | PcmAudio:
+    filepath = path / (key + ".npy")
+    if not filepath.is_file():
+        return None
+
+    try:
+        data = np.load(filepath, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError) as err:
+        Trace.warning(f"{filepath}: {err}")
+        return None
+
+    if data.dtype != np.int16 or data.ndim != 1:
+        Trace.warning(f"{filepath}: no 16 bit mono pcm")
+        return None
+
+    return PcmAudio(data)
+
+def save_pcm(path: Path, key: str, data: np.ndarray) -> PcmAudio:
+    create_folder(path)
+
+    filepath = path / (key + ".npy")
+    filepath_tmp = path / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.npy" # atomic -> other worker processes
+    np.save(filepath_tmp, data.astype(np.int16, copy=False), allow_pickle=False)
+    filepath_tmp.replace(filepath)
+
+    return PcmAudio(np.load(filepath, mmap_mode="r", allow_pickle=False))
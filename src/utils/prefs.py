@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 03.04.2025 20:50
+    © Jürgen Schoenemeyer, 18.10.2026 10:12
 
     src/utils/prefs.py
 
@@ -8,6 +8,9 @@
       - Prefs.init(pref_path = None, pref_prefix = None) -> None
       - Prefs.load(pref_name: str) -> bool
       - Prefs.get(key_path: str) -> Any
+      - Prefs.set(key_path: str, value: Any) -> None
+      - Prefs.get_all() -> Dict
+      - Prefs.set_all(data: Dict) -> None
 
     PRIVATE:
      - merge_dicts(a: Dict, b: Dict) -> Dict
@@ -72,6 +75,22 @@ def load(cls, pref_name: str) -> bool:
     def get_all(cls) -> Dict[Any, Any]:
         return cls.data
 
+    @classmethod
+    def set_all(cls, data: Dict[Any, Any]) -> None: # e.g. worker process -> same prefs as the main process
+        cls.data = data
+
+    @classmethod
+    def set(cls, key_path: str, value: Any) -> None: # key_path = "one.two.three"
+        keys: list[str] = key_path.split(".")
+
+        data = cls.data
+        for key in keys[:-1]:
+            if key not in data or not isinstance(data[key], dict):
+                data[key] = {}
+            data = data[key]
+
+        data[keys[-1]] = value
+
     @classmethod
     def get(cls, key_path: str, default:Any = None) -> Any:
 
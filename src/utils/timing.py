@@ -0,0 +1,77 @@
+"""
+    © Jürgen Schoenemeyer, 18.10.2026 16:40
+
+    src/utils/timing.py
+
+    PUBLIC:
+     - stage(name: str) -> ContextManager
+     - get_stage_times() -> Dict[str, float]
+     - clear_stage_times() -> None
+     - add_stage_times(times: Dict[str, float]) -> None
+     - percentile(values: List[float], percent: float) -> float
+
+    with stage("spacy"):
+        ...
+
+    exclusive times: a nested stage pauses the outer stage (sum of all stages == wall time)
+    per thread (e.g. prefetch thread, worker process) -> get_stage_times + add_stage_times to collect them
+"""
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+
+from typing import Dict, Generator, List
+
+_local = threading.local()
+
+def _get_local() -> threading.local:
+    if not hasattr(_local, "times"):
+        _local.times = {}
+        _local.stack = []
+    return _local
+
+@contextlib.contextmanager
+def stage(name: str) -> Generator[None, None, None]:
+    local = _get_local()
+    times: Dict[str, float] = local.times
+    stack: List[List[str | float]] = local.stack
+
+    now = time.perf_counter()
+    if stack:
+        parent_name, parent_start = stack[-1]
+        times[str(parent_name)] = times.get(str(parent_name), 0.0) + now - float(parent_start)
+
+    stack.append([name, now])
+    try:
+        yield
+    finally:
+        now = time.perf_counter()
+        _name, start = stack.pop()
+        times[name] = times.get(name, 0.0) + now - float(start)
+
+        if stack:
+            stack[-1][1] = now
+
+def get_stage_times() -> Dict[str, float]:
+    return dict(_get_local().times)
+
+def clear_stage_times() -> None:
+    _get_local().times.clear()
+
+def add_stage_times(times: Dict[str, float]) -> None:
+    local_times = _get_local().times
+    for name, seconds in times.items():
+        local_times[name] = local_times.get(name, 0.0) + seconds
+
+def percentile(values: List[float], percent: float) -> float: # linear interpolation (numpy default)
+    if len(values) == 0:
+        return 0.0
+
+    data = sorted(values)
+    pos = (len(data) - 1) * percent / 100
+    low = int(pos)
+    high = min(low + 1, len(data) - 1)
+
+    return data[low] + (data[high] - data[low]) * (pos - low)
@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 07.04.2025 20:30
+    © Jürgen Schoenemeyer, 18.10.2026 20:20
 
     src/utils/trace.py
 
@@ -28,9 +28,15 @@
 
       - Trace.file_init(["action", "result", "warning", "error"], csv=False)
       - Trace.file_save("./logs", "testTrace")
+      - Trace.file_get() -> List[str]
+      - Trace.file_append(messages: List[str])
 
       - Trace.redirect(function) # -> e.g. qDebug (PySide6)
 
+      - Trace.buffer_start()     # messages of the current thread kept (e.g. background thread)
+      - Trace.buffer_get() -> List
+      - Trace.buffer_replay(buffer: List) # -> e.g. in the main thread
+
     static class Color:
       - Color.<color_name>
       - Color.clear(text: str) -> str:
@@ -42,11 +48,12 @@
 import platform
 import re
 import sys
+import threading
 
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 if TYPE_CHECKING:
@@ -150,6 +157,7 @@ class Trace:
     messages: ClassVar[List[str]] = []
     csv: bool = False
     output: Callable[..., None] | None = None
+    local: threading.local = threading.local()
 
     @classmethod
     def set(cls, **kwargs: Any) -> None: # color, reduced_mode, debug_mode, show_timestamp, timezone, show_caller
@@ -325,12 +333,39 @@ def file_save(cls, path: Path | str, filename: str) -> None:
 
         cls.messages = []
 
+    # file_get, file_append -> e.g. messages of a worker process
+
+    @classmethod
+    def file_get(cls) -> List[str]:
+        return list(cls.messages)
+
+    @classmethod
+    def file_append(cls, messages: List[str]) -> None:
+        cls.messages.extend(messages)
+
     # redirect()
 
     @classmethod
     def redirect(cls, output: Callable[..., None]) -> None:
         cls.output = output
 
+    # buffer_start, buffer_get, buffer_replay -> messages of a background thread in the trace of the main thread
+
+    @classmethod
+    def buffer_start(cls) -> None:
+        cls.local.buffer = []
+
+    @classmethod
+    def buffer_get(cls) -> List[Tuple[bool, str, str, Tuple[Any, ...]]]:
+        buffer: List[Tuple[bool, str, str, Tuple[Any, ...]]] = getattr(cls.local, "buffer", None) or []
+        cls.local.buffer = []
+        return buffer
+
+    @classmethod
+    def buffer_replay(cls, buffer: List[Tuple[bool, str, str, Tuple[Any, ...]]]) -> None:
+        for file_output, pre, message, optional in buffer:
+            cls._show_message(file_output, pre, message, *optional)
+
     # INTERNAL
 
     @classmethod
@@ -436,6 +471,11 @@ def _get_decorator_caller(cls, text: str) -> str:
 
     @classmethod
     def _show_message(cls, file_output: bool, pre: str, message: str, *optional: Any) -> None:
+        buffer = getattr(cls.local, "buffer", None)
+        if buffer is not None:
+            buffer.append((file_output, pre, message, optional))
+            return
+
         extra = ""
         for opt in optional:
             extra += " > " + str(opt)
@@ -1,5 +1,5 @@
 """
-    © Jürgen Schoenemeyer, 03.04.2025 20:50
+    © Jürgen Schoenemeyer, 18.10.2026 20:20
 
     src/utils/util.py
 
@@ -8,11 +8,17 @@
      - format_timestamp(seconds: float, always_include_hours: bool=False, decimal_marker: str=".", fps: float = 30) -> str
 
     class CacheJSON:
-     - CacheJSON.init(path: Path | str, name: str, model: str, reset: bool)
+     - CacheJSON.init(path: Path | str, name: str, model: str, reset: bool, read_only: bool = False)
      - CacheJSON.get(self, value_hash: str) -> Dict | None
      - CacheJSON.add(self, value_hash: str, value: Dict) -> None
+     - CacheJSON.added(self) -> Dict
      - CacheJSON.flush(self) -> None:
 
+    class CacheArray: (LRU in memory, optional .npy on disk, thread safe)
+     - CacheArray.init(max_bytes: int, path: Path | str | None = None)
+     - CacheArray.get(self, key: str) -> np.ndarray | None
+     - CacheArray.add(self, key: str, value: np.ndarray) -> None
+
     class ProcessLog (array cache)
      - ProcessLog.init()
      - ProcessLog.add(info: str)
@@ -20,9 +26,15 @@ class ProcessLog (array cache)
 """
 from __future__ import annotations
 
+import os
+import threading
+
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
+
 from utils.file import create_folder, export_json, import_json
 from utils.trace import Color, Trace
 
@@ -76,20 +88,26 @@ class CacheJSON:
     path: Path = Path()
     name: str = ""
 
-    def __init__(self, path: Path | str, name: str, model: str, reset: bool) -> None:
+    # read_only: e.g. in a worker process -> no folder is created, no flush (the main process owns the file)
+    # flush: tmp file + replace -> a reader never sees a partial file
+
+    def __init__(self, path: Path | str, name: str, model: str, reset: bool, read_only: bool = False) -> None:
         super().__init__()
 
         self.cache = {}
+        self.new: Dict[str, Any] = {}
         self.path = Path(path)
         self.name = name + "-" + model + ".json"
+        self.read_only = read_only
 
         if Path(self.path, self.name).is_file():
             if not reset:
                 json = import_json(self.path, self.name)
                 if json:
                     self.cache = json
-                    Trace.info(f"{self.path}")
-        else:
+                    if not read_only:
+                        Trace.info(f"{self.path}")
+        elif not read_only:
             create_folder(self.path)
 
     def get(self, value_hash: str) -> Dict[Any, Any] | None:
@@ -101,9 +119,77 @@ def get(self, value_hash: str) -> Dict[Any, Any] | None:
 
     def add(self, value_hash: str, value: Dict[Any, Any]) -> None:
         self.cache[value_hash] = value
+        self.new[value_hash] = value
+
+    def added(self) -> Dict[str, Any]:
+        return self.new
 
     def flush(self) -> None:
-        export_json(self.path, self.name, self.cache)
+        if self.read_only:
+            return
+
+        filename_tmp = f"{self.name}.{os.getpid()}.tmp"
+        if export_json(self.path, filename_tmp, self.cache, show_message=False) is not None: # False: same tmp file from an aborted run
+            Path(self.path, filename_tmp).replace(Path(self.path, self.name))
+
+class CacheArray:
+    def __init__(self, max_bytes: int, path: Path | str | None = None) -> None:
+        super().__init__()
+
+        self.cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.lock = threading.Lock()
+
+        self.path: Path | None = None
+        if path is not None:
+            self.path = Path(path)
+            create_folder(self.path)
+
+    def get(self, key: str) -> np.ndarray | None:
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        if self.path is not None:
+            filepath = Path(self.path, key + ".npy")
+            if filepath.is_file():
+                try:
+                    value: np.ndarray = np.load(filepath, allow_pickle=False)
+                except (OSError, ValueError) as err:
+                    Trace.warning(f"{filepath}: {err}")
+                    return None
+
+                self._add_memory(key, value)
+                return value
+
+        return None
+
+    def add(self, key: str, value: np.ndarray) -> None:
+        self._add_memory(key, value)
+
+        if self.path is not None:
+            filepath = Path(self.path, key + ".npy")
+            if not filepath.is_file():
+                filepath_tmp = Path(self.path, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.npy")  # atomic -> other worker processes
+                np.save(filepath_tmp, value, allow_pickle=False)
+                filepath_tmp.replace(filepath)
+
+    def _add_memory(self, key: str, value: np.ndarray) -> None:
+        if value.nbytes > self.max_bytes:
+            return
+
+        with self.lock:
+            if key in self.cache:
+                self.bytes -= self.cache.pop(key).nbytes
+
+            self.cache[key] = value
+            self.bytes += value.nbytes
+
+            while self.bytes > self.max_bytes:
+                _, oldest = self.cache.popitem(last=False)
+                self.bytes -= oldest.nbytes
 
 class ProcessLog:
     def __init__(self) -> None: